@@ -23,8 +23,10 @@ INSTALLED_APPS = [
     "django.contrib.messages",
     "django.contrib.staticfiles",
     # Apps
+    "common",
     "bike",
     "users",
+    "rent",
 ]
 
 MIDDLEWARE = [
@@ -67,6 +69,9 @@ DATABASES = {
     }
 }
 
+# locmem по умолчанию, в проде — например CACHE_URL=redis://localhost:6379/1
+CACHES = {"default": env.cache("CACHE_URL", default="locmemcache://")}
+
 AUTH_PASSWORD_VALIDATORS = [
     {
         "NAME": "django.contrib.auth.password_validation.UserAttributeSimilarityValidator",
@@ -95,3 +100,43 @@ STATIC_URL = "static/"
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
 AUTH_USER_MODEL = "users.User"
+
+# Подсчёт общего числа велосипедов в списке: exact / cached / approximate
+BIKE_LIST_COUNT_MODE = env("BIKE_LIST_COUNT_MODE", default="exact")
+BIKE_LIST_COUNT_TTL = env.int("BIKE_LIST_COUNT_TTL", default=60)
+
+# Размер пачки INSERT/UPDATE для массовой загрузки велосипедов
+BIKE_BULK_BATCH_SIZE = env.int("BIKE_BULK_BATCH_SIZE", default=1000)
+
+# Сколько строк серверный курсор отдаёт за раз при выгрузке парка
+BIKE_EXPORT_CHUNK_SIZE = env.int("BIKE_EXPORT_CHUNK_SIZE", default=2000)
+
+# Поиск ближайших станций: индекс в памяти процесса или bbox-запрос в БД
+BIKE_STATION_GEO_INDEX = env.bool("BIKE_STATION_GEO_INDEX", default=True)
+BIKE_STATION_GRID_CELL_DEG = env.float("BIKE_STATION_GRID_CELL_DEG", default=0.01)
+
+# Сколько живёт закэшированная карточка велосипеда (BikeDetailView.get)
+BIKE_DETAIL_CACHE_TTL = env.int("BIKE_DETAIL_CACHE_TTL", default=300)
+
+# Сколько велосипедов массовое действие админки меняет за одну транзакцию
+BIKE_ADMIN_ACTION_CHUNK_SIZE = env.int("BIKE_ADMIN_ACTION_CHUNK_SIZE", default=1000)
+
+# Потоки, которые готовят уменьшенные превью велосипедов (0 — прямо в запросе)
+BIKE_PREVIEW_WORKERS = env.int("BIKE_PREVIEW_WORKERS", default=2)
+
+# Вход по email без учёта регистра; неизвестные email кэшируются на N секунд.
+# Нужен общий кэш (CACHE_URL): с locmem новый пользователь до N секунд
+# получает отказ в других процессах, поэтому без CACHE_URL выключено (0)
+AUTHENTICATION_BACKENDS = ["users.backends.EmailBackend"]
+AUTH_UNKNOWN_EMAIL_TTL = env.int(
+    "AUTH_UNKNOWN_EMAIL_TTL", default=30 if env("CACHE_URL", default="") else 0
+)
+
+# Хранилище сессий: db / cached_db / cache / signed_cookies
+SESSION_ENGINE = "django.contrib.sessions.backends." + env(
+    "SESSION_BACKEND", default="cached_db"
+)
+
+# LRU аутентифицированных пользователей в процессе (0 — выключен)
+AUTH_USER_CACHE_SIZE = env.int("AUTH_USER_CACHE_SIZE", default=1024)
+AUTH_USER_CACHE_TTL = env.int("AUTH_USER_CACHE_TTL", default=30)
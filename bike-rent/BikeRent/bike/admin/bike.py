@@ -1,43 +1,118 @@
-from django.contrib import admin
+from django import forms
+from django.contrib import admin, messages
+from django.contrib.admin.helpers import ActionForm
+from django.contrib.admin.widgets import AutocompleteSelect
 
-from bike.models import Bike
+from bike.admin.filters import StationAutocompleteFilter
+from bike.bulk import update_bikes
+from bike.models import Bike, Station
+from bike.pagination import EstimatedCountPaginator
 
 
-from django.contrib import messages
+class BikeActionForm(ActionForm):
+    """Параметры массовых действий рядом со списком действий"""
 
-def set_as_available(modeladmin, request, queryset):
-    already_available = queryset.filter(available=True).count()
-    not_available = queryset.filter(available=False).count()
+    station = forms.ModelChoiceField(
+        queryset=Station.objects.all(),
+        required=False,
+        widget=AutocompleteSelect(Bike._meta.get_field("station"), admin.site),
+    )
+    category = forms.ChoiceField(
+        choices=[("", "---------"), *Bike.Category.choices], required=False
+    )
 
-    # Обновляем только те, что были недоступны
-    queryset.filter(available=False).update(available=True)
 
+def report(modeladmin, request, result, done: str, skipped: str):
     # Сообщение с деталями
-    if not_available > 0:
+    if result.changed > 0:
         modeladmin.message_user(
-            request,
-            f"✅ {not_available} объектов установлены как доступные.",
-            messages.SUCCESS,
+            request, f"✅ {result.changed} объектов {done}.", messages.SUCCESS
         )
-    if already_available > 0:
+    if result.unchanged > 0:
         modeladmin.message_user(
-            request,
-            f"ℹ️ {already_available} объектов уже были доступны.",
-            messages.INFO,
+            request, f"ℹ️ {result.unchanged} объектов {skipped}.", messages.INFO
         )
 
 
+@admin.action(description="Mark selected bikes as available")
+def set_as_available(modeladmin, request, queryset):
+    # Обновляем только те, что были недоступны
+    result = update_bikes(queryset, available=True)
+    report(
+        modeladmin, request, result, "установлены как доступные", "уже были доступны"
+    )
+
+
+@admin.action(description="Mark selected bikes as unavailable")
+def set_as_unavailable(modeladmin, request, queryset):
+    result = update_bikes(queryset, available=False)
+    report(
+        modeladmin,
+        request,
+        result,
+        "установлены как недоступные",
+        "уже были недоступны",
+    )
+
+
+def action_params(modeladmin, request) -> dict | None:
+    """Проверенные поля BikeActionForm; None — форма не прошла проверку"""
+    form = modeladmin.action_form(request.POST)
+    form.fields["action"].choices = modeladmin.get_action_choices(request)
+    if not form.is_valid():
+        return None
+    return form.cleaned_data
+
+
+@admin.action(description="Move selected bikes to station")
+def move_to_station(modeladmin, request, queryset):
+    params = action_params(modeladmin, request)
+    station = params and params["station"]
+    if station is None:
+        modeladmin.message_user(request, "Выберите станцию.", messages.ERROR)
+        return
+    result = update_bikes(queryset, station_id=station.pk)
+    report(
+        modeladmin, request, result, "перемещены на станцию", "уже были на этой станции"
+    )
+
+
+@admin.action(description="Change category of selected bikes")
+def change_category(modeladmin, request, queryset):
+    params = action_params(modeladmin, request)
+    category = params and params["category"]
+    if not category:
+        modeladmin.message_user(request, "Выберите категорию.", messages.ERROR)
+        return
+    result = update_bikes(queryset, category=category)
+    report(
+        modeladmin,
+        request,
+        result,
+        "получили новую категорию",
+        "уже были в этой категории",
+    )
+
+
 @admin.register(Bike)
 class BikeAdmin(admin.ModelAdmin):
-    actions = [set_as_available]
+    actions = [set_as_available, set_as_unavailable, move_to_station, change_category]
+    action_form = BikeActionForm
     list_display = ("category", "name", "brand", "display_station", "available", "electricity")
+    # станция подгружается JOIN'ом, а не запросом на каждую строку
+    list_select_related = ("station",)
+    # без SELECT DISTINCT по всей таблице: станции — через autocomplete,
+    # остальные фильтры строятся из choices/boolean без запросов
     list_filter = (
         "available",
         "electricity",
-        "station",
+        StationAutocompleteFilter,
         "brand",
-        "name",
     )
+    autocomplete_fields = ("station",)
+    paginator = EstimatedCountPaginator
+    # не считать COUNT(*) всей таблицы ради "N total"
+    show_full_result_count = False
     list_editable = ("available", "electricity")
     search_fields = ("name", "brand", "station__name")
     ordering = ("-name",)
@@ -50,6 +125,26 @@ class BikeAdmin(admin.ModelAdmin):
         ("Даты", {"fields": ("created_at", "updated_at", "deleted_at")}),
     )
 
+    @property
+    def media(self):
+        # select2 для StationAutocompleteFilter на странице списка
+        station = Bike._meta.get_field("station")
+        return super().media + AutocompleteSelect(station, self.admin_site).media
+
+    def response_action(self, request, queryset):
+        # Django на любую ошибку формы отвечает "No action selected.";
+        # если действие выбрано, а параметр (станция, категория) неверный —
+        # так и говорим
+        form = self.action_form(request.POST, auto_id=None)
+        form.fields["action"].choices = self.get_action_choices(request)
+        if not form.is_valid() and not form.has_error("action"):
+            for name, errors in form.errors.items():
+                self.message_user(
+                    request, f"{form[name].label}: {' '.join(errors)}", messages.ERROR
+                )
+            return None
+        return super().response_action(request, queryset)
+
     def display_station(self, obj):
         return f"{obj.station.name}-{obj.station.address}"
     display_station.short_description = "Station"
@@ -0,0 +1,54 @@
+from django import forms
+from django.contrib import admin
+from django.contrib.admin.widgets import AutocompleteSelect
+
+
+class AutocompleteFilter(admin.SimpleListFilter):
+    """
+    Фильтр по FK через autocomplete (select2) вместо списка всех значений:
+    сайдбар не перечисляет связанную таблицу, выбранное значение грузится
+    одним запросом по pk.
+    """
+
+    template = "admin/bike/autocomplete_filter.html"
+    field_name = None
+
+    def __init__(self, request, params, model, model_admin):
+        self.parameter_name = f"{self.field_name}__id__exact"
+        super().__init__(request, params, model, model_admin)
+        field = model._meta.get_field(self.field_name)
+        # виджету нужны choices от ModelChoiceField: он запрашивает только
+        # выбранный объект, а не всю таблицу
+        form_field = forms.ModelChoiceField(
+            queryset=field.related_model._default_manager.all(),
+            widget=AutocompleteSelect(field, model_admin.admin_site),
+            required=False,
+        )
+        self.rendered_widget = form_field.widget.render(
+            self.parameter_name,
+            self.value(),
+            attrs={"id": f"autocomplete-filter-{self.field_name}"},
+        )
+
+    def has_output(self):
+        return True
+
+    def lookups(self, request, model_admin):
+        return ()
+
+    def queryset(self, request, queryset):
+        if self.value():
+            return queryset.filter(**{f"{self.field_name}_id": self.value()})
+        return queryset
+
+    def choices(self, changelist):
+        yield {
+            "selected": self.value() is None,
+            "query_string": changelist.get_query_string(remove=[self.parameter_name]),
+            "display": "All",
+        }
+
+
+class StationAutocompleteFilter(AutocompleteFilter):
+    title = "Station"
+    field_name = "station"
@@ -1,31 +1,113 @@
 from django.contrib import admin
+from django.core.exceptions import PermissionDenied
+from django.db.models import Count, Q
+from django.http import Http404
+from django.template.loader import render_to_string
+from django.urls import path, reverse
 
-from bike.models import Station, Bike
+from bike.models import Bike, Station
+from bike.pagination import InvalidCursor, paginate_by_cursor
+from bike.serializers import FastJsonResponse
 
-
-class BikeInline(admin.StackedInline):
-    model = Bike
-    extra = 1
-    fields = (
-        "name",
-        "brand",
-        "category",
-    )
-    readonly_fields = (
-        "name",
-        "brand",
-        "category",
-    )
-    max_num = 1
+# сколько велосипедов панель станции подгружает за раз
+BIKE_PANEL_PAGE_SIZE = 50
 
 
 @admin.register(Station)
 class StationAdmin(admin.ModelAdmin):
-    inlines = [BikeInline]
+    # вместо BikeInline: формсет строился по всем велосипедам станции,
+    # теперь сводка одним GROUP BY и список, который подгружается страницами
+    readonly_fields = ("fleet_summary", "fleet_bikes")
     list_display = (
         "name",
         "is_big_capacity",
     )
+    # нужен для autocomplete станции в BikeAdmin
+    search_fields = ("name", "address")
+
+    def get_urls(self):
+        urls = [
+            path(
+                "<int:pk>/bikes/",
+                self.admin_site.admin_view(self.bikes_view),
+                name="bike_station_bikes",
+            ),
+        ]
+        return urls + super().get_urls()
+
+    def bikes_view(self, request, pk):
+        """Страница велосипедов станции для панели: keyset по id, без COUNT(*)"""
+        station = self.get_object(request, pk)
+        if station is None:
+            raise Http404
+        if not self.has_view_permission(request, station):
+            raise PermissionDenied
+
+        qs = (
+            Bike.objects.filter(station=station)
+            .order_by("id")
+            .values("id", "name", "brand", "category", "available")
+        )
+        try:
+            page = paginate_by_cursor(
+                qs, request.GET.get("cursor"), BIKE_PANEL_PAGE_SIZE
+            )
+        except InvalidCursor:
+            return FastJsonResponse(
+                {"errors": {"cursor": "Некорректный курсор"}}, status=400
+            )
+        return FastJsonResponse(page)
+
+    @admin.display(description="Bikes by category / brand")
+    def fleet_summary(self, obj):
+        if obj.pk is None:
+            return "-"
+        rows = (
+            Bike.objects.filter(station=obj)
+            .values_list("category", "brand")
+            .annotate(
+                total=Count("id"), available=Count("id", filter=Q(available=True))
+            )
+            .order_by()
+        )
+        # одна группировка (category, brand) -> две сводки в Python
+        by_category, by_brand = {}, {}
+        for category, brand, total, available in rows:
+            for summary, key in ((by_category, category), (by_brand, brand)):
+                counts = summary.setdefault(key, [0, 0])
+                counts[0] += total
+                counts[1] += available
+
+        return render_to_string(
+            "admin/bike/station_fleet_summary.html",
+            {
+                "station": obj,
+                "by_category": self._summary_rows(by_category, Bike.Category.choices),
+                "by_brand": self._summary_rows(by_brand, Bike.Brand.choices),
+            },
+        )
+
+    @staticmethod
+    def _summary_rows(summary: dict, choices) -> list:
+        labels = dict(choices)
+        rows = [
+            (labels.get(key, key or "-"), *counts) for key, counts in summary.items()
+        ]
+        return sorted(rows, key=lambda row: str(row[0]))
+
+    @admin.display(description="Bikes")
+    def fleet_bikes(self, obj):
+        if obj.pk is None:
+            return "-"
+        return render_to_string(
+            "admin/bike/station_bike_panel.html",
+            {
+                "bikes_url": reverse("admin:bike_station_bikes", args=[obj.pk]),
+                "change_url": reverse("admin:bike_bike_change", args=[0]).replace(
+                    "/0/", "/__pk__/"
+                ),
+            },
+        )
 
     def is_big_capacity(self, obj):
         return obj.is_big_capacity
@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class BikeConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "bike"
+
+    def ready(self):
+        from . import signals  # noqa
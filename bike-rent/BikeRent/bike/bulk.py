@@ -0,0 +1,144 @@
+from dataclasses import dataclass
+from functools import reduce
+from operator import or_
+
+from django.conf import settings
+from django.db import connections, transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from bike.counters import CounterDeltas
+from bike.counting import invalidate_count_cache
+from bike.detail_cache import invalidate_bikes
+from bike.models import Bike
+
+
+@dataclass
+class BulkUpdateResult:
+    selected: int = 0
+    changed: int = 0
+
+    @property
+    def unchanged(self) -> int:
+        return self.selected - self.changed
+
+
+def update_bikes(
+    queryset, chunk_size: int | None = None, **changes
+) -> BulkUpdateResult:
+    """
+    Массовое изменение полей велосипедов (available=True, station_id=3, ...).
+    Выборка обходится пачками по id, каждая пачка — своя короткая транзакция,
+    чтобы "выбрать все" не держало блокировку на всей таблице.
+    Меняются только строки, где значение действительно другое; счётчики
+    станций и кэши правятся по старому/новому состоянию этих строк.
+    """
+    chunk_size = chunk_size or getattr(settings, "BIKE_ADMIN_ACTION_CHUNK_SIZE", 1000)
+    ids = (
+        queryset.filter(deleted_at__isnull=True)
+        .order_by("pk")
+        .values_list("pk", flat=True)
+    )
+    using = queryset.db
+    result = BulkUpdateResult()
+
+    last_id = None
+    while True:
+        page = ids if last_id is None else ids.filter(pk__gt=last_id)
+        chunk = list(page[:chunk_size])
+        if not chunk:
+            break
+        last_id = chunk[-1]
+        result.selected += len(chunk)
+
+        with transaction.atomic(using=using):
+            rows = _update_chunk(using, chunk, changes)
+            deltas = CounterDeltas()
+            for pk, old_state, new_state in rows:
+                deltas.move(old_state, new_state)
+            deltas.apply()
+            invalidate_bikes([pk for pk, _, _ in rows])
+        result.changed += len(rows)
+
+    if result.changed:
+        invalidate_count_cache()
+    return result
+
+
+def _update_chunk(using, chunk: list, changes: dict) -> list:
+    """[(id, (старые station_id, available), (новые station_id, available))]"""
+    if connections[using].vendor == "postgresql":
+        return _update_returning(using, chunk, changes)
+
+    # без UPDATE ... RETURNING: блокируем пачку, читаем старое состояние и обновляем
+    differs = reduce(or_, (~Q(**{field: value}) for field, value in changes.items()))
+    locked = (
+        Bike.objects.using(using)
+        .select_for_update()
+        .filter(differs, pk__in=chunk)
+        .values_list("pk", "station_id", "available")
+    )
+    old = {pk: (station_id, available) for pk, station_id, available in locked}
+    if not old:
+        return []
+    Bike.objects.using(using).filter(pk__in=old).update(
+        updated_at=timezone.now(), **changes
+    )
+    return [
+        (
+            pk,
+            state,
+            (changes.get("station_id", state[0]), changes.get("available", state[1])),
+        )
+        for pk, state in old.items()
+    ]
+
+
+def _update_returning(using, chunk: list, changes: dict) -> list:
+    """
+    Одним запросом: подзапрос блокирует изменяемые строки и отдаёт их старое
+    состояние, UPDATE ... RETURNING — новое.
+    """
+    connection = connections[using]
+    quote = connection.ops.quote_name
+    meta = Bike._meta
+
+    assignments, differs, set_params, differs_params = [], [], [], []
+    for name, value in changes.items():
+        field = meta.get_field(name)
+        column = quote(field.column)
+        prepared = field.get_db_prep_save(value, connection)
+        assignments.append(f"{column} = %s")
+        set_params.append(prepared)
+        differs.append(f"{column} IS DISTINCT FROM %s")
+        differs_params.append(prepared)
+    updated_at = meta.get_field("updated_at")
+    assignments.append(f"{quote(updated_at.column)} = %s")
+    set_params.append(updated_at.get_db_prep_save(timezone.now(), connection))
+
+    table = quote(meta.db_table)
+    pk = quote(meta.pk.column)
+    station = quote(meta.get_field("station").column)
+    available = quote(meta.get_field("available").column)
+    deleted_at = quote(meta.get_field("deleted_at").column)
+    sql = (
+        f"UPDATE {table} AS b SET {', '.join(assignments)} "
+        f"FROM (SELECT {pk}, {station}, {available} FROM {table} "
+        f"WHERE {pk} = ANY(%s) AND {deleted_at} IS NULL "
+        f"AND ({' OR '.join(differs)}) "
+        f"ORDER BY {pk} FOR UPDATE) AS old "
+        f"WHERE b.{pk} = old.{pk} "
+        f"RETURNING b.{pk}, old.{station}, old.{available}, b.{station}, b.{available}"
+    )
+    with connection.cursor() as cursor:
+        cursor.execute(sql, [*set_params, chunk, *differs_params])
+        return [
+            (pk_value, (old_station, old_available), (new_station, new_available))
+            for (
+                pk_value,
+                old_station,
+                old_available,
+                new_station,
+                new_available,
+            ) in cursor.fetchall()
+        ]
@@ -0,0 +1,53 @@
+from collections import defaultdict
+
+from django.db.models import Count, F, Q
+
+from bike.models import Station
+
+
+class CounterDeltas:
+    """
+    Накопитель изменений счётчиков станций: station_id -> [total, available].
+    Собираем изменения по всем велосипедам и пишем одним UPDATE на станцию.
+    """
+
+    def __init__(self):
+        self._deltas = defaultdict(lambda: [0, 0])
+
+    def change(self, station_id, total: int = 0, available: int = 0):
+        if station_id is None:
+            return
+        delta = self._deltas[station_id]
+        delta[0] += total
+        delta[1] += available
+
+    def add(self, station_id, available: bool, sign: int = 1):
+        self.change(station_id, total=sign, available=sign if available else 0)
+
+    def move(self, old_state, new_state):
+        """Велосипед перешёл из (station_id, available) old_state в new_state"""
+        if old_state == new_state:
+            return
+        self.add(*old_state, sign=-1)
+        self.add(*new_state)
+
+    def apply(self):
+        # сортировка по id — одинаковый порядок блокировок, без дедлоков
+        for station_id in sorted(self._deltas):
+            total, available = self._deltas[station_id]
+            if total or available:
+                Station.objects.filter(pk=station_id).update(
+                    total_count=F("total_count") + total,
+                    available_count=F("available_count") + available,
+                )
+        self._deltas.clear()
+
+
+def actual_station_counts(bike_qs) -> dict:
+    """station_id -> (total, available) одним сгруппированным запросом"""
+    rows = (
+        bike_qs.values_list("station")
+        .annotate(total=Count("id"), available=Count("id", filter=Q(available=True)))
+        .order_by()
+    )
+    return {station_id: (total, available) for station_id, total, available in rows}
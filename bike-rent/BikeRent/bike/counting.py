@@ -0,0 +1,91 @@
+import hashlib
+import json
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connections
+
+COUNT_EXACT = "exact"
+COUNT_CACHED = "cached"
+COUNT_APPROXIMATE = "approximate"
+
+COUNT_VERSION_KEY = "bike:count:version"
+
+
+def count_queryset(qs) -> tuple[int, str]:
+    """
+    Считает строки qs по режиму BIKE_LIST_COUNT_MODE.
+    Возвращает (count, kind), где kind — какой подсчёт реально был использован.
+    """
+    mode = getattr(settings, "BIKE_LIST_COUNT_MODE", COUNT_EXACT)
+
+    if mode == COUNT_CACHED:
+        return _cached_count(qs), COUNT_CACHED
+
+    if mode == COUNT_APPROXIMATE:
+        estimate = estimate_count(qs)
+        if estimate is not None:
+            return estimate, COUNT_APPROXIMATE
+
+    return qs.count(), COUNT_EXACT
+
+
+async def acount_queryset(qs) -> tuple[int, str]:
+    """count_queryset для async-представлений"""
+    if getattr(settings, "BIKE_LIST_COUNT_MODE", COUNT_EXACT) == COUNT_EXACT:
+        return await qs.acount(), COUNT_EXACT
+    # кэш и EXPLAIN через сырой курсор — синхронные, уводим в поток
+    return await sync_to_async(count_queryset)(qs)
+
+
+def invalidate_count_cache():
+    """Сбрасывает все закэшированные подсчёты (меняем версию ключей)"""
+    try:
+        cache.incr(COUNT_VERSION_KEY)
+    except ValueError:
+        cache.set(COUNT_VERSION_KEY, 1, None)
+
+
+def _cached_count(qs) -> int:
+    version = cache.get_or_set(COUNT_VERSION_KEY, 1, None)
+    sql, params = qs.query.sql_with_params()
+    digest = hashlib.md5(f"{sql}|{params!r}".encode()).hexdigest()
+    key = f"bike:count:{version}:{digest}"
+
+    count = cache.get(key)
+    if count is None:
+        count = qs.count()
+        cache.set(key, count, getattr(settings, "BIKE_LIST_COUNT_TTL", 60))
+    return count
+
+
+def estimate_count(qs) -> int | None:
+    """
+    Оценка из статистики планировщика Postgres:
+    без фильтров — pg_class.reltuples, с фильтрами — оценка строк из EXPLAIN.
+    None, если оценки нет (не Postgres или таблица ещё не анализировалась).
+    """
+    connection = connections[qs.db]
+    if connection.vendor != "postgresql":
+        return None
+
+    with connection.cursor() as cursor:
+        if not qs.query.has_filters():
+            cursor.execute(
+                "SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass",
+                [qs.model._meta.db_table],
+            )
+            row = cursor.fetchone()
+            estimate = row[0] if row else -1
+        else:
+            sql, params = qs.query.sql_with_params()
+            cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+            plan = cursor.fetchone()[0]
+            if isinstance(plan, str):
+                plan = json.loads(plan)
+            estimate = int(plan[0]["Plan"]["Plan Rows"])
+
+    if estimate < 0:
+        return None
+    return estimate
@@ -0,0 +1,117 @@
+import secrets
+import threading
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+# меняется при изменении любой станции — сбрасывает кэш всех велосипедов
+GENERATION_KEY = "bike:detail:generation"
+
+
+def _version_key(pk) -> str:
+    return f"bike:detail:version:{pk}"
+
+
+class CacheStats:
+    """Счётчики попаданий/промахов текущего процесса"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def record(self, hit: bool):
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def as_dict(self) -> dict:
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / total, 4) if total else None,
+            }
+
+
+stats = CacheStats()
+
+
+def _current_versions(pk) -> tuple:
+    """
+    (generation, version) для pk. Отсутствующий штамп создаётся случайным,
+    поэтому после сброса или вытеснения ключа старые записи уже не прочитать.
+    """
+    keys = [GENERATION_KEY, _version_key(pk)]
+    found = cache.get_many(keys)
+    for key in keys:
+        if key not in found:
+            cache.add(key, secrets.token_hex(8), None)
+            found[key] = cache.get(key)
+    return found[GENERATION_KEY], found[_version_key(pk)]
+
+
+def get_bike_payload(pk, loader) -> tuple[bytes, bool]:
+    """
+    Read-through: готовый JSON велосипеда из кэша или loader(pk).
+    Штампы читаются до загрузки из БД: если параллельная запись успела
+    их сменить, заполнение уйдёт под старый ключ, который никто не читает.
+    Возвращает (payload, hit).
+    """
+    generation, version = _current_versions(pk)
+    key = f"bike:detail:{pk}:{generation}:{version}"
+
+    payload = cache.get(key)
+    if payload is not None:
+        stats.record(hit=True)
+        return payload, True
+
+    stats.record(hit=False)
+    payload = loader(pk)
+    cache.set(key, payload, getattr(settings, "BIKE_DETAIL_CACHE_TTL", 300))
+    return payload, False
+
+
+async def _acurrent_versions(pk) -> tuple:
+    keys = [GENERATION_KEY, _version_key(pk)]
+    found = await cache.aget_many(keys)
+    for key in keys:
+        if key not in found:
+            await cache.aadd(key, secrets.token_hex(8), None)
+            found[key] = await cache.aget(key)
+    return found[GENERATION_KEY], found[_version_key(pk)]
+
+
+async def aget_bike_payload(pk, loader) -> tuple[bytes, bool]:
+    """get_bike_payload для async-представлений; loader — корутина"""
+    generation, version = await _acurrent_versions(pk)
+    key = f"bike:detail:{pk}:{generation}:{version}"
+
+    payload = await cache.aget(key)
+    if payload is not None:
+        stats.record(hit=True)
+        return payload, True
+
+    stats.record(hit=False)
+    payload = await loader(pk)
+    await cache.aset(key, payload, getattr(settings, "BIKE_DETAIL_CACHE_TTL", 300))
+    return payload, False
+
+
+def invalidate_bikes(pks):
+    """Сбросить кэш велосипедов: сразу и ещё раз после коммита транзакции"""
+    keys = [_version_key(pk) for pk in pks]
+    if not keys:
+        return
+    cache.delete_many(keys)
+    # заполнение между сбросом и коммитом могло прочитать старые данные
+    transaction.on_commit(lambda: cache.delete_many(keys))
+
+
+def invalidate_all_bikes():
+    cache.delete(GENERATION_KEY)
+    transaction.on_commit(lambda: cache.delete(GENERATION_KEY))
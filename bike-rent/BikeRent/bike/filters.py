@@ -0,0 +1,121 @@
+from dataclasses import dataclass
+
+from bike.models import Bike
+
+TRUE_VALUES = ("true", "1")
+FALSE_VALUES = ("false", "0")
+
+
+class FilterError(ValueError):
+    def __init__(self, errors: dict):
+        super().__init__(errors)
+        self.errors = errors
+
+
+@dataclass(frozen=True)
+class ChoiceFilter:
+    field: str
+    choices: type
+
+    def parse(self, value: str):
+        if value not in self.choices.values:
+            raise ValueError(f"Допустимые значения: {', '.join(self.choices.values)}")
+        return value
+
+
+@dataclass(frozen=True)
+class BooleanFilter:
+    field: str
+
+    def parse(self, value: str):
+        if value.lower() in TRUE_VALUES:
+            return True
+        if value.lower() in FALSE_VALUES:
+            return False
+        raise ValueError("Допустимые значения: true, false")
+
+
+@dataclass(frozen=True)
+class IdFilter:
+    field: str
+
+    def parse(self, value: str):
+        if not value.isdigit():
+            raise ValueError("Должно быть целым числом")
+        return int(value)
+
+
+@dataclass(frozen=True)
+class Ordering:
+    order_by: tuple
+    # с какими фильтрами сортировка остаётся индексной; None — с любыми
+    allowed_filters: frozenset | None = None
+
+
+# ?<параметр>=<значение> -> фильтр по полю Bike
+BIKE_FILTERS = {
+    "brand": ChoiceFilter("brand", Bike.Brand),
+    "category": ChoiceFilter("category", Bike.Category),
+    "colour": ChoiceFilter("colour", Bike.Colour),
+    "available": BooleanFilter("available"),
+    "electric": BooleanFilter("electricity"),
+    "station": IdFilter("station_id"),
+}
+
+# Только сортировки, за которыми стоит индекс. id — первичный ключ,
+# name — bike_name_desc_idx, brand — bike_brand_category_idx.
+# Сортировка не по id вместе с фильтрами по другим полям заставила бы
+# Postgres отсортировать всю отфильтрованную выборку, поэтому запрещена.
+BIKE_ORDERINGS = {
+    "id": Ordering(("id",)),
+    "-id": Ordering(("-id",)),
+    "name": Ordering(("name", "id"), frozenset()),
+    "-name": Ordering(("-name", "-id"), frozenset()),
+    "brand": Ordering(("brand", "category", "id"), frozenset({"brand", "category"})),
+    "-brand": Ordering(
+        ("-brand", "-category", "-id"), frozenset({"brand", "category"})
+    ),
+}
+DEFAULT_ORDERING = "id"
+# сортировки, по которым работает keyset-пагинация (?cursor=)
+CURSOR_ORDERINGS = ("id", "-id")
+
+
+def parse_bike_filters(params) -> tuple[dict, str]:
+    """
+    Проверяет query-параметры списка велосипедов по BIKE_FILTERS/BIKE_ORDERINGS.
+    Возвращает (lookups для .filter(), ключ сортировки) или бросает FilterError.
+    """
+    errors = {}
+    lookups = {}
+    for name, spec in BIKE_FILTERS.items():
+        values = params.getlist(name)
+        if not values:
+            continue
+        if len(values) > 1:
+            errors[name] = "Можно указать только одно значение"
+            continue
+        try:
+            lookups[spec.field] = spec.parse(values[0])
+        except ValueError as e:
+            errors[name] = str(e)
+
+    ordering = params.get("ordering", DEFAULT_ORDERING)
+    if ordering not in BIKE_ORDERINGS:
+        errors["ordering"] = f"Допустимые значения: {', '.join(BIKE_ORDERINGS)}"
+    else:
+        allowed = BIKE_ORDERINGS[ordering].allowed_filters
+        used = {name for name in BIKE_FILTERS if name in params}
+        if allowed is not None and not used <= allowed:
+            errors["ordering"] = (
+                f"Сортировку {ordering} нельзя сочетать с фильтрами: "
+                f"{', '.join(sorted(used - allowed))}"
+            )
+        if "cursor" in params and ordering not in CURSOR_ORDERINGS:
+            errors["cursor"] = (
+                f"cursor работает только с ordering={'/'.join(CURSOR_ORDERINGS)}"
+            )
+
+    if errors:
+        raise FilterError(errors)
+    return lookups, ordering
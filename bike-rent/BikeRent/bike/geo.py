@@ -0,0 +1,233 @@
+import heapq
+import math
+import threading
+from collections import defaultdict
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Q
+
+EARTH_RADIUS_M = 6_371_000
+
+GEO_VERSION_KEY = "bike:stations:geo:version"
+
+
+def haversine_m(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Расстояние по поверхности Земли в метрах"""
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    d_phi = phi2 - phi1
+    d_lambda = math.radians(lon2 - lon1)
+    a = (
+        math.sin(d_phi / 2) ** 2
+        + math.cos(phi1) * math.cos(phi2) * math.sin(d_lambda / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS_M * math.asin(min(1.0, math.sqrt(a)))
+
+
+def bounding_box(lat: float, lon: float, radius_m: float) -> tuple:
+    """
+    (min_lat, max_lat, min_lon, max_lon) сферической «шапки» радиуса radius_m.
+    Широта обрезана до [-90, 90]; долгота не нормализуется и может выходить
+    за ±180 (переход через антимеридиан). Если шапка накрывает полюс —
+    долгота целиком, (-180, 180).
+    """
+    angle = radius_m / EARTH_RADIUS_M
+    d_lat = math.degrees(angle)
+    min_lat, max_lat = lat - d_lat, lat + d_lat
+    if min_lat <= -90 or max_lat >= 90 or angle >= math.pi / 2:
+        return max(min_lat, -90.0), min(max_lat, 90.0), -180.0, 180.0
+    d_lon = math.degrees(
+        math.asin(min(1.0, math.sin(angle) / math.cos(math.radians(lat))))
+    )
+    return min_lat, max_lat, lon - d_lon, lon + d_lon
+
+
+def wrap_lon(lon: float) -> float:
+    """Долгота в [-180, 180)"""
+    return (lon + 180) % 360 - 180
+
+
+class StationGrid:
+    """
+    Равномерная сетка по широте/долготе: ячейка -> [(lat, lon, station_id)].
+    Смотрим только ячейки внутри bounding_box запроса, кольцами вокруг точки,
+    пока следующее кольцо гарантированно не может дать станцию ближе.
+    Если в bbox больше ячеек, чем непустых ячеек в индексе (большой радиус
+    у полюса), дешевле перебрать непустые ячейки и отсеять их по bbox.
+    """
+
+    def __init__(self, points=(), cell_deg: float = 0.01):
+        self.cell_deg = cell_deg
+        # столбцов на полный круг долготы; последний может быть неполным
+        self.lon_cells = math.ceil(360 / cell_deg)
+        self.cells = defaultdict(list)
+        self.size = 0
+        for station_id, lat, lon in points:
+            self.add(station_id, lat, lon)
+
+    def _row(self, lat: float) -> int:
+        return math.floor(lat / self.cell_deg)
+
+    def _column(self, lon: float) -> int:
+        """Столбец без заворота: для lon за ±180 выходит за [0, lon_cells)"""
+        return math.floor((lon + 180) / self.cell_deg)
+
+    def add(self, station_id: int, lat: float, lon: float):
+        key = self._row(lat), self._column(wrap_lon(lon)) % self.lon_cells
+        self.cells[key].append((lat, lon, station_id))
+        self.size += 1
+
+    def nearest(self, lat: float, lon: float, radius_m: float, limit: int) -> list:
+        """[(distance_m, station_id)] в пределах radius_m, по возрастанию расстояния"""
+        if not self.size or limit < 1:
+            return []
+
+        min_lat, max_lat, min_lon, max_lon = bounding_box(lat, lon, radius_m)
+        ci, cj = self._row(lat), self._column(wrap_lon(lon))
+        di_lo, di_hi = self._row(min_lat) - ci, self._row(max_lat) - ci
+        # +-1 столбец: за антимеридианом нумерация сдвинута неполным столбцом
+        dj_lo = self._column(wrap_lon(lon) + min_lon - lon) - cj - 1
+        dj_hi = self._column(wrap_lon(lon) + max_lon - lon) - cj + 1
+        if dj_hi - dj_lo + 1 >= self.lon_cells:
+            # весь круг долготы, каждый столбец — ровно один раз
+            dj_lo = -(self.lon_cells // 2)
+            dj_hi = dj_lo + self.lon_cells - 1
+
+        if (di_hi - di_lo + 1) * (dj_hi - dj_lo + 1) > len(self.cells):
+            # непустых ячеек меньше, чем ячеек в bbox — перебираем их
+            points = (
+                point
+                for (i, j), cell in self.cells.items()
+                if di_lo <= i - ci <= di_hi
+                and (j - cj - dj_lo) % self.lon_cells <= dj_hi - dj_lo
+                for point in cell
+            )
+            best = []
+            self._push(best, points, lat, lon, radius_m, limit)
+            return sorted((-distance, station_id) for distance, station_id in best)
+
+        # нижние оценки расстояния до станций за кольцом ring: по широте
+        # разница не меньше ring ячеек, по долготе — ring - 1 (неполный
+        # столбец у антимеридиана), при cos широты не меньше, чем в bbox
+        cos_bound = math.sqrt(
+            math.cos(math.radians(lat))
+            * math.cos(math.radians(max(abs(min_lat), abs(max_lat))))
+        )
+
+        def ring_bound(ring: int) -> float:
+            lat_gap = math.radians(ring * self.cell_deg)
+            lon_gap = math.radians(min(max(ring - 1, 0) * self.cell_deg, 180))
+            lon_m = (
+                2
+                * EARTH_RADIUS_M
+                * math.asin(min(1.0, cos_bound * math.sin(lon_gap / 2)))
+            )
+            return min(EARTH_RADIUS_M * lat_gap, lon_m)
+
+        max_ring = max(-di_lo, di_hi, -dj_lo, dj_hi)
+        best = []  # max-heap по расстоянию: (-distance, station_id)
+        for ring in range(max_ring + 1):
+            cells = self._ring_cells(ring, di_lo, di_hi, dj_lo, dj_hi)
+            points = (
+                point
+                for di, dj in cells
+                for point in self.cells.get((ci + di, (cj + dj) % self.lon_cells), ())
+            )
+            self._push(best, points, lat, lon, radius_m, limit)
+            if len(best) == limit and -best[0][0] <= ring_bound(ring):
+                break
+
+        return sorted((-distance, station_id) for distance, station_id in best)
+
+    @staticmethod
+    def _push(best: list, points, lat, lon, radius_m, limit):
+        for p_lat, p_lon, station_id in points:
+            distance = haversine_m(lat, lon, p_lat, p_lon)
+            if distance > radius_m:
+                continue
+            if len(best) < limit:
+                heapq.heappush(best, (-distance, station_id))
+            elif distance < -best[0][0]:
+                heapq.heapreplace(best, (-distance, station_id))
+
+    @staticmethod
+    def _ring_cells(ring: int, di_lo: int, di_hi: int, dj_lo: int, dj_hi: int):
+        """Смещения (di, dj) ячеек кольца ring, обрезанного по bbox"""
+        j_from, j_to = max(-ring, dj_lo), min(ring, dj_hi)
+        for di in (-ring, ring) if ring else (0,):
+            if di_lo <= di <= di_hi:
+                for dj in range(j_from, j_to + 1):
+                    yield di, dj
+        if not ring:
+            return
+        i_from, i_to = max(-ring + 1, di_lo), min(ring - 1, di_hi)
+        for dj in (-ring, ring):
+            if dj_lo <= dj <= dj_hi:
+                for di in range(i_from, i_to + 1):
+                    yield di, dj
+
+
+_index = None
+_index_version = None
+_index_lock = threading.Lock()
+
+
+def get_station_index() -> StationGrid:
+    """
+    Индекс станций текущего процесса. Пересобирается, если версия в кэше
+    изменилась (её поднимают сигналы Station в bike/signals.py).
+    """
+    global _index, _index_version
+    from bike.models import Station
+
+    version = cache.get_or_set(GEO_VERSION_KEY, 1, None)
+    if _index is not None and _index_version == version:
+        return _index
+
+    with _index_lock:
+        if _index is None or _index_version != version:
+            points = Station.objects.filter(
+                latitude__isnull=False, longitude__isnull=False
+            ).values_list("id", "latitude", "longitude")
+            _index = StationGrid(
+                points.iterator(chunk_size=5000),
+                cell_deg=getattr(settings, "BIKE_STATION_GRID_CELL_DEG", 0.01),
+            )
+            _index_version = version
+    return _index
+
+
+def invalidate_station_index():
+    try:
+        cache.incr(GEO_VERSION_KEY)
+    except ValueError:
+        cache.set(GEO_VERSION_KEY, 1, None)
+
+
+def nearest_by_bounding_box(
+    lat: float, lon: float, radius_m: float, limit: int
+) -> list:
+    """Запасной путь без индекса в памяти: bbox в SQL, точное расстояние в Python"""
+    from bike.models import Station
+
+    min_lat, max_lat, min_lon, max_lon = bounding_box(lat, lon, radius_m)
+    if max_lon - min_lon >= 360:
+        lon_filter = Q()
+    elif min_lon < -180:
+        # bbox переходит через антимеридиан — два диапазона долготы
+        lon_filter = Q(longitude__gte=min_lon + 360) | Q(longitude__lte=max_lon)
+    elif max_lon > 180:
+        lon_filter = Q(longitude__gte=min_lon) | Q(longitude__lte=max_lon - 360)
+    else:
+        lon_filter = Q(longitude__range=(min_lon, max_lon))
+    candidates = Station.objects.filter(
+        lon_filter, latitude__range=(min_lat, max_lat)
+    ).values_list("id", "latitude", "longitude")
+
+    found = (
+        (haversine_m(lat, lon, p_lat, p_lon), station_id)
+        for station_id, p_lat, p_lon in candidates.iterator(chunk_size=5000)
+    )
+    return heapq.nsmallest(
+        limit, ((distance, pk) for distance, pk in found if distance <= radius_m)
+    )
@@ -0,0 +1,187 @@
+# bike/management/commands/bench_asgi_wsgi.py
+import asyncio
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+from urllib.parse import urlsplit
+
+from django.core.handlers.asgi import ASGIHandler
+from django.core.handlers.wsgi import WSGIHandler
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+
+from bike.models import Bike
+
+
+class Command(BaseCommand):
+    help = (
+        "Load the bike/station endpoints through Django's ASGI handler (asyncio "
+        "clients) and WSGI handler (thread pool, like a threaded WSGI server) "
+        "in-process and compare throughput and latency percentiles."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--concurrency",
+            type=int,
+            nargs="+",
+            default=[1, 8, 32],
+            help="Concurrent clients (several values — several runs)",
+        )
+        parser.add_argument(
+            "--requests",
+            type=int,
+            default=400,
+            help="Requests per run (spread evenly over clients)",
+        )
+        parser.add_argument(
+            "--path",
+            action="append",
+            dest="paths",
+            help=(
+                "Request path, can be repeated "
+                "(default: bike list, bike detail, stations)"
+            ),
+        )
+
+    def handle(self, *args, **opts):
+        paths = opts["paths"] or self._default_paths()
+        asgi, wsgi = ASGIHandler(), WSGIHandler()
+
+        # прогрев: импорт URLConf, шаблонов ошибок, кэшей процесса
+        for path in paths:
+            status = self._wsgi_request(wsgi, path)
+            if status >= 400:
+                raise CommandError(f"GET {path} -> {status}")
+
+        self.stdout.write(f"Paths: {', '.join(paths)}")
+        self.stdout.write(
+            f"{'server':<6} {'clients':>7} {'req/s':>9} "
+            f"{'p50 ms':>8} {'p99 ms':>8} {'errors':>6}"
+        )
+        for concurrency in opts["concurrency"]:
+            per_client = max(1, opts["requests"] // concurrency)
+            for name, run in (("wsgi", self._run_wsgi), ("asgi", self._run_asgi)):
+                handler = wsgi if name == "wsgi" else asgi
+                started = time.perf_counter()
+                results = run(handler, paths, concurrency, per_client)
+                elapsed = time.perf_counter() - started
+                self._report(name, concurrency, results, elapsed)
+
+        self.stdout.write(self.style.SUCCESS("✅ Benchmark finished"))
+
+    # ---------------- utilities ----------------
+
+    def _default_paths(self) -> list:
+        pk = Bike.objects.order_by("id").values_list("id", flat=True).first()
+        if pk is None:
+            raise CommandError(
+                "No bikes — seed some first (bench_bike_pagination --bikes N)."
+            )
+        return ["/bikes/bikes/?per_page=20", f"/bikes/bikes/{pk}/", "/bikes/stations/"]
+
+    def _report(self, name, concurrency, results, elapsed):
+        latencies = sorted(latency for latency, _ in results)
+        errors = sum(1 for _, status in results if status >= 400)
+        p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]
+        self.stdout.write(
+            f"{name:<6} {concurrency:>7} {len(results) / elapsed:>9.1f} "
+            f"{statistics.median(latencies) * 1000:>8.2f} "
+            f"{p99 * 1000:>8.2f} {errors:>6}"
+        )
+
+    # WSGI: каждый клиент — поток, как у gunicorn --threads
+
+    def _run_wsgi(self, handler, paths, concurrency, per_client) -> list:
+        def client(offset):
+            results = []
+            try:
+                for i in range(per_client):
+                    started = time.perf_counter()
+                    status = self._wsgi_request(
+                        handler, paths[(offset + i) % len(paths)]
+                    )
+                    results.append((time.perf_counter() - started, status))
+            finally:
+                connections.close_all()
+            return results
+
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            return [r for chunk in pool.map(client, range(concurrency)) for r in chunk]
+
+    def _wsgi_request(self, handler, path) -> int:
+        url = urlsplit(path)
+        environ = {
+            "REQUEST_METHOD": "GET",
+            "PATH_INFO": url.path,
+            "QUERY_STRING": url.query,
+            "SERVER_NAME": "localhost",
+            "SERVER_PORT": "80",
+            "HTTP_HOST": "localhost",
+            "wsgi.url_scheme": "http",
+            "wsgi.input": BytesIO(),
+            "wsgi.errors": BytesIO(),
+        }
+        status = []
+        body = handler(environ, lambda s, headers, exc_info=None: status.append(s))
+        b"".join(body)
+        body.close()
+        return int(status[0].split()[0])
+
+    # ASGI: каждый клиент — корутина в одном event loop, как у uvicorn
+
+    def _run_asgi(self, handler, paths, concurrency, per_client) -> list:
+        async def client(offset):
+            results = []
+            for i in range(per_client):
+                started = time.perf_counter()
+                status = await self._asgi_request(
+                    handler, paths[(offset + i) % len(paths)]
+                )
+                results.append((time.perf_counter() - started, status))
+            return results
+
+        async def main():
+            chunks = await asyncio.gather(*(client(i) for i in range(concurrency)))
+            return [r for chunk in chunks for r in chunk]
+
+        return asyncio.run(main())
+
+    async def _asgi_request(self, handler, path) -> int:
+        url = urlsplit(path)
+        scope = {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": "GET",
+            "scheme": "http",
+            "path": url.path,
+            "raw_path": url.path.encode(),
+            "query_string": url.query.encode(),
+            "root_path": "",
+            "headers": [(b"host", b"localhost")],
+            "server": ("localhost", 80),
+            "client": ("127.0.0.1", 50000),
+        }
+        disconnected = asyncio.Event()
+        sent_body = False
+
+        async def receive():
+            nonlocal sent_body
+            if not sent_body:
+                sent_body = True
+                return {"type": "http.request", "body": b"", "more_body": False}
+            # Django слушает disconnect, пока работает view
+            await disconnected.wait()
+            return {"type": "http.disconnect"}
+
+        status = []
+
+        async def send(message):
+            if message["type"] == "http.response.start":
+                status.append(message["status"])
+
+        await handler(scope, receive, send)
+        disconnected.set()
+        return status[0]
@@ -0,0 +1,111 @@
+# bike/management/commands/bench_bike_pagination.py
+import random
+import statistics
+import time
+
+from asgiref.sync import async_to_sync
+from django.core.management.base import BaseCommand
+from django.test import RequestFactory
+
+from bike.models import Bike, Station
+from bike.pagination import encode_cursor
+from bike.views import BikeView
+
+
+class Command(BaseCommand):
+    help = "Compare OFFSET (Paginator) and cursor pagination latency of BikeView.get."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--bikes",
+            type=int,
+            default=1_000_000,
+            help="How many bikes the table should hold.",
+        )
+        parser.add_argument("--per-page", type=int, default=20, help="Page size.")
+        parser.add_argument(
+            "--pages",
+            default="1,100,1000,10000,49999",
+            help="Comma separated page numbers to measure.",
+        )
+        parser.add_argument(
+            "--repeat",
+            type=int,
+            default=5,
+            help="Runs per measurement (median is reported).",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=10_000,
+            help="bulk_create batch size for seeding.",
+        )
+
+    def handle(self, *args, **opts):
+        per_page = opts["per_page"]
+        pages = [int(p) for p in opts["pages"].split(",") if p.strip()]
+
+        self._seed(opts["bikes"], opts["batch_size"])
+
+        # BikeView асинхронный — меряем его синхронно, как под WSGI
+        view = async_to_sync(BikeView.as_view())
+        factory = RequestFactory()
+        ids = Bike.objects.order_by("id").values_list("id", flat=True)
+
+        self.stdout.write(f"{'page':>8} {'offset, ms':>12} {'cursor, ms':>12}")
+        for page in pages:
+            offset = (page - 1) * per_page
+            cursor = encode_cursor(ids[offset - 1]) if offset else ""
+
+            offset_ms = self._measure(
+                view,
+                factory.get("/bikes/bikes/", {"page": page, "per_page": per_page}),
+                opts["repeat"],
+            )
+            cursor_ms = self._measure(
+                view,
+                factory.get("/bikes/bikes/", {"cursor": cursor, "per_page": per_page}),
+                opts["repeat"],
+            )
+            self.stdout.write(f"{page:>8} {offset_ms:>12.2f} {cursor_ms:>12.2f}")
+
+    # ---------------- utilities ----------------
+
+    def _measure(self, view, request, repeat: int) -> float:
+        timings = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            view(request)
+            timings.append((time.perf_counter() - started) * 1000)
+        return statistics.median(timings)
+
+    def _seed(self, total: int, batch_size: int):
+        missing = total - Bike.objects.count()
+        if missing <= 0:
+            return
+
+        self.stdout.write(f"Creating {missing} bikes…")
+        station, _ = Station.objects.get_or_create(
+            name="Benchmark station", defaults={"address": "Benchmark", "capacity": 0}
+        )
+        brands = Bike.Brand.values
+        colours = Bike.Colour.values
+        categories = Bike.Category.values
+
+        while missing > 0:
+            size = min(batch_size, missing)
+            Bike.objects.bulk_create(
+                [
+                    Bike(
+                        name=f"Bench bike {i}",
+                        brand=random.choice(brands),
+                        colour=random.choice(colours),
+                        category=random.choice(categories),
+                        station=station,
+                    )
+                    for i in range(size)
+                ],
+                batch_size=batch_size,
+            )
+            missing -= size
+        self.stdout.write(self.style.SUCCESS("Seeding done."))
@@ -0,0 +1,100 @@
+# bike/management/commands/bench_serialization.py
+import random
+import statistics
+import time
+from datetime import datetime, timezone
+
+from django.core.management.base import BaseCommand
+from django.http import JsonResponse
+
+from bike.models import Bike
+from bike.serializers import dumps_orjson, dumps_stdlib, orjson, serialize_rows
+
+FIELDS = (
+    "id",
+    "name",
+    "brand",
+    "category",
+    "electricity",
+    "colour",
+    "available",
+    "preview",
+    "updated_at",
+    "station__name",
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare JsonResponse against the bike serializer layer "
+        "on synthetic .values() pages."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=1000, help="Rows per page.")
+        parser.add_argument(
+            "--repeat", type=int, default=200, help="Pages to serialize per variant."
+        )
+
+    def handle(self, *args, **opts):
+        def page():
+            return [
+                {
+                    "id": i,
+                    "name": f"Bike {i}",
+                    "brand": random.choice(Bike.Brand.values),
+                    "category": random.choice(Bike.Category.values),
+                    "electricity": bool(i % 2),
+                    "colour": random.choice(Bike.Colour.values),
+                    "available": True,
+                    "preview": f"bike/preview/{i}.jpg" if i % 3 else None,
+                    "updated_at": datetime.now(timezone.utc),
+                    "station__name": f"Station {i % 50}",
+                }
+                for i in range(opts["rows"])
+            ]
+
+        def baseline(rows):
+            # как было: bike_to_dict/FieldFile.url на строку + JsonResponse
+            storage = Bike._meta.get_field("preview").storage
+            for row in rows:
+                row["preview"] = storage.url(row["preview"]) if row["preview"] else None
+            return JsonResponse({"results": rows}).content
+
+        variants = [("JsonResponse (stdlib)", baseline)]
+        variants.append(
+            (
+                "serialize_rows + stdlib",
+                lambda rows: dumps_stdlib(
+                    {"results": serialize_rows(Bike, FIELDS, rows)}
+                ),
+            )
+        )
+        if orjson is not None:
+            variants.append(
+                (
+                    "serialize_rows + orjson",
+                    lambda rows: dumps_orjson(
+                        {"results": serialize_rows(Bike, FIELDS, rows)}
+                    ),
+                )
+            )
+        else:
+            self.stdout.write(
+                self.style.WARNING("orjson is not installed, fast path skipped.")
+            )
+
+        self.stdout.write(
+            f"{opts['rows']} rows per page, median of {opts['repeat']} runs"
+        )
+        base_ms = None
+        for title, serialize in variants:
+            timings = []
+            for _ in range(opts["repeat"]):
+                rows = page()
+                started = time.perf_counter()
+                serialize(rows)
+                timings.append((time.perf_counter() - started) * 1000)
+            ms = statistics.median(timings)
+            base_ms = base_ms or ms
+            self.stdout.write(f"{title:<28} {ms:>8.3f} ms  ×{base_ms / ms:.1f}")
@@ -0,0 +1,67 @@
+# bike/management/commands/bench_station_nearby.py
+import random
+import statistics
+import time
+
+from django.core.management.base import BaseCommand
+
+from bike.geo import StationGrid
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure k-nearest latency of the in-memory station grid (no database needed)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--stations",
+            type=int,
+            default=50_000,
+            help="How many random stations to index.",
+        )
+        parser.add_argument(
+            "--queries",
+            type=int,
+            default=10_000,
+            help="How many random queries to run.",
+        )
+        parser.add_argument("--limit", type=int, default=10, help="k in k-nearest.")
+        parser.add_argument(
+            "--radius", type=float, default=5000, help="Search radius in meters."
+        )
+        parser.add_argument(
+            "--cell-deg", type=float, default=0.01, help="Grid cell size in degrees."
+        )
+        parser.add_argument(
+            "--seed", type=int, default=None, help="Random seed for reproducibility."
+        )
+
+    def handle(self, *args, **opts):
+        rnd = random.Random(opts["seed"])
+        # город ~ 40×40 км вокруг Минска
+        box = (53.72, 54.08, 27.25, 27.85)
+
+        def point():
+            return rnd.uniform(box[0], box[1]), rnd.uniform(box[2], box[3])
+
+        started = time.perf_counter()
+        grid = StationGrid(
+            ((i, *point()) for i in range(opts["stations"])), cell_deg=opts["cell_deg"]
+        )
+        build_ms = (time.perf_counter() - started) * 1000
+
+        timings = []
+        for _ in range(opts["queries"]):
+            lat, lon = point()
+            started = time.perf_counter()
+            grid.nearest(lat, lon, opts["radius"], opts["limit"])
+            timings.append((time.perf_counter() - started) * 1000)
+
+        timings.sort()
+        p99 = timings[int(len(timings) * 0.99) - 1]
+        self.stdout.write(
+            f"{opts['stations']} stations, index built in {build_ms:.1f} ms\n"
+            f"k={opts['limit']}: median {statistics.median(timings):.3f} ms, "
+            f"p99 {p99:.3f} ms, max {timings[-1]:.3f} ms"
+        )
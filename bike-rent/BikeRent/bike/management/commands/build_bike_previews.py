@@ -0,0 +1,56 @@
+# bike/management/commands/build_bike_previews.py
+from django.core.management.base import BaseCommand, CommandError
+
+from bike import previews
+from bike.models import Bike
+
+
+class Command(BaseCommand):
+    help = (
+        "Hash previews uploaded before the preview pipeline existed and build "
+        "their thumbnail/WebP variants (in this process, no worker pool)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--rebuild",
+            action="store_true",
+            help="Also rebuild previews that already have variants",
+        )
+
+    def handle(self, *args, **opts):
+        if previews.Image is None:
+            raise CommandError("Pillow is not installed.")
+
+        bikes = Bike.all_with_deleted.exclude(preview="").exclude(preview__isnull=True)
+        if not opts["rebuild"]:
+            bikes = bikes.filter(preview_variants={})
+
+        built = failed = 0
+        seen = set()
+        for pk, name, digest in bikes.values_list(
+            "pk", "preview", "preview_hash"
+        ).iterator():
+            try:
+                if not digest:
+                    digest = self._hash_stored(pk, name)
+                if digest in seen:
+                    continue
+                seen.add(digest)
+                previews.build_variants(digest, name)
+                built += 1
+            except Exception as e:
+                failed += 1
+                self.stderr.write(f"Bike {pk} ({name}): {e}")
+
+        self.stdout.write(self.style.SUCCESS(f"✅ Built variants for {built} previews"))
+        if failed:
+            self.stdout.write(self.style.WARNING(f"{failed} previews failed"))
+
+    # ---------------- utilities ----------------
+
+    def _hash_stored(self, pk, name) -> str:
+        with previews.storage().open(name, "rb") as f:
+            digest = previews.content_hash(f)
+        Bike.all_with_deleted.filter(pk=pk).update(preview_hash=digest)
+        return digest
@@ -0,0 +1,113 @@
+# bike/management/commands/check_query_plans.py
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+
+from bike.models import Bike
+
+
+def hot_queries():
+    """
+    Горячие запросы к bike_bike: (название, queryset, индексы).
+    Индексы — какими из них планировщик может ответить на запрос
+    (проверяется и этой командой, и bike/tests/test_query_plans.py).
+    """
+    return [
+        (
+            "list page",
+            Bike.objects.values("id", "name", "station__name").order_by("id")[:20],
+            ("bike_id_live", "bike_bike_pkey"),
+        ),
+        (
+            "free bikes at station",
+            Bike.objects.filter(station_id=1, available=True, deleted_at__isnull=True),
+            ("bike_station_available_live",),
+        ),
+        (
+            "brand + category",
+            Bike.objects.filter(brand=Bike.Brand.TREK, category=Bike.Category.CITY),
+            ("bike_brand_category_live",),
+        ),
+        (
+            "brand only",
+            Bike.objects.filter(brand=Bike.Brand.TREK),
+            ("bike_brand_category_live",),
+        ),
+        (
+            "list ordered by brand",
+            Bike.objects.filter(brand=Bike.Brand.TREK).order_by(
+                "brand", "category", "id"
+            )[:20],
+            ("bike_brand_category_live",),
+        ),
+        (
+            "admin ordering by -name",
+            Bike.objects.order_by("-name")[:100],
+            ("bike_name_desc_live",),
+        ),
+    ]
+
+
+def bike_scans(cursor, qs) -> list:
+    """Узлы плана EXPLAIN, которые читают таблицу велосипедов"""
+    sql, params = qs.query.sql_with_params()
+    cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+    plan = cursor.fetchone()[0]
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return [
+        node
+        for node in _walk(plan[0]["Plan"])
+        if node.get("Relation Name") == Bike._meta.db_table
+    ]
+
+
+def _walk(node):
+    yield node
+    for child in node.get("Plans", []):
+        yield from _walk(child)
+
+
+class Command(BaseCommand):
+    help = (
+        "EXPLAIN every hot bike query with seq scans disabled and fail "
+        "if any of them still has to Seq Scan the bike table or misses its index."
+    )
+
+    def handle(self, *args, **opts):
+        if connection.vendor != "postgresql":
+            raise CommandError("Query plan checks need PostgreSQL.")
+
+        table = Bike._meta.db_table
+        failed = []
+
+        # enable_seqscan = off: на маленькой таблице планировщик и так выберет
+        # seq scan, а нам важно, есть ли вообще индекс, которым можно ответить.
+        with transaction.atomic():
+            with connection.cursor() as cursor:
+                cursor.execute("SET LOCAL enable_seqscan = off")
+                for title, qs, indexes in hot_queries():
+                    nodes = bike_scans(cursor, qs)
+                    used = {node.get("Index Name") for node in nodes}
+                    if any(node["Node Type"] == "Seq Scan" for node in nodes):
+                        failed.append(title)
+                        self.stdout.write(
+                            self.style.ERROR(f"✗ {title}: Seq Scan on {table}")
+                        )
+                    elif not used & set(indexes):
+                        failed.append(title)
+                        self.stdout.write(
+                            self.style.ERROR(
+                                f"✗ {title}: {', '.join(sorted(filter(None, used)))}, "
+                                f"expected {' / '.join(indexes)}"
+                            )
+                        )
+                    else:
+                        names = ", ".join(
+                            node.get("Index Name", node["Node Type"]) for node in nodes
+                        )
+                        self.stdout.write(self.style.SUCCESS(f"✓ {title}: {names}"))
+
+        if failed:
+            raise CommandError(f"Unexpected plan for {table} in: {', '.join(failed)}")
@@ -0,0 +1,61 @@
+# bike/management/commands/reconcile_station_counters.py
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from bike.counters import actual_station_counts
+from bike.models import Bike, Station
+
+
+class Command(BaseCommand):
+    help = "Recount Station.total_count / available_count from bikes and repair drift."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--dry-run", action="store_true", help="Only report stations with drift."
+        )
+        parser.add_argument(
+            "--batch-size", type=int, default=1000, help="bulk_update batch size."
+        )
+
+    def handle(self, *args, **opts):
+        with transaction.atomic():
+            # сначала блокируем станции, потом считаем: дельта счётчика,
+            # закоммиченная между подсчётом и блокировкой, иначе была бы
+            # перезаписана старым числом. Дельты, которые ждут блокировки,
+            # лягут поверх уже после коммита
+            stations = list(
+                Station.objects.select_for_update()
+                .only("id", "name", "total_count", "available_count")
+                .order_by("id")
+            )
+            actual = actual_station_counts(Bike.objects.all())
+            drifted = []
+            for station in stations:
+                total, available = actual.get(station.id, (0, 0))
+                if (station.total_count, station.available_count) == (total, available):
+                    continue
+                self.stdout.write(
+                    f"{station.name}: total {station.total_count} → {total}, "
+                    f"available {station.available_count} → {available}"
+                )
+                station.total_count = total
+                station.available_count = available
+                drifted.append(station)
+
+            if drifted and not opts["dry_run"]:
+                Station.objects.bulk_update(
+                    drifted,
+                    ["total_count", "available_count"],
+                    batch_size=opts["batch_size"],
+                )
+
+        if not drifted:
+            self.stdout.write(self.style.SUCCESS("✅ Station counters are consistent."))
+        elif opts["dry_run"]:
+            self.stdout.write(
+                self.style.WARNING(f"{len(drifted)} stations have drift (dry run).")
+            )
+        else:
+            self.stdout.write(
+                self.style.SUCCESS(f"✅ Repaired {len(drifted)} stations.")
+            )
@@ -0,0 +1,31 @@
+# bike/managers.py
+from django.db import transaction
+
+from common.models import SoftDeleteManager, SoftDeleteQuerySet
+
+
+class BikeQuerySet(SoftDeleteQuerySet):
+    def delete(self):
+        """
+        Мягкое удаление пачкой. update() не шлёт сигналы, поэтому счётчики
+        станций и кэши поправляем здесь же.
+        """
+        from bike.counters import CounterDeltas, actual_station_counts
+        from bike.counting import invalidate_count_cache
+        from bike.detail_cache import invalidate_all_bikes
+
+        with transaction.atomic():
+            alive = self.filter(deleted_at__isnull=True)
+            deltas = CounterDeltas()
+            for station_id, (total, available) in actual_station_counts(alive).items():
+                deltas.change(station_id, total=-total, available=-available)
+            deleted = super().delete()
+            deltas.apply()
+            invalidate_all_bikes()
+        invalidate_count_cache()
+        return deleted
+
+    delete.queryset_only = True
+
+
+BikeManager = SoftDeleteManager.from_queryset(BikeQuerySet)
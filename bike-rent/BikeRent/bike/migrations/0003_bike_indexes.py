@@ -0,0 +1,33 @@
+# Generated by Django 5.2.5 on 2026-10-18 14:07
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("bike", "0002_bike_created_at_bike_deleted_at_bike_owner_and_more"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="bike",
+            index=models.Index(
+                condition=models.Q(("deleted_at__isnull", True)),
+                fields=["station", "available"],
+                name="bike_station_available_live",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="bike",
+            index=models.Index(
+                fields=["brand", "category"], name="bike_brand_category_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="bike",
+            index=models.Index(fields=["-name"], name="bike_name_desc_idx"),
+        ),
+    ]
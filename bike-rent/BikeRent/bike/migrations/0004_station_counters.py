@@ -0,0 +1,47 @@
+# Generated by Django 5.2.5 on 2026-10-18 14:09
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Q, Subquery
+from django.db.models.functions import Coalesce
+
+
+def fill_station_counters(apps, schema_editor):
+    Bike = apps.get_model("bike", "Bike")
+    Station = apps.get_model("bike", "Station")
+
+    def bikes_count(condition=Q()):
+        return Coalesce(
+            Subquery(
+                Bike.objects.filter(condition, station=OuterRef("pk"))
+                .values("station")
+                .annotate(n=Count("id"))
+                .values("n")
+            ),
+            0,
+        )
+
+    Station.objects.update(
+        total_count=bikes_count(),
+        available_count=bikes_count(Q(available=True)),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("bike", "0003_bike_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="station",
+            name="available_count",
+            field=models.IntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="station",
+            name="total_count",
+            field=models.IntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(fill_station_counters, migrations.RunPython.noop),
+    ]
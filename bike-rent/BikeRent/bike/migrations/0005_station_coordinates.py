@@ -0,0 +1,44 @@
+# Generated by Django 5.2.5 on 2026-10-18 14:10
+
+import django.core.validators
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("bike", "0004_station_counters"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="station",
+            name="latitude",
+            field=models.FloatField(
+                blank=True,
+                null=True,
+                validators=[
+                    django.core.validators.MinValueValidator(-90),
+                    django.core.validators.MaxValueValidator(90),
+                ],
+            ),
+        ),
+        migrations.AddField(
+            model_name="station",
+            name="longitude",
+            field=models.FloatField(
+                blank=True,
+                null=True,
+                validators=[
+                    django.core.validators.MinValueValidator(-180),
+                    django.core.validators.MaxValueValidator(180),
+                ],
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="station",
+            index=models.Index(
+                fields=["latitude", "longitude"], name="station_lat_lon_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,124 @@
+# Generated by Django 5.2.5 on 2026-10-18 14:16
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.conf import settings
+from django.db import migrations, models
+
+BATCH_SIZE = 2000
+
+
+def split_comments(apps, schema_editor):
+    """Каждая непустая строка Bike.comments становится событием журнала"""
+    Bike = apps.get_model("bike", "Bike")
+    BikeEvent = apps.get_model("bike", "BikeEvent")
+
+    bikes = (
+        Bike.objects.exclude(comments__isnull=True)
+        .exclude(comments="")
+        .values_list("id", "comments", "created_at")
+    )
+    events = []
+    for bike_id, comments, created_at in bikes.iterator(chunk_size=BATCH_SIZE):
+        for line in comments.splitlines():
+            if line.strip():
+                events.append(
+                    BikeEvent(
+                        bike_id=bike_id,
+                        kind="legacy",
+                        text=line.strip(),
+                        created_at=created_at,
+                    )
+                )
+        if len(events) >= BATCH_SIZE:
+            BikeEvent.objects.bulk_create(events, batch_size=BATCH_SIZE)
+            events = []
+    BikeEvent.objects.bulk_create(events, batch_size=BATCH_SIZE)
+
+
+def join_comments(apps, schema_editor):
+    Bike = apps.get_model("bike", "Bike")
+    BikeEvent = apps.get_model("bike", "BikeEvent")
+
+    history = {}
+    for bike_id, text in (
+        BikeEvent.objects.order_by("bike_id", "created_at", "id")
+        .values_list("bike_id", "text")
+        .iterator(chunk_size=BATCH_SIZE)
+    ):
+        history.setdefault(bike_id, []).append(text)
+    for bike_id, lines in history.items():
+        Bike.objects.filter(pk=bike_id).update(comments="\n".join(lines))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("bike", "0005_station_coordinates"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="BikeEvent",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "kind",
+                    models.CharField(
+                        choices=[
+                            ("note", "Заметка"),
+                            ("maintenance", "Обслуживание"),
+                            ("legacy", "Из старой истории"),
+                        ],
+                        default="note",
+                        max_length=20,
+                    ),
+                ),
+                ("text", models.TextField()),
+                ("created_at", models.DateTimeField(default=django.utils.timezone.now)),
+                (
+                    "author",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="+",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+                (
+                    "bike",
+                    models.ForeignKey(
+                        db_index=False,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="events",
+                        to="bike.bike",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Bike event",
+                "verbose_name_plural": "Bike events",
+                "indexes": [
+                    models.Index(
+                        fields=["bike", "created_at"],
+                        name="bike_event_bike_created_idx",
+                    )
+                ],
+            },
+        ),
+        migrations.RunPython(split_comments, join_comments),
+        migrations.RemoveField(
+            model_name="bike",
+            name="comments",
+        ),
+    ]
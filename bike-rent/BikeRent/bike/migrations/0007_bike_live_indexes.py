@@ -0,0 +1,47 @@
+# Generated by Django 5.2.5 on 2026-10-18 14:18
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("bike", "0006_bike_events"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="bike",
+            name="bike_brand_category_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="bike",
+            name="bike_name_desc_idx",
+        ),
+        migrations.AddIndex(
+            model_name="bike",
+            index=models.Index(
+                condition=models.Q(("deleted_at__isnull", True)),
+                fields=["brand", "category"],
+                name="bike_brand_category_live",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="bike",
+            index=models.Index(
+                condition=models.Q(("deleted_at__isnull", True)),
+                fields=["-name"],
+                name="bike_name_desc_live",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="bike",
+            index=models.Index(
+                condition=models.Q(("deleted_at__isnull", True)),
+                fields=["id"],
+                name="bike_id_live",
+            ),
+        ),
+    ]
@@ -0,0 +1,38 @@
+# Generated by Django 5.2.5 on 2026-10-18 14:24
+
+import bike.models.fields
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("bike", "0007_bike_live_indexes"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="bike",
+            name="preview_hash",
+            field=models.CharField(
+                blank=True, default="", editable=False, max_length=64
+            ),
+        ),
+        migrations.AddField(
+            model_name="bike",
+            name="preview_variants",
+            field=bike.models.fields.FileVariantsField(
+                blank=True, default=dict, editable=False
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="bike",
+            index=models.Index(
+                condition=models.Q(("preview_hash", ""), _negated=True),
+                fields=["preview_hash"],
+                name="bike_preview_hash_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.2.5 on 2026-10-18 14:46
+
+import bike.models.fields
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("bike", "0008_bike_preview_variants"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="bike",
+            name="preview_variants",
+            field=bike.models.fields.FileVariantsField(
+                blank=True, default=dict, editable=False, file_field="preview"
+            ),
+        ),
+    ]
@@ -1,7 +1,9 @@
 from .bike import Bike
+from .event import BikeEvent
 from .station import Station
 
 __all__ = [
     "Bike",
+    "BikeEvent",
     "Station",
 ]
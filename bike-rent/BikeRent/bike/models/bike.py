@@ -1,11 +1,14 @@
 from django.contrib.auth import get_user_model
 from django.db import models
-from common.models import TimeStampedMixin
+
+from bike.managers import BikeManager, BikeQuerySet
+from bike.models.fields import FileVariantsField
+from common.models import BaseModel
 
 User = get_user_model()
 
 
-class Bike(TimeStampedMixin, models.Model):
+class Bike(BaseModel):
     class Category(models.TextChoices):
         ROAD = "road", "Шоссейный"
         MTB = "mtb", "Горный"
@@ -49,21 +52,77 @@ class Bike(TimeStampedMixin, models.Model):
     )
     available = models.BooleanField(default=True)
 
-    comments = models.TextField(
-        blank=True,
-        null=True,
-        verbose_name="Bike History",
-        help_text="Тут мы храним всю историю о велосипеде и его обслуживании",
-    )
+    # история и обслуживание — в журнале BikeEvent (bike.events)
     preview = models.FileField(upload_to="bike/preview", blank=True, null=True)
+    # sha256 содержимого preview: одинаковые загрузки делят файл и варианты
+    preview_hash = models.CharField(
+        max_length=64, blank=True, default="", editable=False
+    )
+    # уменьшенные копии, их готовит bike/previews.py в фоне
+    preview_variants = FileVariantsField(
+        file_field="preview", default=dict, blank=True, editable=False
+    )
 
     station = models.ForeignKey(
         "bike.Station", on_delete=models.PROTECT, related_name="bikes"
     )
 
+    objects = BikeManager()
+    all_with_deleted = models.Manager.from_queryset(BikeQuerySet)()
+
     class Meta:
         verbose_name = "Bicycle"
         verbose_name_plural = "Bicycles"
+        indexes = [
+            # свободные велосипеды на станции (только живые строки)
+            models.Index(
+                fields=["station", "available"],
+                condition=models.Q(deleted_at__isnull=True),
+                name="bike_station_available_live",
+            ),
+            # фильтры списка и админки по бренду/категории
+            models.Index(
+                fields=["brand", "category"],
+                condition=models.Q(deleted_at__isnull=True),
+                name="bike_brand_category_live",
+            ),
+            # сортировка админки ordering = ("-name",)
+            models.Index(
+                fields=["-name"],
+                condition=models.Q(deleted_at__isnull=True),
+                name="bike_name_desc_live",
+            ),
+            # велосипеды с тем же файлом превью
+            models.Index(
+                fields=["preview_hash"],
+                condition=~models.Q(preview_hash=""),
+                name="bike_preview_hash_idx",
+            ),
+            # список по id без удалённых строк
+            models.Index(
+                fields=["id"],
+                condition=models.Q(deleted_at__isnull=True),
+                name="bike_id_live",
+            ),
+        ]
 
     def __str__(self):
         return f"Bike name {self.name or 'No name'}"
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # состояние из БД для счётчиков станций (см. bike/counters.py);
+        # None, если нужные поля не загружались (.only/.defer)
+        loaded = instance.__dict__
+        if {"station_id", "available", "deleted_at"} <= loaded.keys():
+            instance._counter_state = counter_state(instance)
+        else:
+            instance._counter_state = None
+        return instance
+
+
+def counter_state(bike) -> tuple:
+    """(station_id, available) для счётчиков; удалённый велосипед не на станции"""
+    station_id = bike.station_id if bike.deleted_at is None else None
+    return station_id, bike.available
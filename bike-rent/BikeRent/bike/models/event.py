@@ -0,0 +1,50 @@
+from django.conf import settings
+from django.db import models
+from django.utils import timezone
+
+
+class BikeEvent(models.Model):
+    """
+    Журнал истории и обслуживания велосипеда (раньше — Bike.comments).
+    Только добавление: записи не изменяются.
+    """
+
+    class Kind(models.TextChoices):
+        NOTE = "note", "Заметка"
+        MAINTENANCE = "maintenance", "Обслуживание"
+        LEGACY = "legacy", "Из старой истории"
+
+    bike = models.ForeignKey(
+        "bike.Bike",
+        on_delete=models.CASCADE,
+        related_name="events",
+        # индекс (bike_id, created_at) ниже покрывает и поиск по bike_id
+        db_index=False,
+    )
+    kind = models.CharField(max_length=20, choices=Kind.choices, default=Kind.NOTE)
+    text = models.TextField()
+    author = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.SET_NULL,
+        related_name="+",
+        blank=True,
+        null=True,
+    )
+    created_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        verbose_name = "Bike event"
+        verbose_name_plural = "Bike events"
+        indexes = [
+            models.Index(
+                fields=["bike", "created_at"], name="bike_event_bike_created_idx"
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.get_kind_display()} for bike {self.bike_id}"
+
+    def save(self, *args, **kwargs):
+        if not self._state.adding:
+            raise ValueError("BikeEvent is append-only")
+        super().save(*args, **kwargs)
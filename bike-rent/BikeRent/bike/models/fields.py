@@ -0,0 +1,29 @@
+from django.core.files.storage import default_storage
+from django.db import models
+
+
+class FileVariantsField(models.JSONField):
+    """
+    {вариант: имя файла в storage}; в API отдаётся как {вариант: url}.
+    file_field — FileField той же модели, в storage которого лежат варианты.
+    """
+
+    def __init__(self, *args, file_field: str | None = None, **kwargs):
+        self.file_field = file_field
+        super().__init__(*args, **kwargs)
+
+    def deconstruct(self):
+        name, path, args, kwargs = super().deconstruct()
+        if self.file_field is not None:
+            kwargs["file_field"] = self.file_field
+        return name, path, args, kwargs
+
+    @property
+    def storage(self):
+        if self.file_field is None:
+            return default_storage
+        return self.model._meta.get_field(self.file_field).storage
+
+    def to_urls(self, value: dict) -> dict:
+        files = self.storage
+        return {variant: files.url(name) for variant, name in value.items()}
@@ -1,3 +1,4 @@
+from django.core.validators import MaxValueValidator, MinValueValidator
 from django.db import models
 
 
@@ -5,10 +6,29 @@ class Station(models.Model):
     name = models.CharField(max_length=2025, unique=True)
     address = models.CharField(max_length=1024)
     capacity = models.IntegerField(default=0)
+    latitude = models.FloatField(
+        blank=True,
+        null=True,
+        validators=[MinValueValidator(-90), MaxValueValidator(90)],
+    )
+    longitude = models.FloatField(
+        blank=True,
+        null=True,
+        validators=[MinValueValidator(-180), MaxValueValidator(180)],
+    )
+
+    # денормализованные счётчики, поддерживаются в bike/signals.py,
+    # починка расхождений — manage.py reconcile_station_counters
+    total_count = models.IntegerField(default=0, editable=False)
+    available_count = models.IntegerField(default=0, editable=False)
 
     class Meta:
         verbose_name = "Station"
         verbose_name_plural = "Stations"
+        indexes = [
+            # bounding box поиск ближайших станций без in-memory индекса
+            models.Index(fields=["latitude", "longitude"], name="station_lat_lon_idx"),
+        ]
 
     def __str__(self):
         return f"Station {self.name} ({self.address})"
@@ -0,0 +1,109 @@
+import base64
+import binascii
+import json
+
+from django.core.paginator import Paginator
+from django.utils.functional import cached_property
+
+from bike.counting import estimate_count
+
+
+class InvalidCursor(ValueError):
+    pass
+
+
+class CountedPaginator(Paginator):
+    """Paginator, которому общее число строк передаётся снаружи (без своего COUNT(*))"""
+
+    def __init__(self, object_list, per_page, count: int, **kwargs):
+        super().__init__(object_list, per_page, **kwargs)
+        self._count = count
+
+    @property
+    def count(self):
+        return self._count
+
+
+class EstimatedCountPaginator(Paginator):
+    """
+    Paginator для админки: на больших таблицах вместо COUNT(*) берётся
+    оценка планировщика Postgres, маленькие считаются точно.
+    Оценка — только для списка без фильтров и поиска: по условиям EXPLAIN
+    ошибается в разы, и админ видит пустые последние страницы.
+    """
+
+    exact_count_threshold = 10_000
+
+    @cached_property
+    def count(self):
+        if self._is_filtered():
+            return self.object_list.count()
+        estimate = estimate_count(self.object_list)
+        if estimate is None or estimate < self.exact_count_threshold:
+            return self.object_list.count()
+        return estimate
+
+    def _is_filtered(self) -> bool:
+        where = self.object_list.query.where
+        if not where:
+            return False
+        # условие менеджера по умолчанию (deleted_at IS NULL) фильтром не считается
+        base = self.object_list.model._default_manager.get_queryset().query.where
+        return where != base
+
+
+def encode_cursor(last_id: int) -> str:
+    """Упаковывает id последней строки страницы в непрозрачный курсор"""
+    raw = json.dumps({"id": last_id}, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> int | None:
+    """Возвращает id, после которого начинается страница (None — с начала)"""
+    if not cursor:
+        return None
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        last_id = int(payload["id"])
+    except (binascii.Error, ValueError, TypeError, KeyError, UnicodeDecodeError):
+        raise InvalidCursor(cursor)
+    return last_id
+
+
+def _cursor_queryset(qs, cursor: str, descending: bool):
+    last_id = decode_cursor(cursor)
+    if last_id is not None:
+        qs = qs.filter(id__lt=last_id) if descending else qs.filter(id__gt=last_id)
+    return qs
+
+
+def _cursor_page(rows: list, per_page: int) -> dict:
+    has_next = len(rows) > per_page
+    rows = rows[:per_page]
+    return {
+        "per_page": per_page,
+        "next_cursor": encode_cursor(rows[-1]["id"]) if has_next else None,
+        "results": rows,
+    }
+
+
+def paginate_by_cursor(
+    qs, cursor: str, per_page: int, descending: bool = False
+) -> dict:
+    """
+    Keyset-пагинация: WHERE id > last_id ORDER BY id LIMIT per_page + 1
+    (для descending — id < last_id ORDER BY -id).
+    Без COUNT(*) и OFFSET — глубокие страницы стоят столько же, сколько первая.
+    qs должен быть отсортирован по id в том же направлении.
+    """
+    qs = _cursor_queryset(qs, cursor, descending)
+    return _cursor_page(list(qs[: per_page + 1]), per_page)
+
+
+async def apaginate_by_cursor(
+    qs, cursor: str, per_page: int, descending: bool = False
+) -> dict:
+    """paginate_by_cursor для async-представлений"""
+    qs = _cursor_queryset(qs, cursor, descending)
+    return _cursor_page([row async for row in qs[: per_page + 1]], per_page)
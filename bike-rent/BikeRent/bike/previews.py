@@ -0,0 +1,174 @@
+import hashlib
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.db import connections, transaction
+from django.utils import timezone
+
+from bike.detail_cache import invalidate_bikes
+from bike.models import Bike
+
+try:
+    from PIL import Image, ImageOps, UnidentifiedImageError
+except ImportError:  # Pillow не обязателен, без него отдаётся только оригинал
+    Image = None
+
+logger = logging.getLogger(__name__)
+
+# вариант -> (максимальная сторона в px, формат)
+VARIANTS = {
+    "thumb": (320, "JPEG"),
+    "thumb_webp": (320, "WEBP"),
+    "medium_webp": (1024, "WEBP"),
+}
+EXTENSIONS = {"JPEG": "jpg", "WEBP": "webp"}
+# форматы Pillow, у которых расширение не совпадает с именем формата
+ORIGINAL_EXTENSIONS = {"JPEG": "jpg", "MPO": "jpg", "TIFF": "tif"}
+
+
+class InvalidPreview(ValueError):
+    pass
+
+
+def storage():
+    return Bike._meta.get_field("preview").storage
+
+
+def content_hash(file) -> str:
+    digest = hashlib.sha256()
+    file.seek(0)
+    for chunk in file.chunks():
+        digest.update(chunk)
+    file.seek(0)
+    return digest.hexdigest()
+
+
+def original_name(digest: str, fmt: str | None) -> str:
+    """
+    Имя по содержимому: одинаковые файлы ложатся в одно место.
+    Расширение — по формату, который определил Pillow, а не по имени от
+    клиента: полиглот картинка/HTML не должен лечь в MEDIA как .html или .svg.
+    Без Pillow формат неизвестен — без расширения.
+    """
+    if fmt is None:
+        return f"bike/preview/{digest[:2]}/{digest}"
+    ext = ORIGINAL_EXTENSIONS.get(fmt, fmt.lower())
+    return f"bike/preview/{digest[:2]}/{digest}.{ext}"
+
+
+def variant_name(digest: str, variant: str) -> str:
+    _, fmt = VARIANTS[variant]
+    return f"bike/preview/{digest[:2]}/{digest}-{variant}.{EXTENSIONS[fmt]}"
+
+
+def existing_variants(digest: str) -> dict:
+    """Варианты, уже готовые для такого же файла, или {}"""
+    names = {variant: variant_name(digest, variant) for variant in VARIANTS}
+    if Image is None or not all(storage().exists(name) for name in names.values()):
+        return {}
+    return names
+
+
+def store_preview(bike: Bike, upload) -> bool:
+    """
+    Сохраняет оригинал под именем по sha256 (повторная загрузка того же файла
+    ничего не пишет) и ставит подготовку вариантов в фоновый пул.
+    Возвращает True, если варианты уже готовы.
+    """
+    fmt = None
+    if Image is not None:
+        try:
+            with Image.open(upload) as image:
+                fmt = image.format
+                image.verify()
+        except Image.DecompressionBombError:
+            raise InvalidPreview("Слишком большое изображение")
+        except (UnidentifiedImageError, OSError, SyntaxError):
+            raise InvalidPreview("Файл не является изображением")
+
+    digest = content_hash(upload)
+    name = original_name(digest, fmt)
+    if not storage().exists(name):
+        name = storage().save(name, upload)
+
+    variants = existing_variants(digest)
+    bike.preview = name
+    bike.preview_hash = digest
+    bike.preview_variants = variants
+    bike.save(
+        update_fields=["preview", "preview_hash", "preview_variants", "updated_at"]
+    )
+    if not variants and Image is not None:
+        transaction.on_commit(lambda: submit(digest, name))
+    return bool(variants)
+
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def get_executor() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=settings.BIKE_PREVIEW_WORKERS,
+                    thread_name_prefix="bike-preview",
+                )
+    return _executor
+
+
+def submit(digest: str, name: str):
+    if getattr(settings, "BIKE_PREVIEW_WORKERS", 2) <= 0:
+        build_variants(digest, name)
+        return
+    get_executor().submit(_run_in_worker, digest, name)
+
+
+def _run_in_worker(digest: str, name: str):
+    try:
+        build_variants(digest, name)
+    except Exception:
+        logger.exception("Preview %s: failed to build variants", name)
+    finally:
+        # соединения с БД у потока свои — не оставляем их висеть
+        connections.close_all()
+
+
+def build_variants(digest: str, name: str) -> dict:
+    """
+    Уменьшенные копии оригинала; уже существующие не пересчитываются.
+    Записывает варианты всем велосипедам с этим файлом.
+    """
+    files = storage()
+    with files.open(name, "rb") as f:
+        image = ImageOps.exif_transpose(Image.open(f))
+        image.load()
+
+    variants = {}
+    for variant, (size, fmt) in VARIANTS.items():
+        target = variant_name(digest, variant)
+        if not files.exists(target):
+            resized = image.copy()
+            resized.thumbnail((size, size))
+            if fmt == "JPEG" and resized.mode not in ("RGB", "L"):
+                resized = resized.convert("RGB")
+            buffer = BytesIO()
+            resized.save(buffer, fmt, quality=80)
+            target = files.save(target, ContentFile(buffer.getvalue()))
+        variants[variant] = target
+
+    with transaction.atomic():
+        bikes = Bike.all_with_deleted.filter(preview_hash=digest)
+        pks = list(bikes.values_list("pk", flat=True))
+        # update() без сигналов: счётчики не меняются, кэш и ETag правим сами
+        bikes.filter(pk__in=pks).update(
+            preview_variants=variants, updated_at=timezone.now()
+        )
+        invalidate_bikes(pks)
+    return variants
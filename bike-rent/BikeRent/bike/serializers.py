@@ -0,0 +1,112 @@
+import json
+from functools import lru_cache
+
+from django.core.exceptions import FieldDoesNotExist
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import models
+from django.http import HttpResponse
+
+from bike.models.fields import FileVariantsField
+
+try:
+    import orjson
+except ImportError:  # orjson не обязателен, без него работает stdlib json
+    orjson = None
+
+_django_encoder = DjangoJSONEncoder()
+
+
+def dumps_stdlib(data) -> bytes:
+    return json.dumps(data, cls=DjangoJSONEncoder).encode()
+
+
+def dumps_orjson(data) -> bytes:
+    # datetime отдаём в DjangoJSONEncoder, чтобы формат не зависел от того,
+    # установлен ли orjson
+    return orjson.dumps(
+        data,
+        default=_django_encoder.default,
+        option=orjson.OPT_PASSTHROUGH_DATETIME,
+    )
+
+
+dumps = dumps_orjson if orjson is not None else dumps_stdlib
+
+
+class FastJsonResponse(HttpResponse):
+    """Аналог JsonResponse на быстром dumps (orjson, если установлен)"""
+
+    def __init__(self, data, **kwargs):
+        kwargs.setdefault("content_type", "application/json")
+        super().__init__(content=dumps(data), **kwargs)
+
+
+def _resolve_field(model, lookup: str):
+    """Поле модели по пути из .values(), например station__name"""
+    *relations, name = lookup.split("__")
+    try:
+        for relation in relations:
+            model = model._meta.get_field(relation).related_model
+        return model._meta.get_field(name)
+    except (FieldDoesNotExist, AttributeError):
+        # аннотации и т.п. — отдаём как есть
+        return None
+
+
+def _file_url(storage):
+    def encode(name):
+        return storage.url(name) if name else None
+
+    return encode
+
+
+def _encoder_for(field):
+    if isinstance(field, FileVariantsField):
+        return field.to_urls
+    if isinstance(field, models.FileField):
+        return _file_url(field.storage)
+    if isinstance(field, (models.DateTimeField, models.DateField, models.TimeField)):
+        return _django_encoder.default
+    if isinstance(field, (models.DecimalField, models.UUIDField)):
+        return str
+    return None
+
+
+@lru_cache(maxsize=None)
+def field_encoders(model, fields: tuple) -> tuple:
+    """
+    Заранее вычисленные преобразования для полей, которые json/orjson
+    не сериализуют сами как надо: (имя, функция). Остальные поля не трогаем.
+    """
+    encoders = []
+    for name in fields:
+        encoder = _encoder_for(_resolve_field(model, name))
+        if encoder is not None:
+            encoders.append((name, encoder))
+    return tuple(encoders)
+
+
+def _encode_row(row: dict, encoders: tuple) -> dict:
+    for name, encoder in encoders:
+        value = row[name]
+        if value is not None:
+            row[name] = encoder(value)
+    return row
+
+
+def serialize_rows(model, fields, rows) -> list:
+    """Готовит строки .values() к dumps без создания экземпляров модели"""
+    encoders = field_encoders(model, tuple(fields))
+    rows = rows if isinstance(rows, list) else list(rows)
+    if not encoders:
+        return rows
+    for row in rows:
+        _encode_row(row, encoders)
+    return rows
+
+
+def iter_serialized_rows(model, fields, rows):
+    """serialize_rows для потока строк (выгрузка): без списка в памяти"""
+    encoders = field_encoders(model, tuple(fields))
+    for row in rows:
+        yield _encode_row(row, encoders)
@@ -0,0 +1,78 @@
+# bike/signals.py
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from .counters import CounterDeltas
+from .counting import invalidate_count_cache
+from .detail_cache import invalidate_all_bikes, invalidate_bikes
+from .geo import invalidate_station_index
+from .models import Bike, Station
+from .models.bike import counter_state
+
+
+@receiver(post_save, sender=Bike)
+def invalidate_count_on_bike_create(
+    sender, instance: Bike, created: bool, update_fields, **kwargs
+):
+    # создание или мягкое удаление/восстановление
+    if created or (update_fields and "deleted_at" in update_fields):
+        invalidate_count_cache()
+
+
+@receiver(post_delete, sender=Bike)
+def invalidate_count_on_bike_delete(sender, instance: Bike, **kwargs):
+    invalidate_count_cache()
+
+
+@receiver(pre_save, sender=Bike)
+def load_counter_state(sender, instance: Bike, raw: bool, **kwargs):
+    # строку загружали без station_id/available — добираем их одним запросом
+    if raw or instance._state.adding or getattr(instance, "_counter_state", None):
+        return
+    loaded = (
+        Bike.all_with_deleted.filter(pk=instance.pk)
+        .only("id", "station_id", "available", "deleted_at")
+        .first()
+    )
+    instance._counter_state = loaded._counter_state if loaded else None
+
+
+@receiver(post_save, sender=Bike)
+def update_station_counters_on_save(
+    sender, instance: Bike, created: bool, raw: bool, **kwargs
+):
+    if raw:
+        return
+    deltas = CounterDeltas()
+    if created:
+        deltas.add(*counter_state(instance))
+    elif instance._counter_state is not None:
+        deltas.move(instance._counter_state, counter_state(instance))
+    deltas.apply()
+    instance._counter_state = counter_state(instance)
+
+
+@receiver(post_delete, sender=Bike)
+def update_station_counters_on_delete(sender, instance: Bike, **kwargs):
+    deltas = CounterDeltas()
+    state = getattr(instance, "_counter_state", None) or counter_state(instance)
+    deltas.add(*state, sign=-1)
+    deltas.apply()
+
+
+@receiver(post_save, sender=Bike)
+@receiver(post_delete, sender=Bike)
+def invalidate_bike_detail_cache(sender, instance: Bike, **kwargs):
+    invalidate_bikes([instance.pk])
+
+
+@receiver(post_save, sender=Station)
+@receiver(post_delete, sender=Station)
+def invalidate_station_index_on_change(sender, instance: Station, **kwargs):
+    invalidate_station_index()
+
+
+@receiver(post_save, sender=Station)
+@receiver(post_delete, sender=Station)
+def invalidate_bike_detail_cache_on_station_change(sender, instance: Station, **kwargs):
+    invalidate_all_bikes()
@@ -0,0 +1,147 @@
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.urls import reverse
+
+from bike.models import Bike, Station
+from bike.pagination import EstimatedCountPaginator
+
+# COUNT страницы и сама страница со станциями JOIN'ом; сессия и пользователь
+# после первого запроса берутся из cached_db и LRU пользователей
+CHANGELIST_QUERY_BUDGET = 2
+
+
+class BikeChangelistQueryBudgetTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = get_user_model().objects.create_superuser(
+            email="admin@example.com", password=None
+        )
+        cls.stations = [
+            Station.objects.create(name=f"Station {i}", address=f"Street {i}")
+            for i in range(3)
+        ]
+        Bike.objects.bulk_create(
+            Bike(
+                name=f"Bike {i}",
+                brand=Bike.Brand.TREK,
+                colour=Bike.Colour.RED,
+                station=cls.stations[i % 3],
+            )
+            for i in range(30)
+        )
+
+    def setUp(self):
+        self.client.force_login(self.admin)
+        self.url = reverse("admin:bike_bike_changelist")
+
+    def assertPageWithinBudget(self, params, extra=0):
+        # первый запрос прогревает ContentType и кэш сессий
+        self.client.get(self.url, params)
+        with self.assertNumQueries(CHANGELIST_QUERY_BUDGET + extra):
+            response = self.client.get(self.url, params)
+        self.assertEqual(response.status_code, 200)
+        return response
+
+    def test_plain_changelist(self):
+        self.assertPageWithinBudget({})
+
+    def test_station_filter(self):
+        # + выбранная станция для autocomplete-фильтра
+        response = self.assertPageWithinBudget(
+            {"station__id__exact": self.stations[0].pk}, extra=1
+        )
+        self.assertEqual(response.context["cl"].result_count, 10)
+
+    def test_search(self):
+        response = self.assertPageWithinBudget({"q": "Bike 25"})
+        self.assertEqual(response.context["cl"].result_count, 1)
+
+
+class EstimatedCountPaginatorTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        station = Station.objects.create(name="Station", address="Street")
+        Bike.objects.create(
+            brand=Bike.Brand.TREK, colour=Bike.Colour.RED, station=station
+        )
+        Bike.objects.create(
+            brand=Bike.Brand.CUBE, colour=Bike.Colour.RED, station=station
+        )
+
+    @mock.patch("bike.pagination.estimate_count", return_value=50_000)
+    def test_unfiltered_list_uses_estimate(self, estimate):
+        paginator = EstimatedCountPaginator(Bike.objects.order_by("id"), 20)
+        self.assertEqual(paginator.count, 50_000)
+
+    @mock.patch("bike.pagination.estimate_count", return_value=50_000)
+    def test_filtered_list_is_counted_exactly(self, estimate):
+        paginator = EstimatedCountPaginator(
+            Bike.objects.filter(brand=Bike.Brand.TREK).order_by("id"), 20
+        )
+        self.assertEqual(paginator.count, 1)
+        estimate.assert_not_called()
+
+
+class BikeAdminActionTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = get_user_model().objects.create_superuser(
+            email="admin@example.com", password=None
+        )
+        cls.source = Station.objects.create(name="Source", address="Street 1")
+        cls.target = Station.objects.create(name="Target", address="Street 2")
+        cls.bikes = [
+            Bike.objects.create(
+                brand=Bike.Brand.TREK, colour=Bike.Colour.RED, station=cls.source
+            )
+            for _ in range(2)
+        ]
+
+    def setUp(self):
+        self.client.force_login(self.admin)
+
+    def run_action(self, action, **params):
+        return self.client.post(
+            reverse("admin:bike_bike_changelist"),
+            {
+                "action": action,
+                "_selected_action": [bike.pk for bike in self.bikes],
+                **params,
+            },
+            follow=True,
+        )
+
+    def messages(self, response):
+        return [str(message) for message in response.context["messages"]]
+
+    def test_move_to_station(self):
+        response = self.run_action("move_to_station", station=self.target.pk)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(Bike.objects.filter(station=self.target).count(), 2)
+        self.target.refresh_from_db()
+        self.assertEqual(self.target.total_count, 2)
+
+    def test_move_to_station_rejects_tampered_value(self):
+        for station in ("abc", "999"):
+            with self.subTest(station=station):
+                response = self.run_action("move_to_station", station=station)
+                self.assertEqual(response.status_code, 200)
+                [message] = self.messages(response)
+                self.assertTrue(message.startswith("Station:"), message)
+        self.assertEqual(Bike.objects.filter(station=self.source).count(), 2)
+
+    def test_move_to_station_without_station(self):
+        response = self.run_action("move_to_station", station="")
+        self.assertEqual(self.messages(response), ["Выберите станцию."])
+
+    def test_change_category_rejects_unknown_value(self):
+        response = self.run_action("change_category", category="bmx")
+        [message] = self.messages(response)
+        self.assertTrue(message.startswith("Category:"), message)
+        self.assertFalse(Bike.objects.exclude(category=None).exists())
+
+    def test_change_category(self):
+        self.run_action("change_category", category=Bike.Category.CITY)
+        self.assertEqual(Bike.objects.filter(category=Bike.Category.CITY).count(), 2)
@@ -0,0 +1,88 @@
+import json
+
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from bike.models import Bike, Station
+
+
+class BikeDetailPreconditionTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.station = Station.objects.create(name="Station", address="Street")
+        cls.bike = Bike.objects.create(
+            name="Old",
+            brand=Bike.Brand.TREK,
+            colour=Bike.Colour.RED,
+            station=cls.station,
+        )
+
+    def setUp(self):
+        # откат транзакции теста не запускает on_commit-сброс кэша карточек
+        cache.clear()
+        self.url = reverse("bike-view", args=[self.bike.pk])
+
+    def patch(self, data, **headers):
+        return self.client.patch(
+            self.url, json.dumps(data), content_type="application/json", headers=headers
+        )
+
+    def test_get_returns_etag(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response["ETag"].startswith('"'))
+        self.assertEqual(response.json()["name"], "Old")
+
+    def test_matching_if_match(self):
+        etag = self.client.get(self.url)["ETag"]
+        response = self.patch({"name": "New"}, if_match=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+        # кэш карточки сброшен: GET видит новое имя и новую версию
+        response = self.client.get(self.url)
+        self.assertEqual(response.json()["name"], "New")
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_stale_if_match(self):
+        etag = self.client.get(self.url)["ETag"]
+        self.assertEqual(self.patch({"name": "First"}, if_match=etag).status_code, 200)
+
+        response = self.patch({"name": "Second"}, if_match=etag)
+        self.assertEqual(response.status_code, 412)
+        self.bike.refresh_from_db()
+        self.assertEqual(self.bike.name, "First")
+
+    def test_unquoted_and_wildcard_if_match(self):
+        etag = self.client.get(self.url)["ETag"]
+        self.assertEqual(
+            self.patch({"name": "A"}, if_match=etag.strip('"')).status_code, 200
+        )
+        self.assertEqual(self.patch({"name": "B"}, if_match="*").status_code, 200)
+
+    def test_without_if_match_last_write_wins(self):
+        self.assertEqual(self.patch({"name": "New"}).status_code, 200)
+
+    def test_updates_only_changed_columns(self):
+        with CaptureQueriesContext(connection) as ctx:
+            self.patch({"name": "New", "brand": "trek"})
+        [update] = [
+            q["sql"] for q in ctx.captured_queries if q["sql"].startswith("UPDATE")
+        ]
+        self.assertIn('"name"', update)
+        self.assertNotIn('"brand"', update)
+
+    def test_nothing_changed_no_update(self):
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.patch({"name": "Old"})
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(
+            any(q["sql"].startswith("UPDATE") for q in ctx.captured_queries)
+        )
+
+    def test_body_must_be_an_object(self):
+        for body in ([], "name", 1, None):
+            with self.subTest(body=body):
+                self.assertEqual(self.patch(body).status_code, 400)
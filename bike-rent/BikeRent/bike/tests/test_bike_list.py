@@ -0,0 +1,178 @@
+from urllib.parse import urlencode
+
+from django.http import QueryDict
+from django.test import TestCase
+from django.urls import reverse
+
+from bike.filters import BIKE_ORDERINGS, parse_bike_filters
+from bike.models import Bike, Station
+from bike.pagination import InvalidCursor, decode_cursor, encode_cursor
+
+
+class BikeListTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.station = Station.objects.create(name="Station", address="Street")
+        Bike.objects.bulk_create(
+            Bike(
+                name=f"Bike {i:02}",
+                brand=Bike.Brand.TREK if i % 2 else Bike.Brand.CUBE,
+                colour=Bike.Colour.RED,
+                available=i % 3 != 0,
+                station=cls.station,
+            )
+            for i in range(25)
+        )
+        cls.ids = list(Bike.objects.order_by("id").values_list("id", flat=True))
+
+    def setUp(self):
+        self.url = reverse("bike-list")
+
+    def get(self, **params):
+        return self.client.get(self.url, params)
+
+
+class BikeListPaginationTests(BikeListTestCase):
+    def test_page(self):
+        data = self.get(per_page=10, page=3).json()
+        self.assertEqual((data["count"], data["num_pages"], data["page"]), (25, 3, 3))
+        self.assertEqual(len(data["results"]), 5)
+
+    def test_per_page_bounds(self):
+        for per_page in (0, -5, 101):
+            for params in ({}, {"cursor": ""}):
+                with self.subTest(per_page=per_page, **params):
+                    self.assertEqual(
+                        self.get(per_page=per_page, **params).status_code, 400
+                    )
+
+
+class CursorPaginationTests(BikeListTestCase):
+    def walk(self, **params) -> list:
+        ids, cursor = [], ""
+        while cursor is not None:
+            data = self.get(cursor=cursor, per_page=10, **params).json()
+            self.assertLessEqual(len(data["results"]), 10)
+            ids += [row["id"] for row in data["results"]]
+            cursor = data["next_cursor"]
+        return ids
+
+    def test_cursor_round_trip(self):
+        self.assertEqual(decode_cursor(encode_cursor(42)), 42)
+        self.assertIsNone(decode_cursor(""))
+
+    def test_walks_all_rows_in_order(self):
+        self.assertEqual(self.walk(), self.ids)
+
+    def test_descending(self):
+        self.assertEqual(self.walk(ordering="-id"), self.ids[::-1])
+
+    def test_with_filter(self):
+        expected = list(
+            Bike.objects.filter(brand=Bike.Brand.TREK)
+            .order_by("id")
+            .values_list("id", flat=True)
+        )
+        self.assertEqual(self.walk(brand="trek"), expected)
+
+    def test_no_count_query(self):
+        with self.assertNumQueries(1):
+            data = self.get(cursor="", per_page=10).json()
+        self.assertNotIn("count", data)
+
+    def test_deleted_rows_do_not_shift_pages(self):
+        first = self.get(cursor="", per_page=10).json()
+        Bike.objects.filter(pk__in=self.ids[:5]).delete()
+        second = self.get(cursor=first["next_cursor"], per_page=10).json()
+        self.assertEqual([row["id"] for row in second["results"]], self.ids[10:20])
+
+    def test_invalid_cursor(self):
+        for cursor in ("not-base64!", encode_cursor(1)[:-2] + "zz", "eyJ4IjoxfQ"):
+            with self.subTest(cursor=cursor):
+                self.assertEqual(self.get(cursor=cursor).status_code, 400)
+        with self.assertRaises(InvalidCursor):
+            decode_cursor("eyJ4IjoxfQ")
+
+    def test_cursor_needs_id_ordering(self):
+        self.assertEqual(self.get(cursor="", ordering="name").status_code, 400)
+
+
+class BikeListFilterTests(BikeListTestCase):
+    def assertRejected(self, params: dict, *fields: str):
+        response = self.get(**params)
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(set(response.json()["error"]), set(fields))
+
+    def test_invalid_values(self):
+        cases = [
+            ({"brand": "bmx"}, "brand"),
+            ({"category": "tandem"}, "category"),
+            ({"colour": ""}, "colour"),
+            ({"available": "maybe"}, "available"),
+            ({"electric": "yes"}, "electric"),
+            ({"station": "abc"}, "station"),
+            ({"station": "-1"}, "station"),
+        ]
+        for params, field in cases:
+            with self.subTest(params=params):
+                self.assertRejected(params, field)
+
+    def test_duplicate_parameters(self):
+        for name, value in (("brand", Bike.Brand.TREK), ("available", "true")):
+            with self.subTest(name=name):
+                self.assertRejected({name: [value, value]}, name)
+
+    def test_errors_are_collected(self):
+        self.assertRejected(
+            {"brand": "bmx", "available": "maybe"}, "brand", "available"
+        )
+
+    def test_unknown_ordering(self):
+        self.assertRejected({"ordering": "colour"}, "ordering")
+
+    def test_ordering_with_unindexed_filter(self):
+        cases = [
+            {"ordering": "name", "available": "true"},
+            {"ordering": "-name", "brand": Bike.Brand.TREK},
+            {"ordering": "brand", "available": "true"},
+            {"ordering": "-brand", "station": self.station.pk},
+        ]
+        for params in cases:
+            with self.subTest(params=params):
+                self.assertRejected(params, "ordering")
+
+    def test_boolean_values(self):
+        for value, expected in (
+            ("true", True),
+            ("1", True),
+            ("False", False),
+            ("0", False),
+        ):
+            with self.subTest(value=value):
+                count = Bike.objects.filter(available=expected).count()
+                self.assertEqual(self.get(available=value).json()["count"], count)
+
+    def test_filter_and_ordering_combinations(self):
+        # по одному допустимому сочетанию фильтра и сортировки на BIKE_ORDERINGS
+        cases = {
+            "id": {"available": "true"},
+            "-id": {"station": self.station.pk},
+            "name": {},
+            "-name": {},
+            "brand": {"brand": Bike.Brand.TREK},
+            "-brand": {"category": Bike.Category.values[0]},
+        }
+        self.assertEqual(set(cases), set(BIKE_ORDERINGS))
+        for ordering, params in cases.items():
+            with self.subTest(ordering=ordering):
+                lookups, _ = parse_bike_filters(QueryDict(urlencode(params)))
+                expected = list(
+                    Bike.objects.filter(**lookups)
+                    .order_by(*BIKE_ORDERINGS[ordering].order_by)
+                    .values_list("id", flat=True)[:100]
+                )
+                response = self.get(ordering=ordering, per_page=100, **params)
+                self.assertEqual(response.status_code, 200)
+                self.assertEqual(
+                    [row["id"] for row in response.json()["results"]], expected
+                )
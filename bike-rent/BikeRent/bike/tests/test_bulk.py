@@ -0,0 +1,109 @@
+import json
+
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from bike.models import Bike, Station
+from bike.views.bulk import validate_row
+
+
+class ValidateRowTests(TestCase):
+    def test_valid_create_row(self):
+        row = {"brand": "trek", "colour": "red", "station_id": 1}
+        self.assertEqual(validate_row(row), {})
+
+    def test_missing_required_fields_on_create(self):
+        self.assertEqual(
+            set(validate_row({"name": "x"})), {"brand", "colour", "station_id"}
+        )
+
+    def test_unknown_choice(self):
+        self.assertIn("brand", validate_row({"id": 1, "brand": "bmx"}))
+
+    def test_null_in_not_null_fields(self):
+        for field in ("brand", "colour", "available", "electricity"):
+            with self.subTest(field=field):
+                self.assertIn(field, validate_row({"id": 1, field: None}))
+
+    def test_null_in_nullable_fields(self):
+        self.assertEqual(validate_row({"id": 1, "name": None, "category": None}), {})
+
+    def test_booleans_are_not_ids(self):
+        self.assertIn("id", validate_row({"id": True}))
+        self.assertIn("station_id", validate_row({"id": 1, "station_id": False}))
+
+    def test_name_must_be_short_string(self):
+        self.assertIn("name", validate_row({"id": 1, "name": {"a": 1}}))
+        self.assertIn("name", validate_row({"id": 1, "name": "x" * 1025}))
+        self.assertEqual(validate_row({"id": 1, "name": "x" * 1024}), {})
+
+    def test_not_an_object(self):
+        self.assertEqual(validate_row([1, 2]), {"row": "Ожидается объект"})
+
+
+class BikeBulkViewTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.station = Station.objects.create(name="Station", address="Street")
+        cls.bike = Bike.objects.create(
+            brand=Bike.Brand.TREK, colour=Bike.Colour.RED, station=cls.station
+        )
+
+    def post(self, rows):
+        return self.client.post(
+            reverse("bike-bulk"), json.dumps(rows), content_type="application/json"
+        )
+
+    def test_null_brand_is_rejected_per_row(self):
+        response = self.post(
+            [{"id": self.bike.pk, "name": "ok"}, {"id": self.bike.pk, "brand": None}]
+        )
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(
+            response.json()["errors"],
+            [{"row": 1, "errors": {"brand": "Не может быть null"}}],
+        )
+        self.bike.refresh_from_db()
+        self.assertIsNone(self.bike.name)
+
+    def test_create_and_update(self):
+        response = self.post(
+            [
+                {"brand": "cube", "colour": "blue", "station_id": self.station.pk},
+                {"id": self.bike.pk, "available": False},
+            ]
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            (response.json()["created"], response.json()["updated"]), (1, 1)
+        )
+        self.station.refresh_from_db()
+        self.assertEqual(
+            (self.station.total_count, self.station.available_count), (2, 1)
+        )
+
+    def test_unknown_station_is_rejected(self):
+        response = self.post([{"brand": "cube", "colour": "blue", "station_id": 999}])
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(Bike.objects.count(), 1)
+
+    @override_settings(DATA_UPLOAD_MAX_MEMORY_SIZE=1000)
+    def test_json_array_over_upload_limit(self):
+        rows = [
+            {"brand": "cube", "colour": "blue", "station_id": self.station.pk}
+            for _ in range(50)
+        ]
+        self.assertGreater(len(json.dumps(rows)), 1000)
+        response = self.post(rows)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["created"], 50)
+
+    @override_settings(DATA_UPLOAD_MAX_MEMORY_SIZE=1000)
+    def test_report_for_body_over_upload_limit(self):
+        rows = [{"id": self.bike.pk, "name": "x" * 1025}] * 2
+        response = self.post(rows)
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(
+            [row["errors"] for row in response.json()["errors"]],
+            [{"name": "Не длиннее 1024 символов"}] * 2,
+        )
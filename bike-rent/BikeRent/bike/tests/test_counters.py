@@ -0,0 +1,105 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from bike.bulk import update_bikes
+from bike.models import Bike, Station
+
+
+class StationCountersTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.first = Station.objects.create(name="First", address="Street 1")
+        cls.second = Station.objects.create(name="Second", address="Street 2")
+
+    def create_bike(self, station=None, **fields):
+        return Bike.objects.create(
+            brand=Bike.Brand.TREK,
+            colour=Bike.Colour.RED,
+            station=station or self.first,
+            **fields,
+        )
+
+    def assertCounts(self, station, total, available):
+        station.refresh_from_db()
+        self.assertEqual(
+            (station.total_count, station.available_count), (total, available)
+        )
+
+    def test_create(self):
+        self.create_bike()
+        self.create_bike(available=False)
+        self.assertCounts(self.first, 2, 1)
+
+    def test_availability_change(self):
+        bike = self.create_bike()
+        bike.available = False
+        bike.save()
+        self.assertCounts(self.first, 1, 0)
+
+    def test_move(self):
+        bike = self.create_bike()
+        bike.station = self.second
+        bike.save()
+        self.assertCounts(self.first, 0, 0)
+        self.assertCounts(self.second, 1, 1)
+
+    def test_save_of_partially_loaded_bike(self):
+        self.create_bike()
+        bike = Bike.objects.only("id", "name").get()
+        bike.station = self.second
+        bike.save()
+        self.assertCounts(self.first, 0, 0)
+        self.assertCounts(self.second, 1, 1)
+
+    def test_soft_delete_and_restore(self):
+        bike = self.create_bike()
+        bike.delete()
+        self.assertCounts(self.first, 0, 0)
+        bike.restore()
+        self.assertCounts(self.first, 1, 1)
+
+    def test_queryset_delete(self):
+        self.create_bike()
+        self.create_bike(station=self.second, available=False)
+        Bike.objects.all().delete()
+        self.assertCounts(self.first, 0, 0)
+        self.assertCounts(self.second, 0, 0)
+
+    def test_hard_delete(self):
+        bike = self.create_bike()
+        bike.hard_delete()
+        self.assertCounts(self.first, 0, 0)
+
+    def test_bulk_update(self):
+        self.create_bike()
+        self.create_bike(available=False)
+        result = update_bikes(Bike.objects.all(), chunk_size=1, available=False)
+        self.assertEqual((result.selected, result.changed), (2, 1))
+        self.assertCounts(self.first, 2, 0)
+
+        update_bikes(Bike.objects.all(), station_id=self.second.pk)
+        self.assertCounts(self.first, 0, 0)
+        self.assertCounts(self.second, 2, 0)
+
+    def test_reconcile_repairs_drift(self):
+        self.create_bike()
+        Station.objects.filter(pk=self.first.pk).update(
+            total_count=7, available_count=-1
+        )
+        call_command("reconcile_station_counters", stdout=StringIO())
+        self.assertCounts(self.first, 1, 1)
+
+    def test_reconcile_locks_stations_before_counting(self):
+        self.create_bike()
+        with CaptureQueriesContext(connection) as queries:
+            call_command("reconcile_station_counters", stdout=StringIO())
+        tables = [
+            "bike" if '"bike_bike"' in query["sql"] else "station"
+            for query in queries
+            if query["sql"].startswith("SELECT")
+        ]
+        self.assertEqual(tables, ["station", "bike"])
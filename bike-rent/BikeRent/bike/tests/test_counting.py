@@ -0,0 +1,84 @@
+from unittest import mock, skipIf
+
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from bike.counting import estimate_count
+from bike.models import Bike, Station
+
+
+def new_bike(station: Station) -> Bike:
+    return Bike(brand=Bike.Brand.TREK, colour=Bike.Colour.RED, station=station)
+
+
+class BikeListCountTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.station = Station.objects.create(name="Station", address="Street")
+        cls.bikes = Bike.objects.bulk_create(new_bike(cls.station) for _ in range(3))
+
+    def setUp(self):
+        cache.clear()
+        self.url = reverse("bike-list")
+
+    def count(self, **params) -> tuple:
+        data = self.client.get(self.url, params).json()
+        return data["count"], data["count_kind"]
+
+    def test_exact_by_default(self):
+        self.assertEqual(self.count(), (3, "exact"))
+
+    @override_settings(BIKE_LIST_COUNT_MODE="cached")
+    def test_cached_count_is_reused(self):
+        self.assertEqual(self.count(), (3, "cached"))
+        # bulk_create без сигналов: подсчёт берётся из кэша
+        Bike.objects.bulk_create([new_bike(self.station)])
+        self.assertEqual(self.count(), (3, "cached"))
+        # у другого фильтра свой ключ
+        self.assertEqual(self.count(available="true"), (4, "cached"))
+
+    @override_settings(BIKE_LIST_COUNT_MODE="cached")
+    def test_cached_count_invalidated_on_create(self):
+        self.count()
+        Bike.objects.create(
+            brand=Bike.Brand.TREK, colour=Bike.Colour.RED, station=self.station
+        )
+        self.assertEqual(self.count(), (4, "cached"))
+
+    @override_settings(BIKE_LIST_COUNT_MODE="cached")
+    def test_cached_count_invalidated_on_soft_delete(self):
+        self.count()
+        self.bikes[0].delete()
+        self.assertEqual(self.count(), (2, "cached"))
+        Bike.objects.filter(pk=self.bikes[1].pk).delete()
+        self.assertEqual(self.count(), (1, "cached"))
+        Bike.all_with_deleted.get(pk=self.bikes[0].pk).restore()
+        self.assertEqual(self.count(), (2, "cached"))
+
+    @override_settings(BIKE_LIST_COUNT_MODE="cached")
+    def test_cached_count_invalidated_by_bulk_view(self):
+        self.count()
+        response = self.client.post(
+            reverse("bike-bulk"),
+            [{"brand": "cube", "colour": "blue", "station_id": self.station.pk}],
+            content_type="application/json",
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.count(), (4, "cached"))
+
+    @override_settings(BIKE_LIST_COUNT_MODE="approximate")
+    def test_approximate_count(self):
+        with mock.patch("bike.counting.estimate_count", return_value=12345):
+            self.assertEqual(self.count(), (12345, "approximate"))
+
+    @override_settings(BIKE_LIST_COUNT_MODE="approximate")
+    def test_approximate_falls_back_to_exact(self):
+        with mock.patch("bike.counting.estimate_count", return_value=None) as estimate:
+            self.assertEqual(self.count(), (3, "exact"))
+        estimate.assert_called_once()
+
+    @skipIf(connection.vendor == "postgresql", "на Postgres оценка есть")
+    def test_no_estimate_outside_postgres(self):
+        self.assertIsNone(estimate_count(Bike.objects.all()))
@@ -0,0 +1,101 @@
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+
+from bike import detail_cache
+from bike.detail_cache import CacheStats, get_bike_payload, invalidate_bikes
+from bike.models import Bike, Station
+
+
+class BikeDetailCacheViewTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.station = Station.objects.create(name="Station", address="Street")
+        cls.bike = Bike.objects.create(
+            brand=Bike.Brand.TREK, colour=Bike.Colour.RED, station=cls.station
+        )
+
+    def setUp(self):
+        # откат транзакции теста не запускает on_commit-сброс кэша карточек
+        cache.clear()
+        self.url = reverse("bike-view", args=[self.bike.pk])
+
+    def get(self):
+        return self.client.get(self.url)
+
+    def assertCache(self, expected: str):
+        self.assertEqual(self.get()["X-Cache"], expected)
+
+    def test_miss_then_hit(self):
+        first = self.get()
+        second = self.get()
+        self.assertEqual((first["X-Cache"], second["X-Cache"]), ("MISS", "HIT"))
+        self.assertEqual(first.content, second.content)
+        self.assertEqual(first["ETag"], second["ETag"])
+
+    def test_hit_does_not_query_database(self):
+        self.get()
+        with self.assertNumQueries(0):
+            self.assertCache("HIT")
+
+    def test_bike_save_invalidates(self):
+        self.get()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.bike.name = "Renamed"
+            self.bike.save()
+        response = self.get()
+        self.assertEqual(response["X-Cache"], "MISS")
+        self.assertEqual(response.json()["name"], "Renamed")
+
+    def test_bike_delete_invalidates(self):
+        self.get()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.bike.delete()
+        self.assertEqual(self.get().status_code, 404)
+
+    def test_station_save_invalidates_all_bikes(self):
+        self.get()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.station.name = "Renamed"
+            self.station.save()
+        self.assertCache("MISS")
+        self.assertCache("HIT")
+
+    def test_cache_stats(self):
+        with mock.patch.object(detail_cache, "stats", CacheStats()):
+            self.get()
+            self.get()
+            self.get()
+            response = self.client.get(reverse("bike-cache-stats"))
+        self.assertEqual(response.json(), {"hits": 2, "misses": 1, "hit_rate": 0.6667})
+
+
+class GetBikePayloadTests(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_fill_racing_with_write_goes_under_stale_version(self):
+        def stale_loader(pk):
+            # запись закоммитилась, пока читали старую строку из БД
+            invalidate_bikes([pk])
+            return b"stale"
+
+        with self.captureOnCommitCallbacks(execute=True):
+            payload, hit = get_bike_payload(1, stale_loader)
+        self.assertEqual((payload, hit), (b"stale", False))
+
+        payload, hit = get_bike_payload(1, lambda pk: b"fresh")
+        self.assertEqual((payload, hit), (b"fresh", False))
+        self.assertEqual(get_bike_payload(1, lambda pk: b"unused"), (b"fresh", True))
+
+    def test_evicted_stamps_do_not_resurrect_old_entries(self):
+        get_bike_payload(1, lambda pk: b"old")
+        cache.delete_many([detail_cache.GENERATION_KEY, "bike:detail:version:1"])
+        self.assertEqual(get_bike_payload(1, lambda pk: b"new"), (b"new", False))
+
+    def test_empty_invalidation_is_noop(self):
+        with self.captureOnCommitCallbacks() as callbacks:
+            invalidate_bikes([])
+        self.assertEqual(callbacks, [])
@@ -0,0 +1,39 @@
+from django.test import TestCase
+from django.urls import reverse
+
+from bike.models import Bike, BikeEvent, Station
+
+
+class BikeEventViewTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        station = Station.objects.create(name="Station", address="Street")
+        cls.bike = Bike.objects.create(
+            brand=Bike.Brand.TREK, colour=Bike.Colour.RED, station=station
+        )
+        BikeEvent.objects.bulk_create(
+            BikeEvent(bike=cls.bike, text=f"Event {i}") for i in range(3)
+        )
+
+    def setUp(self):
+        self.url = reverse("bike-events", args=[self.bike.pk])
+
+    def test_pages(self):
+        data = self.client.get(self.url, {"per_page": 2, "page": 2}).json()
+        self.assertEqual((data["count"], data["num_pages"], data["page"]), (3, 2, 2))
+        self.assertEqual(len(data["results"]), 1)
+
+    def test_per_page_out_of_bounds(self):
+        for per_page in (0, -1, 101, "x"):
+            with self.subTest(per_page=per_page):
+                response = self.client.get(self.url, {"per_page": per_page})
+                self.assertEqual(response.status_code, 400)
+
+    def test_add_event(self):
+        response = self.client.post(
+            self.url,
+            {"text": "Chain replaced", "kind": "maintenance"},
+            content_type="application/json",
+        )
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(self.bike.events.count(), 4)
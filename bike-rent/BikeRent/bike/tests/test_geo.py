@@ -0,0 +1,159 @@
+import random
+import time
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.urls import reverse
+
+from bike import geo
+from bike.geo import StationGrid, bounding_box, haversine_m, nearest_by_bounding_box
+from bike.models import Station
+
+
+def brute_force(points, lat, lon, radius_m, limit):
+    found = (
+        (haversine_m(lat, lon, p_lat, p_lon), station_id)
+        for station_id, p_lat, p_lon in points
+    )
+    return sorted(item for item in found if item[0] <= radius_m)[:limit]
+
+
+class StationGridTests(SimpleTestCase):
+    def assertSameDistances(self, found, expected):
+        self.assertEqual(
+            [round(distance, 6) for distance, _ in found],
+            [round(distance, 6) for distance, _ in expected],
+        )
+
+    def test_matches_brute_force(self):
+        rnd = random.Random(8)
+        points = [(i, rnd.uniform(-90, 90), rnd.uniform(-180, 180)) for i in range(300)]
+        # сгущения у полюса и у антимеридиана
+        points += [
+            (1000 + i, rnd.uniform(88, 90), rnd.uniform(-180, 180)) for i in range(50)
+        ]
+        points += [
+            (2000 + i, rnd.uniform(-5, 5), rnd.choice((-1, 1)) * rnd.uniform(179, 180))
+            for i in range(50)
+        ]
+        for cell_deg in (0.01, 0.007, 0.5, 3):
+            grid = StationGrid(points, cell_deg=cell_deg)
+            for _ in range(100):
+                lat, lon = rnd.choice(
+                    (
+                        (rnd.uniform(-90, 90), rnd.uniform(-180, 180)),
+                        (rnd.uniform(88, 90), rnd.uniform(-180, 180)),
+                        (rnd.uniform(-5, 5), rnd.choice((-1, 1)) * 179.9),
+                    )
+                )
+                radius = rnd.choice((1000, 50_000, 300_000, 3_000_000))
+                limit = rnd.randint(1, 20)
+                with self.subTest(cell_deg=cell_deg, lat=lat, lon=lon, radius=radius):
+                    self.assertSameDistances(
+                        grid.nearest(lat, lon, radius, limit),
+                        brute_force(points, lat, lon, radius, limit),
+                    )
+
+    def test_near_pole_is_bounded(self):
+        rnd = random.Random(8)
+        grid = StationGrid(
+            (i, rnd.uniform(53.72, 54.08), rnd.uniform(27.25, 27.85))
+            for i in range(20_000)
+        )
+        for lat in (80, 85, 89.9999, 90, -90):
+            with self.subTest(lat=lat):
+                started = time.perf_counter()
+                self.assertEqual(grid.nearest(lat, 0, 50_000, 10), [])
+                self.assertLess(time.perf_counter() - started, 0.5)
+
+    def test_bounding_box(self):
+        min_lat, max_lat, min_lon, max_lon = bounding_box(0, 179.9, 50_000)
+        self.assertLess(min_lon, 179.9)
+        self.assertGreater(max_lon, 180)
+        # шапка накрывает полюс — вся долгота, широта обрезана
+        self.assertEqual(bounding_box(89.9, 10, 50_000)[1:], (90.0, -180.0, 180.0))
+
+
+class NearestByBoundingBoxTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        rnd = random.Random(8)
+        cls.points = [
+            (rnd.uniform(-2, 2), rnd.choice((-1, 1)) * rnd.uniform(178, 180))
+            for _ in range(100)
+        ] + [(rnd.uniform(89, 90), rnd.uniform(-180, 180)) for _ in range(50)]
+        Station.objects.bulk_create(
+            Station(name=f"S{i}", address="Street", latitude=lat, longitude=lon)
+            for i, (lat, lon) in enumerate(cls.points)
+        )
+
+    def test_matches_grid(self):
+        rows = list(Station.objects.values_list("id", "latitude", "longitude"))
+        grid = StationGrid(rows)
+        for lat, lon in ((0, 179.9), (0, -179.9), (89.9, 0), (1, 0)):
+            with self.subTest(lat=lat, lon=lon):
+                self.assertEqual(
+                    nearest_by_bounding_box(lat, lon, 300_000, 20),
+                    grid.nearest(lat, lon, 300_000, 20),
+                )
+
+
+class StationNearbyViewTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.near = Station.objects.create(
+            name="Near", address="Street 1", latitude=53.9, longitude=27.56
+        )
+        cls.far = Station.objects.create(
+            name="Far", address="Street 2", latitude=53.91, longitude=27.56
+        )
+
+    def setUp(self):
+        self.url = reverse("station-nearby")
+        cache.clear()
+        geo._index = None
+
+    def get(self, **params):
+        return self.client.get(self.url, {"lat": 53.9, "lon": 27.56, **params})
+
+    def test_validation(self):
+        cases = [
+            {"lat": ""},
+            {"lat": "x"},
+            {"lat": 91},
+            {"lon": -181},
+            {"radius": 0},
+            {"radius": 50_001},
+            {"limit": 0},
+            {"limit": 101},
+            {"limit": 1.5},
+        ]
+        for params in cases:
+            with self.subTest(params=params):
+                self.assertEqual(self.get(**params).status_code, 400)
+        response = self.client.get(self.url, {"lat": 53.9})
+        self.assertEqual(response.status_code, 400)
+
+    def test_nearest_first(self):
+        for geo_index in (True, False):
+            with self.subTest(geo_index=geo_index), override_settings(
+                BIKE_STATION_GEO_INDEX=geo_index
+            ):
+                results = self.get().json()["results"]
+                self.assertEqual(
+                    [row["id"] for row in results], [self.near.pk, self.far.pk]
+                )
+                self.assertEqual(results[0]["distance_m"], 0)
+
+    def test_pole_query(self):
+        response = self.get(lat=90, lon=0, radius=50_000)
+        self.assertEqual(response.json(), {"results": []})
+
+    def test_station_deleted_after_index_built(self):
+        self.get()
+        # другой процесс удалил станцию, а версия индекса здесь ещё старая
+        with mock.patch("bike.signals.invalidate_station_index"):
+            self.far.delete()
+        results = self.get().json()["results"]
+        self.assertEqual([row["id"] for row in results], [self.near.pk])
@@ -0,0 +1,106 @@
+import csv
+import io
+import json
+import shutil
+import tempfile
+from unittest import mock, skipIf
+
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from bike.models import Bike, Station
+from bike.previews import Image, InvalidPreview, store_preview, storage
+
+VARIANTS = {"thumb": "bike/preview/ab/abc-thumb.jpg"}
+
+
+def image_upload(size=(64, 48), name="bike.png") -> SimpleUploadedFile:
+    buffer = io.BytesIO()
+    Image.new("RGB", size, "red").save(buffer, "PNG")
+    return SimpleUploadedFile(name, buffer.getvalue(), content_type="image/png")
+
+
+class PreviewTestCase(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.media_root = tempfile.mkdtemp()
+        cls.enterClassContext(
+            override_settings(MEDIA_ROOT=cls.media_root, BIKE_PREVIEW_WORKERS=0)
+        )
+        super().setUpClass()
+
+    @classmethod
+    def tearDownClass(cls):
+        super().tearDownClass()
+        shutil.rmtree(cls.media_root, ignore_errors=True)
+
+    @classmethod
+    def setUpTestData(cls):
+        station = Station.objects.create(name="Station", address="Street")
+        cls.bike = Bike.objects.create(
+            name="Bike", brand=Bike.Brand.TREK, colour=Bike.Colour.RED, station=station
+        )
+
+
+class PreviewVariantsUrlTests(PreviewTestCase):
+    def setUp(self):
+        Bike.objects.filter(pk=self.bike.pk).update(preview_variants=VARIANTS)
+        self.url = storage().url(VARIANTS["thumb"])
+
+    def test_urls_come_from_preview_storage(self):
+        field = Bike._meta.get_field("preview_variants")
+        self.assertIs(field.storage, storage())
+        self.assertEqual(field.to_urls(VARIANTS), {"thumb": self.url})
+
+    def test_ndjson_export_has_urls(self):
+        response = self.client.get(reverse("bike-export"), {"format": "ndjson"})
+        [line] = b"".join(response.streaming_content).splitlines()
+        self.assertEqual(json.loads(line)["preview_variants"], {"thumb": self.url})
+
+    def test_csv_export_has_urls(self):
+        response = self.client.get(reverse("bike-export"), {"format": "csv"})
+        content = b"".join(response.streaming_content).decode()
+        [row] = csv.DictReader(io.StringIO(content))
+        self.assertEqual(json.loads(row["preview_variants"]), {"thumb": self.url})
+
+
+@skipIf(Image is None, "Pillow не установлен")
+class StorePreviewTests(PreviewTestCase):
+    def test_variants_are_built_and_shared(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.assertFalse(store_preview(self.bike, image_upload()))
+        self.bike.refresh_from_db()
+        self.assertEqual(
+            set(self.bike.preview_variants), {"thumb", "thumb_webp", "medium_webp"}
+        )
+
+        other = Bike.objects.create(
+            brand=Bike.Brand.CUBE, colour=Bike.Colour.BLUE, station=self.bike.station
+        )
+        # тот же файл — варианты уже готовы
+        self.assertTrue(store_preview(other, image_upload(name="copy.png")))
+        self.assertEqual(other.preview.name, self.bike.preview.name)
+
+    def test_not_an_image(self):
+        upload = SimpleUploadedFile("bike.png", b"not an image")
+        with self.assertRaises(InvalidPreview):
+            store_preview(self.bike, upload)
+
+    def test_decompression_bomb_is_rejected(self):
+        with mock.patch.object(Image, "MAX_IMAGE_PIXELS", 100):
+            response = self.client.post(
+                reverse("bike-preview", args=[self.bike.pk]),
+                {"preview": image_upload(size=(64, 64))},
+            )
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json(), {"error": "Слишком большое изображение"})
+
+    def test_extension_comes_from_detected_format(self):
+        polyglot = image_upload(name="evil.html")
+        polyglot = SimpleUploadedFile(
+            "evil.svg", polyglot.read() + b"<script>alert(1)</script>"
+        )
+        store_preview(self.bike, polyglot)
+        self.assertTrue(self.bike.preview.name.endswith(".png"))
+        self.assertTrue(storage().exists(self.bike.preview.name))
@@ -0,0 +1,27 @@
+from unittest import skipUnless
+
+from django.db import connection
+from django.test import TestCase
+
+from bike.management.commands.check_query_plans import bike_scans, hot_queries
+
+
+@skipUnless(
+    connection.vendor == "postgresql", "EXPLAIN проверяется только на PostgreSQL"
+)
+class HotQueryPlanTests(TestCase):
+    """Составные и частичные индексы bike_bike (см. check_query_plans)"""
+
+    def test_hot_queries_use_their_indexes(self):
+        with connection.cursor() as cursor:
+            # тестовая таблица пуста: без этого планировщик всегда выберет seq scan
+            cursor.execute("SET LOCAL enable_seqscan = off")
+            for title, qs, indexes in hot_queries():
+                with self.subTest(title):
+                    nodes = bike_scans(cursor, qs)
+                    self.assertNotIn("Seq Scan", [node["Node Type"] for node in nodes])
+                    used = {node.get("Index Name") for node in nodes}
+                    self.assertTrue(
+                        used & set(indexes),
+                        f"{title}: {used}, expected one of {indexes}",
+                    )
@@ -0,0 +1,70 @@
+import datetime
+import decimal
+import json
+import uuid
+from unittest import skipIf
+
+from django.test import TestCase
+
+from bike.models import Bike, Station
+from bike.serializers import dumps_orjson, dumps_stdlib, orjson, serialize_rows
+
+FIELDS = (
+    "id",
+    "name",
+    "preview",
+    "preview_variants",
+    "station__name",
+    "created_at",
+    "updated_at",
+)
+
+
+@skipIf(orjson is None, "orjson не установлен")
+class DumpsParityTests(TestCase):
+    """orjson необязателен: с ним и без него ответ должен быть одинаковым"""
+
+    def assertSameJson(self, data):
+        stdlib, fast = dumps_stdlib(data), dumps_orjson(data)
+        self.assertEqual(json.loads(stdlib), json.loads(fast))
+
+    def test_plain_values(self):
+        tz = datetime.timezone(datetime.timedelta(hours=3))
+        self.assertSameJson(
+            {
+                "aware": datetime.datetime(2024, 5, 1, 12, 30, 15, 123456, tzinfo=tz),
+                "utc": datetime.datetime(2024, 5, 1, 12, 30, tzinfo=datetime.UTC),
+                "naive": datetime.datetime(2024, 5, 1, 12, 30, 15, 123456),
+                "date": datetime.date(2024, 5, 1),
+                "time": datetime.time(12, 30, 15, 123456),
+                "duration": datetime.timedelta(days=1, seconds=5),
+                "uuid": uuid.UUID("0190c3a1-7b2c-7d4e-8f00-123456789abc"),
+                "decimal": decimal.Decimal("12.50"),
+                "nested": [{"decimal": decimal.Decimal("-0.001")}],
+                "none": None,
+            }
+        )
+
+    def test_serialized_model_rows(self):
+        station = Station.objects.create(name="Station", address="Street")
+        Bike.objects.create(
+            brand=Bike.Brand.TREK,
+            colour=Bike.Colour.RED,
+            station=station,
+            name="With preview",
+            preview="bike/preview/ab/abc.png",
+            preview_variants={"thumb": "bike/preview/ab/abc-thumb.jpg"},
+        )
+        Bike.objects.create(
+            brand=Bike.Brand.TREK, colour=Bike.Colour.RED, station=station
+        )
+        rows = serialize_rows(
+            Bike, FIELDS, list(Bike.objects.order_by("id").values(*FIELDS))
+        )
+        self.assertSameJson(rows)
+        self.assertEqual(
+            json.loads(dumps_orjson(rows))[0]["preview_variants"]["thumb"],
+            Bike._meta.get_field("preview").storage.url(
+                "bike/preview/ab/abc-thumb.jpg"
+            ),
+        )
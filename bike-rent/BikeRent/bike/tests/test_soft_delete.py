@@ -0,0 +1,94 @@
+from datetime import timedelta
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+
+from bike.models import Bike, Station
+from common.models import ArchivedRecord
+from rent.models import Rental
+
+
+class SoftDeleteTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.station = Station.objects.create(name="Station", address="Street")
+        cls.bikes = [
+            Bike.objects.create(
+                brand=Bike.Brand.TREK, colour=Bike.Colour.RED, station=cls.station
+            )
+            for _ in range(3)
+        ]
+
+    def test_delete_hides_row_from_default_manager(self):
+        bike = self.bikes[0]
+        bike.delete()
+        self.assertIsNotNone(bike.deleted_at)
+        self.assertFalse(Bike.objects.filter(pk=bike.pk).exists())
+        self.assertTrue(Bike.all_with_deleted.filter(pk=bike.pk).exists())
+        self.assertEqual(list(Bike.all_with_deleted.dead()), [bike])
+        self.assertEqual(Bike.all_with_deleted.alive().count(), 2)
+
+    def test_queryset_delete_is_soft(self):
+        deleted = Bike.objects.filter(pk__in=[b.pk for b in self.bikes[:2]]).delete()
+        self.assertEqual(deleted, 2)
+        self.assertEqual(Bike.objects.count(), 1)
+        self.assertEqual(Bike.all_with_deleted.count(), 3)
+
+    def test_restore(self):
+        bike = self.bikes[0]
+        bike.delete()
+        bike.restore()
+        self.assertTrue(Bike.objects.filter(pk=bike.pk).exists())
+
+    def test_hard_delete(self):
+        self.bikes[0].hard_delete()
+        self.assertEqual(Bike.all_with_deleted.count(), 2)
+        Bike.all_with_deleted.all().hard_delete()
+        self.assertFalse(Bike.all_with_deleted.exists())
+
+    def test_deleted_bike_is_not_served(self):
+        url = reverse("bike-view", args=[self.bikes[0].pk])
+        self.assertEqual(self.client.delete(url).status_code, 204)
+        self.assertEqual(self.client.get(url).status_code, 404)
+        ids = [
+            row["id"] for row in self.client.get(reverse("bike-list")).json()["results"]
+        ]
+        self.assertNotIn(self.bikes[0].pk, ids)
+
+
+class PurgeTombstonesTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        station = Station.objects.create(name="Station", address="Street")
+        cls.old, cls.recent, cls.rented = [
+            Bike.objects.create(
+                brand=Bike.Brand.TREK, colour=Bike.Colour.RED, station=station
+            )
+            for _ in range(3)
+        ]
+        user = get_user_model().objects.create_user(email="rider@example.com")
+        Rental.objects.create(
+            user=user,
+            bike=cls.rented,
+            start_station=station,
+            status=Rental.Status.FINISHED,
+        )
+        long_ago = timezone.now() - timedelta(days=60)
+        Bike.objects.filter(pk__in=[cls.old.pk, cls.rented.pk]).update(
+            deleted_at=long_ago
+        )
+        Bike.objects.filter(pk=cls.recent.pk).update(deleted_at=timezone.now())
+
+    def test_purges_old_tombstones_only(self):
+        call_command("purge_tombstones", model=["bike.Bike"], stdout=StringIO())
+        remaining = set(Bike.all_with_deleted.values_list("pk", flat=True))
+        # свежий tombstone и велосипед с арендой (PROTECT) остаются
+        self.assertEqual(remaining, {self.recent.pk, self.rented.pk})
+        archived = ArchivedRecord.objects.get()
+        self.assertEqual(
+            (archived.model, archived.object_pk), ("bike.bike", str(self.old.pk))
+        )
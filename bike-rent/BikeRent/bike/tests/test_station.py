@@ -0,0 +1,57 @@
+from django.test import TestCase
+from django.urls import reverse
+
+from bike.models import Bike, Station
+
+
+class StationListConditionalGetTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.first = Station.objects.create(name="First", address="Street 1")
+        cls.second = Station.objects.create(name="Second", address="Street 2")
+        cls.bike = Bike.objects.create(
+            brand=Bike.Brand.TREK, colour=Bike.Colour.RED, station=cls.first
+        )
+
+    def setUp(self):
+        self.url = reverse("station-list")
+
+    def get(self, **headers):
+        return self.client.get(self.url, headers=headers)
+
+    def test_occupancy(self):
+        response = self.get()
+        results = {row["id"]: row for row in response.json()["results"]}
+        self.assertEqual(results[self.first.pk]["available_count"], 1)
+        self.assertEqual(results[self.second.pk]["total_count"], 0)
+        self.assertNotIn("Last-Modified", response)
+
+    def test_not_modified_skips_aggregation(self):
+        etag = self.get()["ETag"]
+        # COUNT станций и страница со счётчиками, без группировки по велосипедам
+        with self.assertNumQueries(2):
+            response = self.get(if_none_match=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response["ETag"], etag)
+
+    def test_etag_changes_when_bike_moves_away(self):
+        etag = self.get()["ETag"]
+        self.bike.station = self.second
+        self.bike.save()
+        self.assertEqual(self.get(if_none_match=etag).status_code, 200)
+
+    def test_etag_changes_when_bike_is_deleted(self):
+        etag = self.get()["ETag"]
+        self.bike.delete()
+        self.assertEqual(self.get(if_none_match=etag).status_code, 200)
+
+    def test_etag_changes_when_station_is_edited(self):
+        etag = self.get()["ETag"]
+        Station.objects.filter(pk=self.second.pk).update(address="Street 3")
+        self.assertEqual(self.get(if_none_match=etag).status_code, 200)
+
+    def test_per_page_out_of_bounds(self):
+        for per_page in (0, -1, 501):
+            with self.subTest(per_page=per_page):
+                response = self.client.get(self.url, {"per_page": per_page})
+                self.assertEqual(response.status_code, 400)
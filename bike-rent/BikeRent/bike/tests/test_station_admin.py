@@ -0,0 +1,121 @@
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from bike.admin.station import BIKE_PANEL_PAGE_SIZE
+from bike.models import Bike, Station
+
+# станция и сводка одним GROUP BY; список велосипедов подгружается отдельно
+STATION_CHANGE_QUERY_BUDGET = 2
+
+
+def add_bikes(station: Station, count: int):
+    Bike.objects.bulk_create(
+        Bike(
+            name=f"Bike {i}",
+            brand=(Bike.Brand.TREK, Bike.Brand.CUBE)[i % 2],
+            colour=Bike.Colour.RED,
+            station=station,
+            available=i % 3 != 0,
+        )
+        for i in range(count)
+    )
+
+
+class StationAdminTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = get_user_model().objects.create_superuser(
+            email="admin@example.com", password=None
+        )
+        cls.small = Station.objects.create(name="Small", address="Street 1")
+        cls.big = Station.objects.create(name="Big", address="Street 2")
+        add_bikes(cls.small, 3)
+        add_bikes(cls.big, 2 * BIKE_PANEL_PAGE_SIZE + 10)
+
+    def setUp(self):
+        self.client.force_login(self.admin)
+
+    def change_page_queries(self, station: Station) -> int:
+        url = reverse("admin:bike_station_change", args=[station.pk])
+        # первый запрос прогревает ContentType и кэш сессий
+        self.client.get(url)
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return len(queries)
+
+    def test_change_page_query_budget(self):
+        self.assertEqual(
+            self.change_page_queries(self.small), STATION_CHANGE_QUERY_BUDGET
+        )
+        # не растёт с числом велосипедов на станции
+        self.assertEqual(
+            self.change_page_queries(self.big), STATION_CHANGE_QUERY_BUDGET
+        )
+
+    def test_fleet_summary(self):
+        response = self.client.get(
+            reverse("admin:bike_station_change", args=[self.small.pk])
+        )
+        # 3 велосипеда: 2 Trek (доступен 1) и 1 Cube (доступен)
+        for brand, total, available in (
+            (Bike.Brand.TREK, 2, 1),
+            (Bike.Brand.CUBE, 1, 1),
+        ):
+            self.assertContains(
+                response,
+                f"<tr><td>{brand.label}</td><td>{total}</td><td>{available}</td></tr>",
+                html=True,
+            )
+        self.assertContains(
+            response, reverse("admin:bike_station_bikes", args=[self.small.pk])
+        )
+
+    def bikes_page(self, station: Station, cursor=None):
+        params = {"cursor": cursor} if cursor is not None else {}
+        return self.client.get(
+            reverse("admin:bike_station_bikes", args=[station.pk]), params
+        )
+
+    def test_bikes_cursor_pages(self):
+        ids, cursor, pages = [], None, 0
+        while True:
+            data = self.bikes_page(self.big, cursor).json()
+            ids += [row["id"] for row in data["results"]]
+            pages += 1
+            cursor = data["next_cursor"]
+            if cursor is None:
+                break
+        self.assertEqual(pages, 3)
+        self.assertEqual(
+            ids,
+            list(
+                Bike.objects.filter(station=self.big)
+                .order_by("id")
+                .values_list("id", flat=True)
+            ),
+        )
+
+    def test_bikes_page_query_count(self):
+        with self.assertNumQueries(2):
+            # станция и страница велосипедов
+            self.bikes_page(self.big)
+
+    def test_invalid_cursor(self):
+        response = self.bikes_page(self.big, "not-a-cursor")
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("cursor", response.json()["errors"])
+
+    def test_unknown_station(self):
+        self.assertEqual(
+            self.client.get(reverse("admin:bike_station_bikes", args=[0])).status_code,
+            404,
+        )
+
+    def test_requires_staff(self):
+        self.client.logout()
+        response = self.bikes_page(self.small)
+        self.assertEqual(response.status_code, 302)
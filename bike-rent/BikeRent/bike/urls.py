@@ -1,9 +1,25 @@
 from django.urls import path
 
-from bike.views import BikeDetailView, BikeView, StationView
+from bike.views import (
+    BikeBulkView,
+    BikeCacheStatsView,
+    BikeDetailView,
+    BikeEventView,
+    BikeExportView,
+    BikePreviewView,
+    BikeView,
+    StationNearbyView,
+    StationView,
+)
 
 urlpatterns = [
+    path("bikes/<int:pk>/preview/", BikePreviewView.as_view(), name="bike-preview"),
+    path("bikes/<int:pk>/events/", BikeEventView.as_view(), name="bike-events"),
     path("bikes/<int:pk>/", BikeDetailView.as_view(), name="bike-view"),
+    path("bikes/cache-stats/", BikeCacheStatsView.as_view(), name="bike-cache-stats"),
+    path("bikes/export/", BikeExportView.as_view(), name="bike-export"),
+    path("bikes/bulk/", BikeBulkView.as_view(), name="bike-bulk"),
     path("bikes/", BikeView.as_view(), name="bike-list"),
+    path("stations/nearby/", StationNearbyView.as_view(), name="station-nearby"),
     path("stations/", StationView.as_view(), name="station-list"),
 ]
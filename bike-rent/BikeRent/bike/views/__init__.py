@@ -1,4 +1,18 @@
-from .bike import BikeView, BikeDetailView
-from .station import StationView
+from .bike import BikeCacheStatsView, BikeView, BikeDetailView
+from .bulk import BikeBulkView
+from .event import BikeEventView
+from .export import BikeExportView
+from .preview import BikePreviewView
+from .station import StationNearbyView, StationView
 
-__all__ = ["BikeView", "BikeDetailView", "StationView"]
+__all__ = [
+    "BikeView",
+    "BikeDetailView",
+    "BikeCacheStatsView",
+    "BikeBulkView",
+    "BikeEventView",
+    "BikeExportView",
+    "BikePreviewView",
+    "StationView",
+    "StationNearbyView",
+]
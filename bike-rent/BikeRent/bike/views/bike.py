@@ -1,20 +1,77 @@
 import json
+from datetime import datetime, timedelta, timezone
 
-from django.core.paginator import EmptyPage, PageNotAnInteger, Paginator
-from django.http import HttpRequest, HttpResponse, JsonResponse
-from django.shortcuts import get_object_or_404
+from asgiref.sync import sync_to_async
+from django.core.paginator import EmptyPage, PageNotAnInteger
+from django.db import transaction
+from django.http import Http404, HttpRequest, HttpResponse, JsonResponse
+from django.shortcuts import aget_object_or_404, get_object_or_404
 from django.utils.decorators import method_decorator
+from django.utils.http import parse_etags, quote_etag
 from django.views.decorators.csrf import csrf_exempt
 from django.views.generic.base import View
 
-from bike.models import Bike, Station
+from bike import detail_cache
+from bike.counting import acount_queryset
+from bike.filters import BIKE_ORDERINGS, FilterError, parse_bike_filters
+from bike.models import Bike, BikeEvent, Station
+from bike.pagination import CountedPaginator, InvalidCursor, apaginate_by_cursor
+from bike.serializers import FastJsonResponse, dumps, serialize_rows
+
+EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+BIKE_LIST_FIELDS = (
+    "id",
+    "name",
+    "brand",
+    "category",
+    "electricity",
+    "colour",
+    "available",
+    "preview_variants",
+    "station__name",
+)
+BIKE_DETAIL_FIELDS = (
+    "id",
+    "category",
+    "name",
+    "brand",
+    "electricity",
+    "colour",
+    "available",
+    "preview",
+    "preview_variants",
+    "station",
+    "updated_at",
+)
+
+
+# больше строк на страницу не отдаём — для выгрузки есть /bikes/bikes/export/
+MAX_PER_PAGE = 100
+
+
+def bike_list_queryset(request: HttpRequest):
+    """
+    Queryset списка велосипедов (общий для списка и экспорта) с фильтрами
+    и сортировкой из query-параметров. Бросает FilterError.
+    """
+    lookups, ordering = parse_bike_filters(request.GET)
+    return (
+        Bike.objects.filter(**lookups)
+        .values(*BIKE_LIST_FIELDS)
+        .order_by(*BIKE_ORDERINGS[ordering].order_by)
+    )
 
 
 @method_decorator(csrf_exempt, name="dispatch")
 class BikeView(View):
     # localhost:8000/bikes/bikes/
-    def get(self, request: HttpRequest):
-        """Список всех велосипедов с пагинацией через Paginator"""
+    async def get(self, request: HttpRequest):
+        """
+        Список всех велосипедов с пагинацией через Paginator.
+        Если передан ?cursor= (в т.ч. пустой), используется keyset-пагинация.
+        Фильтры и сортировки описаны в bike/filters.py.
+        """
         try:
             page_number = int(request.GET.get("page", 1))
             per_page = int(request.GET.get("per_page", 20))
@@ -23,22 +80,34 @@ class BikeView(View):
                 {"error": "page и per_page должны быть числами"}, status=400
             )
 
-        qs = (
-            Bike.objects.all()
-            .values(
-                "id",
-                "name",
-                "brand",
-                "category",
-                "electricity",
-                "colour",
-                "available",
-                "station__name",
+        if per_page > MAX_PER_PAGE:
+            return JsonResponse(
+                {"error": f"per_page не может быть больше {MAX_PER_PAGE}"}, status=400
             )
-            .order_by("id")
-        )
+        if per_page < 1:
+            return JsonResponse({"error": "per_page должен быть больше 0"}, status=400)
+
+        try:
+            qs = bike_list_queryset(request)
+        except FilterError as e:
+            return JsonResponse({"error": e.errors}, status=400)
+
+        if "cursor" in request.GET:
+            try:
+                data = await apaginate_by_cursor(
+                    qs,
+                    request.GET["cursor"],
+                    per_page,
+                    descending=request.GET.get("ordering") == "-id",
+                )
+            except InvalidCursor:
+                return JsonResponse({"error": "Некорректный cursor"}, status=400)
+            serialize_rows(Bike, BIKE_LIST_FIELDS, data["results"])
+            return FastJsonResponse(data)
 
-        paginator = Paginator(qs, per_page)
+        count, count_kind = await acount_queryset(qs)
+        # CountedPaginator не ходит в БД: page() лишь режет queryset
+        paginator = CountedPaginator(qs, per_page, count)
 
         try:
             page_obj = paginator.page(page_number)
@@ -49,20 +118,23 @@ class BikeView(View):
 
         data = {
             "count": paginator.count,  # общее число объектов
+            "count_kind": count_kind,  # exact / cached / approximate
             "num_pages": paginator.num_pages,  # всего страниц
             "page": page_obj.number,  # текущая страница
             "per_page": per_page,  # размер страницы
-            "results": list(page_obj.object_list),
+            "results": serialize_rows(
+                Bike, BIKE_LIST_FIELDS, [row async for row in page_obj.object_list]
+            ),
         }
 
-        return JsonResponse(data, safe=False)
+        return FastJsonResponse(data)
 
-    def post(self, request: HttpRequest):
-        """Создание нового велосипеда"""
+    async def post(self, request: HttpRequest):
+        """Создание нового велосипеда (comments попадают в журнал событий)"""
         try:
             data = json.loads(request.body)
-            station = Station.objects.get(id=data["station_id"])
-            bike = Bike.objects.create(
+            station = await Station.objects.aget(id=data["station_id"])
+            fields = dict(
                 name=data.get("name"),
                 brand=data["brand"],
                 category=data.get("category"),
@@ -70,15 +142,29 @@ class BikeView(View):
                 colour=data["colour"],
                 available=data.get("available", True),
                 station=station,
-                comments=data.get("comments"),
             )
+            if data.get("comments"):
+                # велосипед и первое событие — в одной транзакции,
+                # а транзакций в async ORM нет
+                bike = await sync_to_async(create_bike_with_event)(
+                    fields, data["comments"]
+                )
+            else:
+                bike = await Bike.objects.acreate(**fields)
             return JsonResponse({"id": bike.id, "message": "Bike created"}, status=201)
         except Exception as e:
             return JsonResponse({"error": str(e)}, status=400)
 
 
+def create_bike_with_event(fields: dict, text: str) -> Bike:
+    with transaction.atomic():
+        bike = Bike.objects.create(**fields)
+        BikeEvent.objects.create(bike=bike, text=text)
+    return bike
+
+
 def bike_to_dict(obj: Bike) -> dict:
-    return {
+    row = {
         "id": obj.id,
         "category": obj.category,
         "name": obj.name,
@@ -86,48 +172,120 @@ def bike_to_dict(obj: Bike) -> dict:
         "electricity": obj.electricity,
         "colour": obj.colour,
         "available": obj.available,
-        "comments": obj.comments,
-        "preview": obj.preview.url if obj.preview else None,
+        "preview": obj.preview.name,
+        "preview_variants": obj.preview_variants,
         "station": obj.station_id,
+        "updated_at": obj.updated_at,
     }
+    return serialize_rows(Bike, BIKE_DETAIL_FIELDS, [row])[0]
+
+
+def bike_etag(updated_at: datetime) -> str:
+    """Версия велосипеда для ETag/If-Match — updated_at с точностью до мкс"""
+    return quote_etag(str((updated_at - EPOCH) // timedelta(microseconds=1)))
+
+
+def etag_matches(if_match: str, etag: str) -> bool:
+    etags = parse_etags(if_match)
+    if not etags and if_match.strip():
+        # клиент прислал версию без кавычек
+        etags = [quote_etag(if_match.strip())]
+    return "*" in etags or etag in etags
+
+
+async def bike_detail_payload(pk: int) -> tuple[bytes, str]:
+    """JSON карточки и её ETag без создания экземпляра Bike"""
+    row = await Bike.objects.filter(pk=pk).values(*BIKE_DETAIL_FIELDS).afirst()
+    if row is None:
+        raise Http404("No Bike matches the given query.")
+    etag = bike_etag(row["updated_at"])
+    return dumps(serialize_rows(Bike, BIKE_DETAIL_FIELDS, [row])[0]), etag
 
 
 @method_decorator(csrf_exempt, name="dispatch")
 class BikeDetailView(View):
     """Retrieve / Patch / Delete для Bike"""
 
-    def get(self, request: HttpRequest, pk: int) -> HttpResponse:
-        bike = get_object_or_404(Bike, pk=pk)
-        return JsonResponse(bike_to_dict(bike), status=200)
+    updatable_fields = (
+        "category",
+        "name",
+        "brand",
+        "electricity",
+        "colour",
+    )
+
+    async def get(self, request: HttpRequest, pk: int) -> HttpResponse:
+        (payload, etag), hit = await detail_cache.aget_bike_payload(
+            pk, bike_detail_payload
+        )
+        response = HttpResponse(payload, content_type="application/json", status=200)
+        response["ETag"] = etag
+        response["X-Cache"] = "HIT" if hit else "MISS"
+        return response
 
-    def patch(self, request: HttpRequest, pk: int) -> HttpResponse:
-        bike = get_object_or_404(Bike, pk=pk)
+    async def patch(self, request: HttpRequest, pk: int) -> HttpResponse:
+        # select_for_update и транзакция есть только в синхронном ORM
+        return await sync_to_async(self.update)(request, pk)
+
+    def update(self, request: HttpRequest, pk: int) -> HttpResponse:
+        """
+        Частичное обновление: UPDATE только изменившихся колонок.
+        comments не перезаписываются, а добавляются событием в журнал.
+        С заголовком If-Match (ETag из GET) строка блокируется и при
+        несовпадении версии возвращается 412 вместо тихой перезаписи.
+        """
         try:
             data = json.loads(request.body.decode("utf-8"))
         except (json.JSONDecodeError, UnicodeDecodeError):
             return JsonResponse({"error": "Invalid JSON"}, status=400)
+        if not isinstance(data, dict):
+            return JsonResponse({"error": "Ожидается JSON-объект"}, status=400)
+        if "station" in data:
+            try:
+                data["station"] = int(data["station"])
+            except (TypeError, ValueError):
+                return JsonResponse({"error": "station должен быть числом"}, status=400)
+
+        if_match = request.headers.get("If-Match")
+        with transaction.atomic():
+            bikes = Bike.objects.select_for_update() if if_match else Bike.objects.all()
+            bike = get_object_or_404(bikes, pk=pk)
+            if if_match and not etag_matches(if_match, bike_etag(bike.updated_at)):
+                return JsonResponse(
+                    {"error": "Велосипед уже изменён, перечитайте его"}, status=412
+                )
 
-        updatable_fields = [
-            "category",
-            "name",
-            "brand",
-            "electricity",
-            "colour",
-            "comments",
-        ]
-        for field in updatable_fields:
-            if field in data:
+            changed = [
+                field
+                for field in self.updatable_fields
+                if field in data and getattr(bike, field) != data[field]
+            ]
+            for field in changed:
                 setattr(bike, field, data[field])
 
-        if "station" in data:
-            station = get_object_or_404(Station, pk=data["station"])
-            setattr(bike, "station", station)
+            # станцию проверяем запросом, только если она действительно меняется
+            if "station" in data and data["station"] != bike.station_id:
+                bike.station = get_object_or_404(Station, pk=data["station"])
+                changed.append("station")
+
+            if changed:
+                bike.save(update_fields=[*changed, "updated_at"])
+            if data.get("comments"):
+                BikeEvent.objects.create(bike=bike, text=data["comments"])
 
-        bike.save()
-        return JsonResponse(bike_to_dict(bike), status=200)
+        response = FastJsonResponse(bike_to_dict(bike), status=200)
+        response["ETag"] = bike_etag(bike.updated_at)
+        return response
 
-    def delete(self, request: HttpRequest, pk: int) -> HttpResponse:
-        bike = get_object_or_404(Bike, pk=pk)
-        bike.delete()
+    async def delete(self, request: HttpRequest, pk: int) -> HttpResponse:
+        """Мягкое удаление (deleted_at), строку вычищает purge_tombstones"""
+        bike = await aget_object_or_404(Bike, pk=pk)
+        await bike.adelete()
         return JsonResponse({"status": "deleted"}, status=204, safe=False)
 
+
+class BikeCacheStatsView(View):
+    # localhost:8000/bikes/bikes/cache-stats/
+    def get(self, request: HttpRequest) -> HttpResponse:
+        """Попадания/промахи кэша карточек велосипедов (текущий процесс)"""
+        return JsonResponse(detail_cache.stats.as_dict(), status=200)
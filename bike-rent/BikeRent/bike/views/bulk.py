@@ -0,0 +1,238 @@
+import json
+
+from django.conf import settings
+from django.db import transaction
+from django.http import HttpRequest, JsonResponse
+from django.utils import timezone
+from django.utils.decorators import method_decorator
+from django.views.decorators.csrf import csrf_exempt
+from django.views.generic.base import View
+
+from bike.counters import CounterDeltas
+from bike.counting import invalidate_count_cache
+from bike.detail_cache import invalidate_bikes
+from bike.models import Bike, BikeEvent, Station
+from bike.models.bike import counter_state
+
+NDJSON_CONTENT_TYPES = ("application/x-ndjson", "application/ndjson")
+
+BULK_FIELDS = (
+    "name",
+    "brand",
+    "category",
+    "electricity",
+    "colour",
+    "available",
+)
+BOOLEAN_FIELDS = ("electricity", "available")
+CHOICE_FIELDS = {
+    "brand": Bike.Brand.values,
+    "category": Bike.Category.values,
+    "colour": Bike.Colour.values,
+}
+STRING_FIELDS = {"name": Bike._meta.get_field("name").max_length}
+REQUIRED_ON_CREATE = ("brand", "colour", "station_id")
+# null в этих полях до БД доходить не должен (NOT NULL -> IntegrityError)
+NOT_NULL_FIELDS = tuple(
+    field for field in BULK_FIELDS if not Bike._meta.get_field(field).null
+)
+
+
+def is_int(value) -> bool:
+    # bool — подкласс int, но true/false за id не считаем
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+class RowRejected(Exception):
+    pass
+
+
+def read_rows(request: HttpRequest) -> list:
+    """
+    JSON-массив или NDJSON (по строке на объект).
+    Нераспарсенная строка NDJSON превращается в RowRejected, чтобы ошибка
+    попала в отчёт по строкам, а не обрывала весь запрос.
+    """
+    if request.content_type in NDJSON_CONTENT_TYPES:
+        rows = []
+        for line in request:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                rows.append(json.loads(line))
+            except (json.JSONDecodeError, UnicodeDecodeError):
+                rows.append(RowRejected("Invalid JSON"))
+        return rows
+
+    # из потока, а не request.body: тот ограничен DATA_UPLOAD_MAX_MEMORY_SIZE
+    # (2.5 МБ), и большой массив получал бы HTML-страницу 400 вместо отчёта
+    rows = json.load(request)
+    if not isinstance(rows, list):
+        raise ValueError("Ожидается JSON-массив")
+    return rows
+
+
+def validate_row(row) -> dict:
+    """Проверка одной строки без обращения к БД. Возвращает словарь ошибок"""
+    if isinstance(row, RowRejected):
+        return {"row": str(row)}
+    if not isinstance(row, dict):
+        return {"row": "Ожидается объект"}
+
+    errors = {}
+    if "id" not in row:
+        for field in REQUIRED_ON_CREATE:
+            if row.get(field) in (None, ""):
+                errors[field] = "Обязательное поле"
+    elif not is_int(row["id"]):
+        errors["id"] = "Должно быть целым числом"
+
+    for field in NOT_NULL_FIELDS:
+        if field in row and row[field] is None:
+            errors[field] = "Не может быть null"
+    for field, choices in CHOICE_FIELDS.items():
+        value = row.get(field)
+        if value is not None and value not in choices:
+            errors[field] = f"Допустимые значения: {', '.join(choices)}"
+    for field in BOOLEAN_FIELDS:
+        if row.get(field) is not None and not isinstance(row[field], bool):
+            errors[field] = "Должно быть true/false"
+    for field, max_length in STRING_FIELDS.items():
+        value = row.get(field)
+        if value is None:
+            continue
+        if not isinstance(value, str):
+            errors[field] = "Должно быть строкой"
+        elif len(value) > max_length:
+            errors[field] = f"Не длиннее {max_length} символов"
+    if row.get("comments") is not None and not isinstance(row["comments"], str):
+        errors["comments"] = "Должно быть строкой"
+    if "station_id" in row and not is_int(row["station_id"]):
+        errors["station_id"] = "Должно быть целым числом"
+    return errors
+
+
+@method_decorator(csrf_exempt, name="dispatch")
+class BikeBulkView(View):
+    # localhost:8000/bikes/bikes/bulk/
+    def post(self, request: HttpRequest):
+        """
+        Массовое создание/обновление велосипедов.
+        Строка с "id" обновляет велосипед, без "id" — создаёт новый.
+        Всё пишется в одной транзакции: при любой ошибке не пишется ничего.
+        """
+        try:
+            batch_size = int(
+                request.GET.get("batch_size", settings.BIKE_BULK_BATCH_SIZE)
+            )
+        except ValueError:
+            return JsonResponse({"error": "batch_size должен быть числом"}, status=400)
+        if batch_size < 1:
+            return JsonResponse(
+                {"error": "batch_size должен быть больше 0"}, status=400
+            )
+
+        try:
+            rows = read_rows(request)
+        except (ValueError, UnicodeDecodeError) as e:
+            return JsonResponse({"error": str(e) or "Invalid JSON"}, status=400)
+
+        errors = {}
+        for number, row in enumerate(rows):
+            row_errors = validate_row(row)
+            if row_errors:
+                errors[number] = row_errors
+        if errors:
+            return self._rejected(errors)
+
+        with transaction.atomic():
+            # Все станции и все обновляемые велосипеды — по одному запросу
+            stations = Station.objects.in_bulk(
+                {row["station_id"] for row in rows if "station_id" in row}
+            )
+            existing = Bike.objects.select_for_update().in_bulk(
+                {row["id"] for row in rows if "id" in row}
+            )
+
+            to_create, to_update, updated_fields = [], {}, {"updated_at"}
+            # comments идут в журнал BikeEvent: (велосипед, текст)
+            comments = []
+            now = timezone.now()
+            for number, row in enumerate(rows):
+                if "station_id" in row and row["station_id"] not in stations:
+                    errors[number] = {"station_id": "Станция не найдена"}
+                    continue
+
+                fields = {f: row[f] for f in BULK_FIELDS if f in row}
+                if "station_id" in row:
+                    fields["station"] = stations[row["station_id"]]
+
+                if "id" not in row:
+                    bike = Bike(**fields)
+                    to_create.append(bike)
+                    if row.get("comments"):
+                        comments.append((bike, row["comments"]))
+                    continue
+
+                bike = existing.get(row["id"])
+                if bike is None:
+                    errors[number] = {"id": "Велосипед не найден"}
+                    continue
+                for field, value in fields.items():
+                    setattr(bike, field, value)
+                # bulk_update не трогает auto_now, ставим сами
+                bike.updated_at = now
+                if row.get("comments"):
+                    comments.append((bike, row["comments"]))
+                updated_fields.update(fields)
+                to_update[bike.pk] = bike
+
+            if errors:
+                return self._rejected(errors)
+
+            created = Bike.objects.bulk_create(to_create, batch_size=batch_size)
+            if to_update:
+                Bike.objects.bulk_update(
+                    to_update.values(), sorted(updated_fields), batch_size=batch_size
+                )
+            BikeEvent.objects.bulk_create(
+                [BikeEvent(bike=bike, text=text) for bike, text in comments],
+                batch_size=batch_size,
+            )
+
+            # bulk_create/bulk_update не шлют сигналы — счётчики станций правим сами
+            deltas = CounterDeltas()
+            for bike in created:
+                deltas.add(*counter_state(bike))
+            for bike in to_update.values():
+                deltas.move(bike._counter_state, counter_state(bike))
+            deltas.apply()
+            invalidate_bikes(to_update)
+
+        if created:
+            # bulk_create не шлёт post_save
+            invalidate_count_cache()
+
+        return JsonResponse(
+            {
+                "created": len(created),
+                "updated": len(to_update),
+                "created_ids": [bike.id for bike in created],
+                "errors": [],
+            },
+            status=200,
+        )
+
+    def _rejected(self, errors: dict) -> JsonResponse:
+        return JsonResponse(
+            {
+                "created": 0,
+                "updated": 0,
+                "errors": [
+                    {"row": number, "errors": row_errors}
+                    for number, row_errors in sorted(errors.items())
+                ],
+            },
+            status=400,
+        )
@@ -0,0 +1,81 @@
+import json
+
+from django.core.paginator import EmptyPage, PageNotAnInteger, Paginator
+from django.http import HttpRequest, JsonResponse
+from django.shortcuts import get_object_or_404
+from django.utils.decorators import method_decorator
+from django.views.decorators.csrf import csrf_exempt
+from django.views.generic.base import View
+
+from bike.models import Bike, BikeEvent
+from bike.serializers import FastJsonResponse, serialize_rows
+
+BIKE_EVENT_FIELDS = ("id", "kind", "text", "author", "created_at")
+MAX_EVENTS_PER_PAGE = 100
+
+
+@method_decorator(csrf_exempt, name="dispatch")
+class BikeEventView(View):
+    # localhost:8000/bikes/bikes/<pk>/events/
+    def get(self, request: HttpRequest, pk: int):
+        """История велосипеда, новые записи первыми"""
+        try:
+            page_number = int(request.GET.get("page", 1))
+            per_page = int(request.GET.get("per_page", 20))
+        except ValueError:
+            return JsonResponse(
+                {"error": "page и per_page должны быть числами"}, status=400
+            )
+        if not 1 <= per_page <= MAX_EVENTS_PER_PAGE:
+            return JsonResponse(
+                {"error": f"per_page: от 1 до {MAX_EVENTS_PER_PAGE}"}, status=400
+            )
+
+        if not Bike.objects.filter(pk=pk).exists():
+            return JsonResponse({"error": "Велосипед не найден"}, status=404)
+
+        # индекс bike_event_bike_created_idx
+        qs = (
+            BikeEvent.objects.filter(bike_id=pk)
+            .values(*BIKE_EVENT_FIELDS)
+            .order_by("-created_at", "-id")
+        )
+        paginator = Paginator(qs, per_page)
+        try:
+            page_obj = paginator.page(page_number)
+        except PageNotAnInteger:
+            page_obj = paginator.page(1)
+        except EmptyPage:
+            page_obj = paginator.page(paginator.num_pages)
+
+        return FastJsonResponse(
+            {
+                "count": paginator.count,
+                "num_pages": paginator.num_pages,
+                "page": page_obj.number,
+                "per_page": per_page,
+                "results": serialize_rows(
+                    BikeEvent, BIKE_EVENT_FIELDS, page_obj.object_list
+                ),
+            }
+        )
+
+    def post(self, request: HttpRequest, pk: int):
+        """Добавить запись в историю: {"text": "...", "kind": "maintenance"}"""
+        bike = get_object_or_404(Bike.objects.only("id"), pk=pk)
+        try:
+            data = json.loads(request.body)
+            text = data["text"]
+        except (json.JSONDecodeError, KeyError, TypeError):
+            return JsonResponse({"error": "Ожидается text"}, status=400)
+        kind = data.get("kind", BikeEvent.Kind.NOTE)
+        if kind not in BikeEvent.Kind.values or not isinstance(text, str) or not text:
+            return JsonResponse({"error": "Некорректные text или kind"}, status=400)
+
+        event = BikeEvent.objects.create(
+            bike=bike,
+            kind=kind,
+            text=text,
+            author=request.user if request.user.is_authenticated else None,
+        )
+        return JsonResponse({"id": event.id, "message": "Event created"}, status=201)
@@ -0,0 +1,100 @@
+import csv
+
+from django.conf import settings
+from django.http import HttpRequest, JsonResponse, StreamingHttpResponse
+from django.views.generic.base import View
+
+from bike.filters import FilterError
+from bike.models import Bike
+from bike.serializers import dumps, iter_serialized_rows
+from bike.views.bike import BIKE_LIST_FIELDS, bike_list_queryset
+
+EXPORT_FORMATS = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
+# сколько строк склеиваем в один кусок тела ответа
+LINES_PER_CHUNK = 500
+
+
+class Echo:
+    """Псевдо-файл для csv.writer: write() просто возвращает строку"""
+
+    def write(self, value):
+        return value
+
+
+def ndjson_lines(rows):
+    for row in rows:
+        yield dumps(row) + b"\n"
+
+
+def csv_cell(value):
+    # вложенные значения (preview_variants) — JSON в одной ячейке
+    if isinstance(value, (dict, list)):
+        return dumps(value).decode()
+    return value
+
+
+def csv_lines(rows):
+    writer = csv.writer(Echo())
+    yield writer.writerow(BIKE_LIST_FIELDS).encode()
+    for row in rows:
+        yield writer.writerow(
+            [csv_cell(row[field]) for field in BIKE_LIST_FIELDS]
+        ).encode()
+
+
+def chunked(lines):
+    buffer = []
+    for line in lines:
+        buffer.append(line)
+        if len(buffer) >= LINES_PER_CHUNK:
+            yield b"".join(buffer)
+            buffer = []
+    if buffer:
+        yield b"".join(buffer)
+
+
+class BikeExportView(View):
+    # localhost:8000/bikes/bikes/export/?format=csv
+    def get(self, request: HttpRequest):
+        """
+        Выгрузка всего парка (NDJSON или CSV) потоком.
+        Строки читаются серверным курсором кусками по chunk_size,
+        поэтому память не зависит от размера парка.
+        """
+        export_format = request.GET.get("format", "ndjson")
+        if export_format not in EXPORT_FORMATS:
+            return JsonResponse(
+                {"error": f"format: {', '.join(EXPORT_FORMATS)}"}, status=400
+            )
+        try:
+            chunk_size = int(
+                request.GET.get("chunk_size", settings.BIKE_EXPORT_CHUNK_SIZE)
+            )
+        except ValueError:
+            return JsonResponse({"error": "chunk_size должен быть числом"}, status=400)
+        if chunk_size < 1:
+            return JsonResponse(
+                {"error": "chunk_size должен быть больше 0"}, status=400
+            )
+
+        try:
+            qs = bike_list_queryset(request)
+        except FilterError as e:
+            return JsonResponse({"error": e.errors}, status=400)
+
+        # те же преобразования полей, что у JSON API (url вариантов превью)
+        rows = iter_serialized_rows(
+            Bike, BIKE_LIST_FIELDS, qs.iterator(chunk_size=chunk_size)
+        )
+        lines = ndjson_lines(rows) if export_format == "ndjson" else csv_lines(rows)
+
+        response = StreamingHttpResponse(
+            chunked(lines), content_type=EXPORT_FORMATS[export_format]
+        )
+        response["Content-Disposition"] = (
+            f'attachment; filename="bikes.{export_format}"'
+        )
+        return response
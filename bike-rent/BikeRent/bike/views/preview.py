@@ -0,0 +1,38 @@
+from django.db import transaction
+from django.http import HttpRequest, JsonResponse
+from django.shortcuts import get_object_or_404
+from django.utils.decorators import method_decorator
+from django.views.decorators.csrf import csrf_exempt
+from django.views.generic.base import View
+
+from bike.models import Bike
+from bike.previews import InvalidPreview, store_preview
+from bike.serializers import FastJsonResponse, serialize_rows
+
+PREVIEW_FIELDS = ("id", "preview", "preview_variants")
+
+
+@method_decorator(csrf_exempt, name="dispatch")
+class BikePreviewView(View):
+    # localhost:8000/bikes/bikes/<pk>/preview/
+    def post(self, request: HttpRequest, pk: int):
+        """
+        Загрузка превью (multipart, поле preview). Варианты готовятся в фоне:
+        202, пока их нет, 200 — если такой же файл уже загружали.
+        """
+        upload = request.FILES.get("preview")
+        if upload is None:
+            return JsonResponse({"error": "Нужен файл в поле preview"}, status=400)
+
+        with transaction.atomic():
+            bike = get_object_or_404(Bike.objects.select_for_update(), pk=pk)
+            try:
+                ready = store_preview(bike, upload)
+            except InvalidPreview as e:
+                return JsonResponse({"error": str(e)}, status=400)
+
+        row = {field: getattr(bike, field) for field in PREVIEW_FIELDS}
+        row["preview"] = bike.preview.name
+        data = serialize_rows(Bike, PREVIEW_FIELDS, [row])[0]
+        data["status"] = "ready" if ready else "processing"
+        return FastJsonResponse(data, status=200 if ready else 202)
@@ -1,32 +1,167 @@
+import hashlib
 import json
 
+from django.conf import settings
+from django.core.paginator import EmptyPage, PageNotAnInteger
+from django.db.models import Count, Q
 from django.http import HttpRequest, JsonResponse
+from django.utils.cache import get_conditional_response
+from django.utils.http import quote_etag
 from django.utils.decorators import method_decorator
 from django.views.decorators.csrf import csrf_exempt
 from django.views.generic.base import View
 
+from bike.geo import get_station_index, nearest_by_bounding_box
 from bike.models import Station
+from bike.pagination import CountedPaginator
+from bike.serializers import FastJsonResponse, serialize_rows
+
+STATION_LIST_FIELDS = ("id", "name", "address", "capacity", "latitude", "longitude")
+MAX_STATIONS_PER_PAGE = 500
 
 
 @method_decorator(csrf_exempt, name="dispatch")
 class StationView(View):
     # localhost:8000/bikes/stations/
-    def get(self, request: HttpRequest):
-        """Список всех станций"""
-        stations = Station.objects.all().values("id", "name", "address", "capacity")
-        return JsonResponse(list(stations), safe=False)
+    async def get(self, request: HttpRequest):
+        """
+        Список станций с занятостью и пагинацией.
+        ETag считается по дешёвому запросу страницы (поля станций и их
+        счётчики total_count/available_count, без join'а с велосипедами):
+        неизменившийся ответ отдаётся как 304 ещё до группировки по велосипедам.
+        Last-Modified не отдаём — у станций нет общей отметки изменения,
+        которая сдвигалась бы при уходе или удалении велосипеда.
+        """
+        try:
+            page_number = int(request.GET.get("page", 1))
+            per_page = int(request.GET.get("per_page", 100))
+        except ValueError:
+            return JsonResponse(
+                {"error": "page и per_page должны быть числами"}, status=400
+            )
+        if not 1 <= per_page <= MAX_STATIONS_PER_PAGE:
+            return JsonResponse(
+                {"error": f"per_page: от 1 до {MAX_STATIONS_PER_PAGE}"}, status=400
+            )
+
+        stations = Station.objects.all()
+        if q := request.GET.get("q"):
+            stations = stations.filter(Q(name__icontains=q) | Q(address__icontains=q))
+        if request.GET.get("has_available") == "true":
+            # фильтр по денормализованному счётчику, без HAVING по join'у
+            stations = stations.filter(available_count__gt=0)
+
+        # счётчики меняются при любом приходе/уходе/удалении велосипеда
+        # (bike/signals.py, bike/counters.py) — по ним и проверяем свежесть
+        stamps = stations.values(*STATION_LIST_FIELDS, "total_count", "available_count")
+        # COUNT(*) по станциям без join'а с велосипедами
+        paginator = CountedPaginator(
+            stamps.order_by("id"), per_page, await stations.acount()
+        )
+        try:
+            page_obj = paginator.page(page_number)
+        except PageNotAnInteger:
+            page_obj = paginator.page(1)
+        except EmptyPage:
+            page_obj = paginator.page(paginator.num_pages)
+        stamps = [row async for row in page_obj.object_list]
+
+        etag = quote_etag(
+            hashlib.md5(
+                repr((paginator.count, page_obj.number, per_page, stamps)).encode()
+            ).hexdigest()
+        )
+        response = get_conditional_response(request, etag=etag)
+        if response is not None:
+            response["ETag"] = etag
+            return response
+
+        # занятость страницы — одним сгруппированным запросом
+        rows = (
+            Station.objects.filter(pk__in=[row["id"] for row in stamps])
+            .values(*STATION_LIST_FIELDS)
+            .annotate(
+                total_count=Count("bikes", filter=Q(bikes__deleted_at__isnull=True)),
+                available_count=Count(
+                    "bikes",
+                    filter=Q(bikes__available=True, bikes__deleted_at__isnull=True),
+                ),
+            )
+            .order_by("id")
+        )
+        response = FastJsonResponse(
+            {
+                "count": paginator.count,
+                "num_pages": paginator.num_pages,
+                "page": page_obj.number,
+                "per_page": per_page,
+                "results": serialize_rows(
+                    Station, STATION_LIST_FIELDS, [row async for row in rows]
+                ),
+            }
+        )
+        response["ETag"] = etag
+        return response
 
-    def post(self, request: HttpRequest):
+    async def post(self, request: HttpRequest):
         """Создание новой станции"""
         try:
             data = json.loads(request.body)
-            station = Station.objects.create(
+            station = await Station.objects.acreate(
                 name=data["name"],
                 address=data["address"],
                 capacity=data.get("capacity", 0),
+                latitude=data.get("latitude"),
+                longitude=data.get("longitude"),
             )
             return JsonResponse(
                 {"id": station.id, "message": "Station created"}, status=201
             )
         except Exception as e:
             return JsonResponse({"error": str(e)}, status=400)
+
+
+@method_decorator(csrf_exempt, name="dispatch")
+class StationNearbyView(View):
+    # localhost:8000/bikes/stations/nearby/?lat=53.9&lon=27.56&radius=1000&limit=10
+    def get(self, request: HttpRequest):
+        """Ближайшие станции к точке (radius в метрах)"""
+        try:
+            lat = float(request.GET["lat"])
+            lon = float(request.GET["lon"])
+            radius = float(request.GET.get("radius", 2000))
+            limit = int(request.GET.get("limit", 10))
+        except KeyError:
+            return JsonResponse({"error": "lat и lon обязательны"}, status=400)
+        except ValueError:
+            return JsonResponse(
+                {"error": "lat, lon, radius и limit должны быть числами"}, status=400
+            )
+        if not (-90 <= lat <= 90 and -180 <= lon <= 180):
+            return JsonResponse({"error": "Некорректные координаты"}, status=400)
+        if not (0 < radius <= 50_000 and 0 < limit <= 100):
+            return JsonResponse(
+                {"error": "radius: 0–50000 м, limit: 1–100"}, status=400
+            )
+
+        if settings.BIKE_STATION_GEO_INDEX:
+            found = get_station_index().nearest(lat, lon, radius, limit)
+        else:
+            found = nearest_by_bounding_box(lat, lon, radius, limit)
+
+        stations = Station.objects.in_bulk([pk for _, pk in found])
+        results = [
+            {
+                "id": pk,
+                "name": stations[pk].name,
+                "address": stations[pk].address,
+                "latitude": stations[pk].latitude,
+                "longitude": stations[pk].longitude,
+                "available_count": stations[pk].available_count,
+                "distance_m": round(distance, 1),
+            }
+            # станцию могли удалить после построения индекса
+            for distance, pk in found
+            if pk in stations
+        ]
+        return FastJsonResponse({"results": results})
@@ -0,0 +1,129 @@
+# common/management/commands/bench_uuid_inserts.py
+import json
+import time
+import uuid
+
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+
+from common.uuids import uuid7
+
+GENERATORS = {"uuid4": uuid.uuid4, "uuid7": uuid7}
+
+
+class Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = (
+        "Insert N rows keyed by uuid4 and by uuid7 into scratch tables shaped "
+        "like users_user's primary key and compare insert throughput, index "
+        "size and (PostgreSQL) buffer hit rate of the last batch."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--rows", type=int, default=1_000_000, help="Rows per generator."
+        )
+        parser.add_argument(
+            "--batch-size", type=int, default=5_000, help="Rows per INSERT batch."
+        )
+
+    def handle(self, *args, **opts):
+        self.stdout.write(
+            f"{'key':<6} {'rows/s':>10} {'last 10% rows/s':>16} "
+            f"{'index size':>12} {'hit rate':>9}"
+        )
+        for name, generate in GENERATORS.items():
+            # таблицы живут только внутри транзакции бенчмарка
+            try:
+                with transaction.atomic():
+                    self._run(name, generate, opts["rows"], opts["batch_size"])
+                    raise Rollback
+            except Rollback:
+                pass
+        self.stdout.write(self.style.SUCCESS("✅ Benchmark finished"))
+
+    # ---------------- utilities ----------------
+
+    def _run(self, name, generate, rows: int, batch_size: int):
+        table = connection.ops.quote_name(f"bench_uuid_{name}")
+        column_type = "uuid" if connection.vendor == "postgresql" else "char(32)"
+        to_db = (
+            (lambda value: value)
+            if connection.vendor == "postgresql"
+            else (lambda value: value.hex)
+        )
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"CREATE TABLE {table} "
+                f"(id {column_type} PRIMARY KEY, email varchar(254) NOT NULL)"
+            )
+            sql = f"INSERT INTO {table} (id, email) VALUES (%s, %s)"
+
+            timings = []
+            for start in range(0, rows, batch_size):
+                batch = [
+                    (to_db(generate()), f"rider{i}@bench.example")
+                    for i in range(start, min(start + batch_size, rows))
+                ]
+                started = time.perf_counter()
+                cursor.executemany(sql, batch)
+                timings.append((len(batch), time.perf_counter() - started))
+
+            tail = timings[-max(1, len(timings) // 10) :]
+            total_rate = sum(n for n, _ in timings) / sum(t for _, t in timings)
+            tail_rate = sum(n for n, _ in tail) / sum(t for _, t in tail)
+            size, hit_rate = self._index_stats(
+                cursor, table, generate, to_db, batch_size
+            )
+
+        self.stdout.write(
+            f"{name:<6} {total_rate:>10.0f} {tail_rate:>16.0f} {size:>12} {hit_rate:>9}"
+        )
+
+    def _index_stats(
+        self, cursor, table, generate, to_db, batch_size
+    ) -> tuple[str, str]:
+        if connection.vendor == "sqlite":
+            return self._sqlite_index_size(cursor, table), "-"
+        if connection.vendor != "postgresql":
+            return "-", "-"
+
+        index = f"{table[1:-1]}_pkey"
+        cursor.execute("SELECT pg_size_pretty(pg_relation_size(%s::regclass))", [index])
+        size = cursor.fetchone()[0]
+
+        # ещё одна пачка под EXPLAIN ANALYZE: сколько страниц нашлось в shared buffers
+        values = ", ".join(["(%s, %s)"] * batch_size)
+        params = [
+            p
+            for _ in range(batch_size)
+            for p in (to_db(generate()), "probe@bench.example")
+        ]
+        cursor.execute(
+            f"EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) "
+            f"INSERT INTO {table} (id, email) VALUES {values}",
+            params,
+        )
+        plan = cursor.fetchone()[0]
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        root = plan[0]["Plan"]
+        hit, read = root.get("Shared Hit Blocks", 0), root.get("Shared Read Blocks", 0)
+        hit_rate = f"{hit / (hit + read):.1%}" if hit + read else "-"
+        return size, hit_rate
+
+    def _sqlite_index_size(self, cursor, table) -> str:
+        # dbstat есть не в каждой сборке SQLite
+        try:
+            cursor.execute(
+                "SELECT SUM(pgsize) FROM dbstat WHERE name LIKE %s",
+                [f"sqlite_autoindex_{table[1:-1]}%"],
+            )
+        except Exception:
+            return "-"
+        size = cursor.fetchone()[0] or 0
+        return f"{size / 1024 / 1024:.1f} MB"
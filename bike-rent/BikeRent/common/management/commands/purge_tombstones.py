@@ -0,0 +1,125 @@
+# common/management/commands/purge_tombstones.py
+import time
+from datetime import timedelta
+
+from django.apps import apps
+from django.core import serializers
+from django.core.management.base import BaseCommand, CommandError
+from django.db import models, transaction
+from django.utils import timezone
+
+from common.models import ArchivedRecord, BaseModel
+
+
+class Command(BaseCommand):
+    help = (
+        "Move soft-deleted rows (deleted_at) older than N days of every BaseModel "
+        "subclass to common.ArchivedRecord, chunk by chunk in short transactions."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--older-than-days",
+            type=int,
+            default=30,
+            help="Only tombstones older than this.",
+        )
+        parser.add_argument(
+            "--batch-size", type=int, default=500, help="Rows per transaction."
+        )
+        parser.add_argument(
+            "--pause", type=float, default=0.0, help="Seconds to sleep between chunks."
+        )
+        parser.add_argument(
+            "--model",
+            action="append",
+            default=None,
+            help="app_label.Model to purge (repeatable).",
+        )
+        parser.add_argument(
+            "--dry-run", action="store_true", help="Only count what would be purged."
+        )
+
+    def handle(self, *args, **opts):
+        cutoff = timezone.now() - timedelta(days=opts["older_than_days"])
+        for model in self._models(opts["model"]):
+            tombstones = self._tombstones(model, cutoff)
+            if opts["dry_run"]:
+                self.stdout.write(
+                    f"{model._meta.label}: {tombstones.count()} rows to purge"
+                )
+                continue
+
+            purged = 0
+            while True:
+                with transaction.atomic():
+                    # SKIP LOCKED: строки, которые кто-то держит,
+                    # заберём в следующий раз
+                    pks = list(
+                        tombstones.select_for_update(skip_locked=True, of=("self",))
+                        .order_by("pk")
+                        .values_list("pk", flat=True)[: opts["batch_size"]]
+                    )
+                    if not pks:
+                        break
+                    self._archive(model, pks)
+                    model.all_with_deleted.filter(pk__in=pks).hard_delete()
+                purged += len(pks)
+                self.stdout.write(f"{model._meta.label}: purged {purged}…")
+                if opts["pause"]:
+                    time.sleep(opts["pause"])
+
+            self.stdout.write(
+                self.style.SUCCESS(f"✅ {model._meta.label}: {purged} rows archived.")
+            )
+
+    # ---------------- utilities ----------------
+
+    def _models(self, labels):
+        if not labels:
+            return [m for m in apps.get_models() if issubclass(m, BaseModel)]
+        models_ = []
+        for label in labels:
+            try:
+                model = apps.get_model(label)
+            except (LookupError, ValueError):
+                raise CommandError(f"Unknown model {label}")
+            if not issubclass(model, BaseModel):
+                raise CommandError(f"{label} is not a BaseModel subclass")
+            models_.append(model)
+        return models_
+
+    def _tombstones(self, model, cutoff):
+        qs = model.all_with_deleted.filter(deleted_at__lt=cutoff)
+        # строки, на которые ссылаются через PROTECT, удалить нельзя — оставляем
+        for relation in model._meta.related_objects:
+            if relation.on_delete is models.PROTECT:
+                qs = qs.exclude(**{f"{relation.name}__isnull": False})
+        return qs
+
+    def _archive(self, model, pks):
+        """Архивирует строки и (рекурсивно) всё, что удалится с ними по CASCADE"""
+        if not pks:
+            return
+        rows = serializers.serialize("python", model._base_manager.filter(pk__in=pks))
+        ArchivedRecord.objects.bulk_create(
+            [
+                ArchivedRecord(
+                    model=model._meta.label_lower,
+                    object_pk=str(row["pk"]),
+                    payload=row["fields"],
+                    deleted_at=row["fields"].get("deleted_at"),
+                )
+                for row in rows
+            ]
+        )
+        for relation in model._meta.related_objects:
+            if relation.on_delete is not models.CASCADE or relation.many_to_many:
+                continue
+            child = relation.related_model
+            child_pks = list(
+                child._base_manager.filter(
+                    **{f"{relation.field.name}__in": pks}
+                ).values_list("pk", flat=True)
+            )
+            self._archive(child, child_pks)
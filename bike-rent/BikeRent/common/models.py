@@ -1,6 +1,8 @@
-import uuid
-
+from django.core.serializers.json import DjangoJSONEncoder
 from django.db import models
+from django.utils import timezone
+
+from common.uuids import uuid7
 
 
 class BaseTimeStampedMixin(models.Model):
@@ -18,22 +20,85 @@ class TimeStampedMixin(BaseTimeStampedMixin, models.Model):
         abstract = True
 
 
-class UUIDMixin:
+class UUIDMixin(models.Model):
     id = models.UUIDField(
-        default=uuid.uuid4, primary_key=True, editable=False, auto_created=True
+        default=uuid7, primary_key=True, editable=False, auto_created=True
     )
 
     class Meta:
         abstract = True
 
 
+class SoftDeleteQuerySet(models.QuerySet):
+    def delete(self):
+        """Мягкое удаление одним UPDATE, сигналы не отправляются"""
+        return self.filter(deleted_at__isnull=True).update(
+            deleted_at=timezone.now(), updated_at=timezone.now()
+        )
+
+    delete.queryset_only = True
+
+    def hard_delete(self):
+        return super().delete()
+
+    hard_delete.queryset_only = True
+
+    def alive(self):
+        return self.filter(deleted_at__isnull=True)
+
+    def dead(self):
+        return self.filter(deleted_at__isnull=False)
+
+
+class SoftDeleteManager(models.Manager.from_queryset(SoftDeleteQuerySet)):
+    """Менеджер по умолчанию: удалённые (deleted_at) строки не видны"""
+
+    def get_queryset(self):
+        return super().get_queryset().filter(deleted_at__isnull=True)
+
+
 class BaseModel(TimeStampedMixin, models.Model):
+    objects = SoftDeleteManager()
+    # все строки, включая удалённые
+    all_with_deleted = models.Manager.from_queryset(SoftDeleteQuerySet)()
 
     class Meta:
         abstract = True
 
+    def delete(self, using=None, keep_parents=False):
+        """Мягкое удаление: проставляем deleted_at, строка остаётся в таблице"""
+        self.deleted_at = timezone.now()
+        self.save(using=using, update_fields=["deleted_at", "updated_at"])
+
+    def hard_delete(self, using=None, keep_parents=False):
+        return super().delete(using=using, keep_parents=keep_parents)
+
+    def restore(self):
+        self.deleted_at = None
+        self.save(update_fields=["deleted_at", "updated_at"])
+
 
 class BaseUUIDModel(UUIDMixin, BaseModel):
 
     class Meta:
         abstract = True
+
+
+class ArchivedRecord(models.Model):
+    """Строки, вычищенные из таблиц командой purge_tombstones"""
+
+    model = models.CharField(max_length=100)
+    object_pk = models.CharField(max_length=64)
+    payload = models.JSONField(encoder=DjangoJSONEncoder)
+    deleted_at = models.DateTimeField(blank=True, null=True)
+    archived_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        verbose_name = "Archived record"
+        verbose_name_plural = "Archived records"
+        indexes = [
+            models.Index(fields=["model", "object_pk"], name="archived_model_pk_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.model} {self.object_pk}"
@@ -0,0 +1,75 @@
+import time
+import uuid
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.db import models
+from django.test import SimpleTestCase, TestCase
+from django.test.utils import isolate_apps
+
+from common.models import BaseUUIDModel
+from common.uuids import uuid7
+
+
+def timestamp_ms(value: uuid.UUID) -> int:
+    return value.int >> 80
+
+
+class Uuid7Tests(SimpleTestCase):
+    def setUp(self):
+        # состояние генератора общее на процесс: тесты с часами в будущем
+        # не должны влиять на остальные
+        patcher = mock.patch.multiple("common.uuids", _last_ms=0, _counter=0)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_version_and_variant(self):
+        value = uuid7()
+        self.assertEqual(value.version, 7)
+        self.assertEqual(value.variant, uuid.RFC_4122)
+
+    def test_timestamp_is_current_time(self):
+        before = time.time_ns() // 1_000_000
+        value = uuid7()
+        after = time.time_ns() // 1_000_000
+        self.assertTrue(before <= timestamp_ms(value) <= after)
+
+    def test_strictly_increasing(self):
+        values = [uuid7() for _ in range(20_000)]
+        self.assertEqual(values, sorted(set(values)))
+
+    def test_increasing_when_clock_goes_back(self):
+        now = time.time_ns()
+        first = uuid7()
+        with mock.patch("common.uuids.time.time_ns", return_value=now - 10**9):
+            second = uuid7()
+        self.assertGreater(second, first)
+        self.assertGreaterEqual(timestamp_ms(second), timestamp_ms(first))
+
+    def test_counter_overflow_moves_to_next_millisecond(self):
+        frozen = time.time_ns() + 10**9
+        with mock.patch("common.uuids.time.time_ns", return_value=frozen):
+            values = [uuid7() for _ in range(5000)]
+        self.assertEqual(values, sorted(set(values)))
+        self.assertGreater(timestamp_ms(values[-1]), frozen // 1_000_000)
+        self.assertTrue(all(value.version == 7 for value in values))
+
+
+class Uuid7PrimaryKeyTests(TestCase):
+    def test_new_users_get_time_ordered_keys(self):
+        User = get_user_model()
+        users = [
+            User.objects.create_user(email=f"rider{i}@example.com") for i in range(3)
+        ]
+        self.assertTrue(all(user.pk.version == 7 for user in users))
+        self.assertEqual([user.pk for user in users], sorted(user.pk for user in users))
+
+    @isolate_apps("common")
+    def test_base_uuid_model_subclass(self):
+        class Thing(BaseUUIDModel):
+            name = models.CharField(max_length=10)
+
+        pk = Thing._meta.pk
+        self.assertIsInstance(pk, models.UUIDField)
+        self.assertEqual(pk.name, "id")
+        self.assertEqual(Thing().pk.version, 7)
@@ -0,0 +1,37 @@
+# common/uuids.py
+import os
+import threading
+import time
+import uuid
+
+_lock = threading.Lock()
+_last_ms = 0
+_counter = 0
+
+
+def uuid7() -> uuid.UUID:
+    """
+    UUID версии 7 (RFC 9562): 48 бит unix-времени в мс, затем 12-битный
+    счётчик внутри миллисекунды и 62 случайных бита.
+    Новые ключи растут со временем и ложатся в правый край B-tree индекса,
+    а не в случайную страницу, как uuid4. В пределах процесса значения
+    строго возрастают, даже если часы отстали.
+    """
+    global _last_ms, _counter
+    with _lock:
+        ms = time.time_ns() // 1_000_000
+        if ms > _last_ms:
+            # случайный старт счётчика, с запасом на рост внутри миллисекунды
+            _counter = int.from_bytes(os.urandom(2), "big") & 0x3FF
+        else:
+            ms = _last_ms
+            _counter += 1
+            if _counter > 0xFFF:
+                ms += 1
+                _counter = 0
+        _last_ms = ms
+        counter = _counter
+
+    rand_b = int.from_bytes(os.urandom(8), "big") & ((1 << 62) - 1)
+    value = (ms << 80) | (0x7 << 76) | (counter << 64) | (0b10 << 62) | rand_b
+    return uuid.UUID(int=value)
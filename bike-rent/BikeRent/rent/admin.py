@@ -1,3 +1,20 @@
 from django.contrib import admin
 
-# Register your models here.
+from rent.models import Rental
+
+
+@admin.register(Rental)
+class RentalAdmin(admin.ModelAdmin):
+    list_display = (
+        "id",
+        "user",
+        "bike",
+        "status",
+        "start_station",
+        "end_station",
+        "created_at",
+    )
+    list_filter = ("status",)
+    list_select_related = ("user", "bike", "start_station", "end_station")
+    raw_id_fields = ("user", "bike", "start_station", "end_station")
+    readonly_fields = ("finished_at", "created_at", "updated_at", "deleted_at")
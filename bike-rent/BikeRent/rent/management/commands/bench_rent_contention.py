@@ -0,0 +1,102 @@
+# rent/management/commands/bench_rent_contention.py
+import statistics
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.db.models import Q
+
+from bike.models import Bike, Station
+from rent.models import Rental
+from rent.services import NoBikeAvailable, start_rental
+
+User = get_user_model()
+
+
+class Command(BaseCommand):
+    help = (
+        "Fire concurrent reservation attempts at one station and check that "
+        "no bike is handed out twice (run against PostgreSQL)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--attempts", type=int, default=5000, help="Reservation attempts in total."
+        )
+        parser.add_argument(
+            "--threads", type=int, default=64, help="Concurrent workers."
+        )
+        parser.add_argument(
+            "--bikes", type=int, default=500, help="Free bikes at the station."
+        )
+        parser.add_argument("--riders", type=int, default=200, help="Distinct riders.")
+
+    def handle(self, *args, **opts):
+        station = self._prepare_station(opts["bikes"])
+        riders = self._prepare_riders(opts["riders"])
+
+        def attempt(number):
+            started = time.perf_counter()
+            try:
+                rental = start_rental(riders[number % len(riders)], station.pk)
+                result = rental.bike_id
+            except NoBikeAvailable:
+                result = None
+            finally:
+                connection.close()
+            return result, (time.perf_counter() - started) * 1000
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=opts["threads"]) as pool:
+            results = list(pool.map(attempt, range(opts["attempts"])))
+        elapsed = time.perf_counter() - started
+
+        bikes = [bike_id for bike_id, _ in results if bike_id is not None]
+        timings = sorted(ms for _, ms in results)
+        self.stdout.write(
+            f"{opts['attempts']} attempts in {elapsed:.2f} s "
+            f"({opts['attempts'] / elapsed:.0f}/s), {len(bikes)} reserved, "
+            f"median {statistics.median(timings):.1f} ms, "
+            f"p99 {timings[int(len(timings) * 0.99) - 1]:.1f} ms"
+        )
+
+        doubled = [bike_id for bike_id, n in Counter(bikes).items() if n > 1]
+        expected = min(opts["bikes"], opts["attempts"])
+        station.refresh_from_db()
+        if doubled:
+            raise CommandError(f"Bikes reserved twice: {doubled[:10]}")
+        if len(bikes) != expected:
+            raise CommandError(f"Expected {expected} reservations, got {len(bikes)}")
+        if station.available_count != opts["bikes"] - len(bikes):
+            raise CommandError(f"Station counter drifted: {station.available_count}")
+        self.stdout.write(self.style.SUCCESS("✅ No bike was reserved twice."))
+
+    # ---------------- utilities ----------------
+
+    def _prepare_station(self, bikes_n: int) -> Station:
+        station, _ = Station.objects.get_or_create(
+            name="Contention station",
+            defaults={"address": "Benchmark", "capacity": bikes_n},
+        )
+        Rental.objects.filter(
+            Q(start_station=station) | Q(bike__station=station)
+        ).delete()
+        station.bikes.all().delete()
+        for _ in range(bikes_n):
+            Bike.objects.create(
+                brand=Bike.Brand.TREK, colour=Bike.Colour.RED, station=station
+            )
+        station.refresh_from_db()
+        return station
+
+    def _prepare_riders(self, riders_n: int) -> list:
+        emails = [f"bench-rider-{i}@example.com" for i in range(riders_n)]
+        User.objects.bulk_create(
+            [User(email=email, password=make_password(None)) for email in emails],
+            ignore_conflicts=True,
+        )
+        return list(User.objects.filter(email__in=emails))
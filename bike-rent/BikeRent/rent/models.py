@@ -1,3 +1,50 @@
+from django.conf import settings
 from django.db import models
 
-# Create your models here.
+from common.models import BaseModel
+
+
+class Rental(BaseModel):
+    class Status(models.TextChoices):
+        ACTIVE = "active", "Активна"
+        FINISHED = "finished", "Завершена"
+
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL, on_delete=models.PROTECT, related_name="rentals"
+    )
+    bike = models.ForeignKey(
+        "bike.Bike", on_delete=models.PROTECT, related_name="rentals"
+    )
+    start_station = models.ForeignKey(
+        "bike.Station", on_delete=models.PROTECT, related_name="started_rentals"
+    )
+    end_station = models.ForeignKey(
+        "bike.Station",
+        on_delete=models.PROTECT,
+        related_name="finished_rentals",
+        blank=True,
+        null=True,
+    )
+    status = models.CharField(
+        max_length=20, choices=Status.choices, default=Status.ACTIVE
+    )
+    # начало аренды — created_at
+    finished_at = models.DateTimeField(blank=True, null=True)
+
+    class Meta:
+        verbose_name = "Rental"
+        verbose_name_plural = "Rentals"
+        constraints = [
+            # последняя линия обороны: один велосипед — одна активная аренда
+            models.UniqueConstraint(
+                fields=["bike"],
+                condition=models.Q(status="active"),
+                name="uniq_active_rental_per_bike",
+            )
+        ]
+        indexes = [
+            models.Index(fields=["user", "status"], name="rental_user_status_idx"),
+        ]
+
+    def __str__(self):
+        return f"Rental {self.pk} ({self.get_status_display()})"
@@ -0,0 +1,99 @@
+# rent/services.py
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+
+from bike.counters import CounterDeltas
+from bike.detail_cache import invalidate_bikes
+from bike.models import Bike, Station
+
+from .models import Rental
+
+# сколько раз пробуем другой велосипед, если кандидата увели между SELECT и UPDATE
+RESERVE_ATTEMPTS = 5
+
+
+class RentalError(Exception):
+    pass
+
+
+class NoBikeAvailable(RentalError):
+    pass
+
+
+def start_rental(user, station_id: int, bike_id: int | None = None) -> Rental:
+    """
+    Бронирует свободный велосипед на станции.
+    Кандидат выбирается через SELECT ... FOR UPDATE SKIP LOCKED (конкуренты
+    не ждут друг друга, а берут следующий велосипед), а закрепляется условным
+    UPDATE ... WHERE available — двое не получат один велосипед ни на какой БД.
+    Велосипеды с активной арендой (например, вручную сделанные доступными)
+    не предлагаются.
+    """
+    for _ in range(RESERVE_ATTEMPTS):
+        try:
+            with transaction.atomic():
+                candidates = Bike.objects.filter(
+                    station_id=station_id, available=True, deleted_at__isnull=True
+                ).exclude(rentals__status=Rental.Status.ACTIVE)
+                if bike_id is not None:
+                    candidates = candidates.filter(pk=bike_id)
+                bike = (
+                    candidates.select_for_update(skip_locked=True)
+                    .only("id", "station_id")
+                    .order_by("id")
+                    .first()
+                )
+                if bike is None:
+                    raise NoBikeAvailable("Нет свободных велосипедов")
+
+                reserved = Bike.objects.filter(pk=bike.pk, available=True).update(
+                    available=False, updated_at=timezone.now()
+                )
+                if not reserved:
+                    continue
+
+                # update() не шлёт сигналы — счётчик станции правим сами
+                deltas = CounterDeltas()
+                deltas.change(bike.station_id, available=-1)
+                deltas.apply()
+                invalidate_bikes([bike.pk])
+
+                return Rental.objects.create(
+                    user=user, bike_id=bike.pk, start_station_id=bike.station_id
+                )
+        except IntegrityError:
+            # у велосипеда успела появиться активная аренда (его вернули
+            # в доступные, например действием админки) — бронь откатилась,
+            # пробуем другой
+            continue
+
+    raise NoBikeAvailable("Не удалось забронировать велосипед, попробуйте ещё раз")
+
+
+def finish_rental(user, rental_id: int, station_id: int) -> Rental:
+    """Возвращает велосипед на станцию station_id и закрывает аренду"""
+    with transaction.atomic():
+        rental = (
+            Rental.objects.select_for_update()
+            .filter(pk=rental_id, user=user, status=Rental.Status.ACTIVE)
+            .first()
+        )
+        if rental is None:
+            raise RentalError("Активная аренда не найдена")
+        station = Station.objects.filter(pk=station_id).first()
+        if station is None:
+            raise RentalError("Станция не найдена")
+
+        # save() через сигналы переносит велосипед в счётчиках станций
+        bike = Bike.all_with_deleted.select_for_update().get(pk=rental.bike_id)
+        bike.station = station
+        bike.available = True
+        bike.save(update_fields=["station", "available", "updated_at"])
+
+        rental.status = Rental.Status.FINISHED
+        rental.end_station = station
+        rental.finished_at = timezone.now()
+        rental.save(
+            update_fields=["status", "end_station", "finished_at", "updated_at"]
+        )
+    return rental
@@ -1,3 +1,203 @@
-from django.test import TestCase
+import threading
+from unittest import mock
 
-# Create your tests here.
+from django.contrib.auth import get_user_model
+from django.db import IntegrityError, connections, transaction
+from django.test import Client, TestCase, TransactionTestCase, skipUnlessDBFeature
+from django.urls import reverse
+
+from bike.managers import BikeQuerySet
+from bike.models import Bike, Station
+
+from .models import Rental
+from .services import NoBikeAvailable, RentalError, finish_rental, start_rental
+
+User = get_user_model()
+
+
+def create_fleet(bikes: int):
+    station = Station.objects.create(name="Station", address="Street")
+    Bike.objects.bulk_create(
+        Bike(brand=Bike.Brand.TREK, colour=Bike.Colour.RED, station=station)
+        for _ in range(bikes)
+    )
+    Station.objects.filter(pk=station.pk).update(
+        total_count=bikes, available_count=bikes
+    )
+    return station
+
+
+class StartRentalTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.station = create_fleet(2)
+        cls.other_station = Station.objects.create(name="Other", address="Street 2")
+        cls.users = [
+            User.objects.create_user(email=f"rider{i}@example.com") for i in range(3)
+        ]
+
+    def test_each_bike_is_rented_once(self):
+        first = start_rental(self.users[0], self.station.pk)
+        second = start_rental(self.users[1], self.station.pk)
+        self.assertNotEqual(first.bike_id, second.bike_id)
+        with self.assertRaises(NoBikeAvailable):
+            start_rental(self.users[2], self.station.pk)
+
+        self.station.refresh_from_db()
+        self.assertEqual(
+            (self.station.total_count, self.station.available_count), (2, 0)
+        )
+
+    def test_specific_bike(self):
+        bike = Bike.objects.order_by("-id").first()
+        rental = start_rental(self.users[0], self.station.pk, bike.pk)
+        self.assertEqual(rental.bike_id, bike.pk)
+        with self.assertRaises(NoBikeAvailable):
+            start_rental(self.users[1], self.station.pk, bike.pk)
+
+    def test_candidate_taken_between_select_and_update(self):
+        real_first = BikeQuerySet.first
+        stolen = []
+
+        def first(queryset):
+            bike = real_first(queryset)
+            if bike is not None and not stolen:
+                # конкурент успел забрать кандидата до нашего условного UPDATE
+                Bike.objects.filter(pk=bike.pk).update(available=False)
+                stolen.append(bike.pk)
+            return bike
+
+        with mock.patch.object(BikeQuerySet, "first", first):
+            rental = start_rental(self.users[0], self.station.pk)
+        self.assertNotEqual(rental.bike_id, stolen[0])
+        self.assertEqual(Rental.objects.filter(status=Rental.Status.ACTIVE).count(), 1)
+
+    def test_one_active_rental_per_bike(self):
+        rental = start_rental(self.users[0], self.station.pk)
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            Rental.objects.create(
+                user=self.users[1], bike_id=rental.bike_id, start_station=self.station
+            )
+
+    def test_bike_with_active_rental_made_available(self):
+        rental = start_rental(self.users[0], self.station.pk)
+        # например, действие админки set_as_available
+        Bike.objects.filter(pk=rental.bike_id).update(available=True)
+
+        second = start_rental(self.users[1], self.station.pk)
+        self.assertNotEqual(second.bike_id, rental.bike_id)
+        with self.assertRaises(NoBikeAvailable):
+            start_rental(self.users[2], self.station.pk)
+
+    def test_integrity_error_is_retried(self):
+        create = Rental.objects.create
+        calls = []
+
+        def flaky_create(**kwargs):
+            calls.append(kwargs)
+            if len(calls) == 1:
+                raise IntegrityError("uniq_active_rental_per_bike")
+            return create(**kwargs)
+
+        with mock.patch.object(Rental.objects, "create", flaky_create):
+            rental = start_rental(self.users[0], self.station.pk)
+        self.assertEqual(len(calls), 2)
+        self.assertEqual(Rental.objects.filter(status=Rental.Status.ACTIVE).count(), 1)
+        # бронь первой попытки откатилась вместе со счётчиком
+        self.station.refresh_from_db()
+        self.assertEqual(self.station.available_count, 1)
+        self.assertEqual(Bike.objects.filter(available=False).get().pk, rental.bike_id)
+
+    def test_finish_returns_bike_to_station(self):
+        rental = start_rental(self.users[0], self.station.pk)
+        finish_rental(self.users[0], rental.pk, self.other_station.pk)
+
+        bike = Bike.objects.get(pk=rental.bike_id)
+        self.assertEqual(
+            (bike.station_id, bike.available), (self.other_station.pk, True)
+        )
+        self.station.refresh_from_db()
+        self.other_station.refresh_from_db()
+        for station in (self.station, self.other_station):
+            self.assertEqual((station.total_count, station.available_count), (1, 1))
+        # завершённая аренда не мешает новой на тот же велосипед
+        start_rental(self.users[1], self.other_station.pk, bike.pk)
+
+    def test_finish_someone_elses_rental(self):
+        rental = start_rental(self.users[0], self.station.pk)
+        with self.assertRaises(RentalError):
+            finish_rental(self.users[1], rental.pk, self.station.pk)
+
+
+class RentalViewTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.station = create_fleet(1)
+        cls.user = User.objects.create_user(email="rider@example.com")
+
+    def start(self):
+        return self.client.post(
+            reverse("rental-start"),
+            {"station_id": self.station.pk},
+            content_type="application/json",
+        )
+
+    def test_requires_login(self):
+        self.assertEqual(self.start().status_code, 401)
+
+    def test_csrf_is_enforced(self):
+        client = Client(enforce_csrf_checks=True)
+        client.force_login(self.user)
+        for url in (reverse("rental-start"), reverse("rental-finish", args=[1])):
+            with self.subTest(url=url):
+                response = client.post(
+                    url,
+                    {"station_id": self.station.pk},
+                    content_type="application/json",
+                )
+                self.assertEqual(response.status_code, 403)
+        self.assertFalse(Rental.objects.exists())
+
+    def test_conflict_when_station_is_empty(self):
+        self.client.force_login(self.user)
+        self.assertEqual(self.start().status_code, 201)
+        self.assertEqual(self.start().status_code, 409)
+
+
+@skipUnlessDBFeature("has_select_for_update_skip_locked")
+class ConcurrentRentalTests(TransactionTestCase):
+    """Настоящая гонка: потоки со своими соединениями бронируют одну станцию"""
+
+    bikes = 3
+    riders = 8
+
+    def test_no_double_booking(self):
+        station = create_fleet(self.bikes)
+        users = [
+            User.objects.create_user(email=f"rider{i}@example.com")
+            for i in range(self.riders)
+        ]
+        barrier = threading.Barrier(self.riders)
+        rented, refused = [], []
+
+        def rider(user):
+            try:
+                barrier.wait()
+                try:
+                    rented.append(start_rental(user, station.pk).bike_id)
+                except NoBikeAvailable:
+                    refused.append(user.pk)
+            finally:
+                connections.close_all()
+
+        threads = [threading.Thread(target=rider, args=(user,)) for user in users]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(rented), self.bikes)
+        self.assertEqual(len(set(rented)), self.bikes)
+        self.assertEqual(len(refused), self.riders - self.bikes)
+        station.refresh_from_db()
+        self.assertEqual(station.available_count, 0)
@@ -1 +1,8 @@
-urlpatterns = []
+from django.urls import path
+
+from rent.views import RentalFinishView, RentalStartView
+
+urlpatterns = [
+    path("start/", RentalStartView.as_view(), name="rental-start"),
+    path("<int:pk>/finish/", RentalFinishView.as_view(), name="rental-finish"),
+]
@@ -1,3 +1,63 @@
-from django.shortcuts import render
+import json
 
-# Create your views here.
+from django.http import HttpRequest, JsonResponse
+from django.views.generic.base import View
+
+from rent.models import Rental
+from rent.services import NoBikeAvailable, RentalError, finish_rental, start_rental
+
+
+def rental_to_dict(obj: Rental) -> dict:
+    return {
+        "id": obj.id,
+        "bike": obj.bike_id,
+        "status": obj.status,
+        "start_station": obj.start_station_id,
+        "end_station": obj.end_station_id,
+        "started_at": obj.created_at,
+        "finished_at": obj.finished_at,
+    }
+
+
+def read_station_id(request: HttpRequest):
+    data = json.loads(request.body)
+    return int(data["station_id"]), data
+
+
+# Авторизация по сессионной cookie, поэтому без csrf_exempt: клиенту нужен
+# заголовок X-CSRFToken из cookie csrftoken
+class RentalStartView(View):
+    # localhost:8000/rents/start/
+    def post(self, request: HttpRequest):
+        """Начать аренду: {"station_id": 1, "bike_id": 2 (необязательно)}"""
+        if not request.user.is_authenticated:
+            return JsonResponse({"error": "Требуется авторизация"}, status=401)
+        try:
+            station_id, data = read_station_id(request)
+            bike_id = int(data["bike_id"]) if data.get("bike_id") is not None else None
+        except (json.JSONDecodeError, KeyError, TypeError, ValueError):
+            return JsonResponse({"error": "Ожидается station_id"}, status=400)
+
+        try:
+            rental = start_rental(request.user, station_id, bike_id)
+        except NoBikeAvailable as e:
+            return JsonResponse({"error": str(e)}, status=409)
+        return JsonResponse(rental_to_dict(rental), status=201)
+
+
+class RentalFinishView(View):
+    # localhost:8000/rents/<pk>/finish/
+    def post(self, request: HttpRequest, pk: int):
+        """Завершить аренду: {"station_id": 1}"""
+        if not request.user.is_authenticated:
+            return JsonResponse({"error": "Требуется авторизация"}, status=401)
+        try:
+            station_id, _ = read_station_id(request)
+        except (json.JSONDecodeError, KeyError, TypeError, ValueError):
+            return JsonResponse({"error": "Ожидается station_id"}, status=400)
+
+        try:
+            rental = finish_rental(request.user, pk, station_id)
+        except RentalError as e:
+            return JsonResponse({"error": str(e)}, status=404)
+        return JsonResponse(rental_to_dict(rental), status=200)
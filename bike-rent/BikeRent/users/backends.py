@@ -0,0 +1,79 @@
+# users/backends.py
+import hashlib
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.contrib.auth.backends import ModelBackend
+from django.core.cache import cache
+from django.db import transaction
+
+from .user_cache import user_cache
+
+UserModel = get_user_model()
+
+
+def unknown_email_key(email: str) -> str:
+    digest = hashlib.sha256(email.lower().strip().encode()).hexdigest()
+    return f"users:auth:unknown:{digest}"
+
+
+def unknown_email_ttl() -> int:
+    return getattr(settings, "AUTH_UNKNOWN_EMAIL_TTL", 0)
+
+
+def forget_unknown_emails(emails, using=None):
+    """
+    Сбросить отрицательный кэш для emails, которые только что появились.
+    После коммита: попытка входа до него снова закэшировала бы "неизвестен".
+    """
+    keys = [unknown_email_key(email) for email in emails]
+    if keys and unknown_email_ttl() > 0:
+        transaction.on_commit(lambda: cache.delete_many(keys), using=using)
+
+
+class EmailBackend(ModelBackend):
+    """
+    Вход по email без учёта регистра (через индекс по Lower(email)).
+    Несуществующие email запоминаются на AUTH_UNKNOWN_EMAIL_TTL секунд,
+    чтобы перебор по чужим базам логинов не ходил в БД на каждую попытку.
+    Нужен общий для всех процессов кэш (Redis/Memcached): сброс записи после
+    регистрации иначе виден только в одном процессе.
+    """
+
+    def authenticate(self, request, username=None, password=None, **kwargs):
+        if username is None:
+            username = kwargs.get(UserModel.USERNAME_FIELD)
+        if username is None or password is None:
+            return None
+
+        ttl = unknown_email_ttl()
+        key = unknown_email_key(username)
+        if ttl > 0 and cache.get(key):
+            # как и ModelBackend: хэшируем впустую, чтобы время ответа
+            # не выдавало, есть ли такой пользователь
+            UserModel().set_password(password)
+            return None
+
+        try:
+            user = UserModel._default_manager.get_by_natural_key(username)
+        except UserModel.DoesNotExist:
+            if ttl > 0:
+                cache.set(key, True, ttl)
+            UserModel().set_password(password)
+            return None
+
+        if user.check_password(password) and self.user_can_authenticate(user):
+            return user
+        return None
+
+    def get_user(self, user_id):
+        # пользователь сессии и его профиль — из LRU процесса или одним запросом
+        user = user_cache.get(user_id)
+        if user is None:
+            version = user_cache.version
+            try:
+                user = UserModel._default_manager.with_profile().get(pk=user_id)
+            except UserModel.DoesNotExist:
+                return None
+            user_cache.put(user, version)
+        return user if self.user_can_authenticate(user) else None
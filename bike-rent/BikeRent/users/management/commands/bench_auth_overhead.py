@@ -0,0 +1,99 @@
+# users/management/commands/bench_auth_overhead.py
+import statistics
+import time
+
+from django.conf import settings
+from django.contrib.auth import login
+from django.contrib.auth.middleware import AuthenticationMiddleware
+from django.contrib.sessions.middleware import SessionMiddleware
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.http import HttpResponse
+from django.test import RequestFactory, override_settings
+from django.test.utils import CaptureQueriesContext
+
+from users.models import User
+from users.user_cache import user_cache
+
+ENGINES = ("db", "cached_db", "cache", "signed_cookies")
+
+
+class Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure what session loading plus request.user costs per request "
+        "(SQL queries and time) for every session engine, with and without "
+        "the per-process user LRU."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--requests", type=int, default=200, help="Requests per measurement."
+        )
+
+    def handle(self, *args, **opts):
+        self.factory = RequestFactory()
+        self.stdout.write(
+            f"{'engine':<16} {'user LRU':>8} {'queries/req':>12} {'median, ms':>11}"
+        )
+        # временный пользователь и сессии в БД не переживают бенчмарк
+        try:
+            with transaction.atomic():
+                user = User.objects.create_user(email="auth-bench@example.invalid")
+                for engine in ENGINES:
+                    for lru_size in (0, settings.AUTH_USER_CACHE_SIZE or 1024):
+                        with override_settings(
+                            SESSION_ENGINE=f"django.contrib.sessions.backends.{engine}",
+                            AUTH_USER_CACHE_SIZE=lru_size,
+                        ):
+                            queries, ms = self._measure(user, opts["requests"])
+                        self.stdout.write(
+                            f"{engine:<16} {'on' if lru_size else 'off':>8} "
+                            f"{queries:>12.2f} {ms:>11.3f}"
+                        )
+                raise Rollback
+        except Rollback:
+            pass
+        user_cache.clear()
+        self.stdout.write(self.style.SUCCESS("✅ Benchmark finished"))
+
+    # ---------------- utilities ----------------
+
+    def _middleware(self):
+        def view(request):
+            request.user.is_authenticated  # AuthenticationMiddleware ленивый
+            return HttpResponse()
+
+        return SessionMiddleware(AuthenticationMiddleware(view))
+
+    def _session_cookie(self, user) -> str:
+        request = self.factory.get("/")
+        response = SessionMiddleware(lambda r: (login(r, user), HttpResponse())[1])(
+            request
+        )
+        return response.cookies[settings.SESSION_COOKIE_NAME].value
+
+    def _measure(self, user, requests: int) -> tuple[float, float]:
+        user_cache.clear()
+        cookie = self._session_cookie(user)
+        handler = self._middleware()
+        # первый запрос наполняет кэш сессий/пользователей, как у живого клиента
+        handler(self._request(cookie))
+
+        timings = []
+        with CaptureQueriesContext(connection) as ctx:
+            for _ in range(requests):
+                request = self._request(cookie)
+                started = time.perf_counter()
+                handler(request)
+                timings.append((time.perf_counter() - started) * 1000)
+                assert request.user.pk == user.pk
+        return len(ctx.captured_queries) / requests, statistics.median(timings)
+
+    def _request(self, cookie: str):
+        request = self.factory.get("/")
+        request.COOKIES[settings.SESSION_COOKIE_NAME] = cookie
+        return request
@@ -0,0 +1,145 @@
+# users/management/commands/bench_email_login.py
+import json
+import random
+import statistics
+import time
+
+from django.conf import settings
+from django.contrib.auth import authenticate
+from django.contrib.auth.hashers import make_password
+from django.core.cache import cache
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.db.models.functions import Lower
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+
+from users.backends import unknown_email_key
+from users.models import User
+
+BENCH_DOMAIN = "bench.example"
+
+
+class Command(BaseCommand):
+    help = (
+        "Seed N bench users and compare email lookups: exact email=, "
+        "email__iexact and Lower(email) (get_by_natural_key), plus login "
+        "attempts for unknown emails with and without the negative cache."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--users",
+            type=int,
+            default=5_000_000,
+            help="How many bench users the table should hold.",
+        )
+        parser.add_argument(
+            "--lookups", type=int, default=200, help="Lookups per measurement."
+        )
+        parser.add_argument(
+            "--logins",
+            type=int,
+            default=20,
+            help="Login attempts per measurement (each one pays a full password hash).",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=10_000,
+            help="bulk_create batch size for seeding.",
+        )
+
+    def handle(self, *args, **opts):
+        self._seed(opts["users"], opts["batch_size"])
+        total = User.objects.filter(email__endswith=f"@{BENCH_DOMAIN}").count()
+        # регистр как у людей, которые логинятся с телефона
+        emails = [
+            f"Rider{random.randrange(total)}@Bench.Example"
+            for _ in range(opts["lookups"])
+        ]
+        unknown = [f"Nobody{i}@Bench.Example" for i in range(opts["logins"])]
+
+        self.stdout.write(f"{'lookup':<28} {'median, ms':>10} {'found':>7}")
+        lookups = [
+            ("email= (old default)", lambda e: User.objects.filter(email=e).first()),
+            ("email__iexact", lambda e: User.objects.filter(email__iexact=e).first()),
+            ("Lower(email) natural key", self._natural_key),
+        ]
+        for title, lookup in lookups:
+            ms, found = self._measure(lookup, emails)
+            self.stdout.write(f"{title:<28} {ms:>10.3f} {found:>7}")
+
+        if connection.vendor == "postgresql":
+            self._explain(emails[0])
+
+        # вход с неизвестным email: первая попытка идёт в БД, повторные — нет.
+        # Время почти целиком — хэш пароля, его backend считает в обоих случаях
+        cache.delete_many([unknown_email_key(e) for e in unknown])
+        # без CACHE_URL отрицательный кэш выключен — на время замера включаем
+        with override_settings(
+            AUTH_UNKNOWN_EMAIL_TTL=settings.AUTH_UNKNOWN_EMAIL_TTL or 30
+        ):
+            for title in ("unknown email, cold", "unknown email, cached"):
+                with CaptureQueriesContext(connection) as ctx:
+                    ms, _ = self._measure(
+                        lambda e: authenticate(email=e, password="x"), unknown
+                    )
+                self.stdout.write(
+                    f"{title:<28} {ms:>10.3f}   queries: {len(ctx.captured_queries)}"
+                )
+
+        self.stdout.write(self.style.SUCCESS("✅ Benchmark finished"))
+
+    # ---------------- utilities ----------------
+
+    def _natural_key(self, email):
+        try:
+            return User.objects.get_by_natural_key(email)
+        except User.DoesNotExist:
+            return None
+
+    def _measure(self, lookup, emails) -> tuple[float, int]:
+        timings, found = [], 0
+        for email in emails:
+            started = time.perf_counter()
+            found += lookup(email) is not None
+            timings.append((time.perf_counter() - started) * 1000)
+        return statistics.median(timings), found
+
+    def _explain(self, email):
+        for title, qs in (
+            ("email__iexact", User.objects.filter(email__iexact=email)),
+            (
+                "Lower(email)",
+                User.objects.alias(e=Lower("email")).filter(e=email.lower()),
+            ),
+        ):
+            sql, params = qs.query.sql_with_params()
+            with connection.cursor() as cursor:
+                cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+                plan = cursor.fetchone()[0]
+            if isinstance(plan, str):
+                plan = json.loads(plan)
+            root = plan[0]["Plan"]
+            node = (
+                root.get("Plans", [root])[0] if root["Node Type"] == "Limit" else root
+            )
+            self.stdout.write(
+                f"  plan {title}: {node['Node Type']} {node.get('Index Name', '')}"
+            )
+
+    def _seed(self, total: int, batch_size: int):
+        existing = User.objects.filter(email__endswith=f"@{BENCH_DOMAIN}").count()
+        if existing >= total:
+            return
+        self.stdout.write(f"Seeding {total - existing} users...")
+        # одна непригодная строка пароля на всех — без хэширования на строку
+        password = make_password(None)
+        for start in range(existing, total, batch_size):
+            User.objects.bulk_create(
+                [
+                    User(email=f"rider{i}@{BENCH_DOMAIN}", password=password)
+                    for i in range(start, min(start + batch_size, total))
+                ]
+            )
@@ -0,0 +1,57 @@
+# users/management/commands/provision_users.py
+import csv
+import sys
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from users.provisioning import PROVISION_BATCH_SIZE, provision_users
+
+
+class Command(BaseCommand):
+    help = (
+        "Bulk-create users from a CSV with the columns "
+        "email, first_name, last_name, password. password must be a Django "
+        "password hash; rows without it get an unusable password."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("csv_path", help="CSV file, '-' for stdin.")
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=PROVISION_BATCH_SIZE,
+            help="Users per bulk_create / transaction.",
+        )
+        parser.add_argument(
+            "--show-rejected",
+            type=int,
+            default=20,
+            help="How many rejected rows to print.",
+        )
+
+    def handle(self, *args, **opts):
+        started = time.perf_counter()
+        if opts["csv_path"] == "-":
+            result = provision_users(csv.DictReader(sys.stdin), opts["batch_size"])
+        else:
+            try:
+                with open(opts["csv_path"], newline="", encoding="utf-8") as f:
+                    result = provision_users(csv.DictReader(f), opts["batch_size"])
+            except OSError as e:
+                raise CommandError(str(e))
+        elapsed = time.perf_counter() - started
+
+        for line, reason in result.rejected[: opts["show_rejected"]]:
+            # +1: первая строка CSV — заголовок
+            self.stderr.write(f"line {line + 1}: {reason}")
+        self.stdout.write(
+            f"existing: {result.existing}, duplicates in file: {result.duplicates}, "
+            f"rejected: {len(result.rejected)}"
+        )
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"✅ Created {result.created} users in {elapsed:.1f}s "
+                f"({result.created / elapsed if elapsed else 0:.0f}/s)"
+            )
+        )
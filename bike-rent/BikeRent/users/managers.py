@@ -1,11 +1,38 @@
 # users/managers.py
 from django.contrib.auth.base_user import BaseUserManager
+from django.db import models
+from django.db.models.functions import Lower
 from django.utils.translation import gettext_lazy as _
 
 
-class UserManager(BaseUserManager):
+class UserQuerySet(models.QuerySet):
+    def update(self, **kwargs):
+        """
+        update() не шлёт сигналы, поэтому LRU пользователей процесса
+        (users/user_cache.py) сбрасываем здесь же — иначе, например,
+        filter(...).update(is_active=False) оставляет пользователя
+        залогиненным до истечения AUTH_USER_CACHE_TTL.
+        Какие строки задело, не выясняем (лишний SELECT и все pk в памяти
+        до коммита) — кэш процесса небольшой, сбрасываем его целиком.
+        """
+        from .user_cache import user_cache
+
+        rows = super().update(**kwargs)
+        user_cache.invalidate_all_on_commit(using=self.db)
+        return rows
+
+
+class UserManager(BaseUserManager.from_queryset(UserQuerySet)):
     use_in_migrations = True
 
+    def with_profile(self):
+        # LEFT JOIN профиля: user.locale / user.tz потом не ходят в БД
+        return self.get_queryset().select_related("profile")
+
+    def get_by_natural_key(self, email):
+        # LOWER(email) = ... — попадает в функциональный индекс uniq_user_email_ci
+        return self.alias(email_ci=Lower("email")).get(email_ci=email.lower().strip())
+
     def _create_user(self, email, password, **extra_fields):
         if not email:
             raise ValueError(_("Email must be set"))
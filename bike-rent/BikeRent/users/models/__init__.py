@@ -1,5 +1,7 @@
+from .profile import Profile
 from .user import User
 
 __all__ = [
+    "Profile",
     "User",
 ]
@@ -1,12 +1,12 @@
 # users/models/profile.py
-import uuid
-
 from django.conf import settings
 from django.db import models
 
+from common.uuids import uuid7
+
 
 class Profile(models.Model):
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     user = models.OneToOneField(
         settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="profile"
     )
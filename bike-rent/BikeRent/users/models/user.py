@@ -1,11 +1,12 @@
-import uuid
-
+from django.conf import settings
 from django.contrib.auth.models import AbstractBaseUser, PermissionsMixin
 from django.db import models
 from django.db.models.functions import Lower
 from django.utils import timezone
 
+from common.uuids import uuid7
 from users.managers import UserManager
+from users.models.profile import Profile
 
 
 class User(AbstractBaseUser, PermissionsMixin):
@@ -16,7 +17,7 @@ class User(AbstractBaseUser, PermissionsMixin):
     - безопасное "удаление" через is_active
     """
 
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
 
     email = models.EmailField("Email", unique=True)
     first_name = models.CharField("Имя", max_length=150, blank=True)
@@ -46,3 +47,33 @@ class User(AbstractBaseUser, PermissionsMixin):
 
     def __str__(self):
         return self.email
+
+    # Профиль создаётся лениво: у большинства пользователей его нет,
+    # и чтение locale/tz отдаёт значения по умолчанию.
+
+    @property
+    def profile_or_none(self):
+        """Профиль или None; загруженный через with_profile() — без запроса"""
+        related = type(self).profile.related
+        if not related.is_cached(self):
+            related.set_cached_value(self, Profile.objects.filter(user=self).first())
+        return related.get_cached_value(self)
+
+    def ensure_profile(self):
+        """Профиль для записи; создаётся при первом обращении"""
+        profile = self.profile_or_none
+        if profile is None:
+            # OneToOne уникален: при гонке get_or_create перечитает чужую строку
+            profile, _ = Profile.objects.get_or_create(user=self)
+            type(self).profile.related.set_cached_value(self, profile)
+        return profile
+
+    @property
+    def locale(self) -> str:
+        profile = self.profile_or_none
+        return (profile and profile.locale) or settings.LANGUAGE_CODE
+
+    @property
+    def tz(self) -> str:
+        profile = self.profile_or_none
+        return (profile and profile.tz) or settings.TIME_ZONE
@@ -0,0 +1,117 @@
+# users/provisioning.py
+from dataclasses import dataclass, field
+from itertools import islice
+
+from django.contrib.auth.hashers import identify_hasher, make_password
+from django.core.exceptions import ValidationError
+from django.core.validators import validate_email
+from django.db import transaction
+from django.db.models.functions import Lower
+
+from .backends import forget_unknown_emails
+from .models.user import User
+
+PROVISION_BATCH_SIZE = 1000
+
+
+@dataclass
+class ProvisionResult:
+    created: int = 0
+    # email уже есть в базе (без учёта регистра)
+    existing: int = 0
+    # email повторяется во входных данных
+    duplicates: int = 0
+    # (номер строки, причина)
+    rejected: list = field(default_factory=list)
+
+
+def normalize_email(email: str) -> str:
+    """То же, что делает сигнал normalize_email, но без сохранения модели"""
+    return (email or "").lower().strip()
+
+
+def provision_users(rows, batch_size: int = PROVISION_BATCH_SIZE) -> ProvisionResult:
+    """
+    Массовое создание пользователей из словарей
+    {"email", "first_name", "last_name", "password"}.
+    password — готовый хэш (make_password/другой Django-хэшер); без него
+    пароль непригоден для входа. Хэширование и сигналы User не запускаются,
+    профили создаются позже, при первой записи (User.ensure_profile).
+    Каждая пачка — одна транзакция.
+    """
+    result = ProvisionResult()
+    seen = set()
+    rows = iter(enumerate(rows, start=1))
+    while batch := list(islice(rows, batch_size)):
+        users = []
+        for line, row in batch:
+            user = _build_user(line, row, result)
+            if user is None:
+                continue
+            if user.email in seen:
+                result.duplicates += 1
+                continue
+            seen.add(user.email)
+            users.append(user)
+        result.created += _insert_batch(users, result)
+    return result
+
+
+def _build_user(line: int, row: dict, result: ProvisionResult) -> User | None:
+    email = normalize_email(row.get("email"))
+    try:
+        validate_email(email)
+    except ValidationError:
+        result.rejected.append((line, "Некорректный email"))
+        return None
+
+    password = row.get("password")
+    if password:
+        try:
+            identify_hasher(password)
+        except ValueError:
+            result.rejected.append((line, "Пароль должен быть хэшем Django"))
+            return None
+    else:
+        password = make_password(None)
+
+    return User(
+        email=email,
+        first_name=row.get("first_name") or "",
+        last_name=row.get("last_name") or "",
+        password=password,
+    )
+
+
+def _existing_emails(emails: list) -> set:
+    # один запрос по Lower(email) — тот же индекс, что у uniq_user_email_ci
+    return set(
+        User.objects.annotate(email_ci=Lower("email"))
+        .filter(email_ci__in=emails)
+        .values_list("email_ci", flat=True)
+    )
+
+
+def _insert_batch(users: list, result: ProvisionResult) -> int:
+    if not users:
+        return 0
+    existing = _existing_emails([user.email for user in users])
+    new_users = [user for user in users if user.email not in existing]
+    if not new_users:
+        result.existing += len(users)
+        return 0
+
+    with transaction.atomic():
+        # email могли занять между проверкой и вставкой (регистрация рядом):
+        # такие строки пропускает ON CONFLICT DO NOTHING, а не IntegrityError
+        # на всю команду; что реально вставилось — смотрим по pk (uuid7 из Python)
+        User.objects.bulk_create(new_users, ignore_conflicts=True)
+        inserted = list(
+            User.objects.filter(pk__in=[user.pk for user in new_users]).values_list(
+                "email", flat=True
+            )
+        )
+        # сигналов нет — отрицательный кэш входа сбрасываем сами (после коммита)
+        forget_unknown_emails(inserted)
+    result.existing += len(users) - len(inserted)
+    return len(inserted)
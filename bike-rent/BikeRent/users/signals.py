@@ -1,18 +1,37 @@
 # users/signals.py
-from django.db.models.signals import post_save, pre_save
+from django.db.models.signals import post_delete, post_save, pre_save
 from django.dispatch import receiver
 
-from .models.profile import Profile
-from .models.user import User
+from .backends import forget_unknown_emails
+from .models import Profile, User
+from .user_cache import user_cache
 
 
 @receiver(post_save, sender=User)
-def create_profile_on_user_create(sender, instance: User, created: bool, **kwargs):
-    if created:
-        Profile.objects.create(user=instance)
+def forget_unknown_email_on_save(
+    sender, instance: User, created: bool, update_fields, using, **kwargs
+):
+    # новый пользователь или сменённый email не должны упираться в "неизвестен"
+    if created or update_fields is None or "email" in update_fields:
+        forget_unknown_emails([instance.email], using=using)
 
 
 @receiver(pre_save, sender=User)
 def normalize_email(sender, instance: User, **kwargs):
     if instance.email:
         instance.email = instance.email.lower().strip()
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def invalidate_cached_user(sender, instance: User, using, **kwargs):
+    # смена пароля, деактивация и любое другое сохранение
+    user_cache.invalidate_on_commit([instance.pk], using=using)
+
+
+@receiver(post_save, sender=Profile)
+@receiver(post_delete, sender=Profile)
+def invalidate_cached_user_on_profile_change(
+    sender, instance: Profile, using, **kwargs
+):
+    user_cache.invalidate_on_commit([instance.user_id], using=using)
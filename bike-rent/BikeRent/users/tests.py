@@ -1,3 +1,208 @@
-from django.test import TestCase
+from unittest import mock
 
-# Create your tests here.
+from django.conf import settings
+from django.contrib.auth import authenticate, get_user_model
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from .backends import unknown_email_key
+from .models import Profile
+from .provisioning import provision_users
+from .user_cache import user_cache
+
+User = get_user_model()
+
+
+@override_settings(AUTH_USER_CACHE_SIZE=16, AUTH_USER_CACHE_TTL=60)
+class UserCacheInvalidationTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
+            email="rider@example.com", password="secret-pass", is_staff=True
+        )
+
+    def setUp(self):
+        user_cache.clear()
+        self.addCleanup(user_cache.clear)
+
+    def cache_user(self):
+        user_cache.put(User.objects.get(pk=self.user.pk))
+        self.assertIsNotNone(user_cache.get(self.user.pk))
+
+    def test_save_invalidates_after_commit(self):
+        self.cache_user()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.first_name = "Ann"
+            self.user.save()
+            # до коммита в кэше остаётся последнее закоммиченное состояние
+            self.assertIsNotNone(user_cache.get(self.user.pk))
+        self.assertIsNone(user_cache.get(self.user.pk))
+
+    def test_profile_change_invalidates_user(self):
+        self.cache_user()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.ensure_profile()
+        self.assertIsNone(user_cache.get(self.user.pk))
+
+    def test_queryset_update_invalidates(self):
+        self.cache_user()
+        with self.captureOnCommitCallbacks(execute=True):
+            User.objects.filter(pk=self.user.pk).update(is_active=False)
+        self.assertIsNone(user_cache.get(self.user.pk))
+
+    def test_queryset_update_does_not_select_rows(self):
+        self.cache_user()
+        with self.captureOnCommitCallbacks(execute=True):
+            with self.assertNumQueries(1):
+                User.objects.filter(is_staff=True).update(first_name="Ann")
+        self.assertIsNone(user_cache.get(self.user.pk))
+
+    def test_queryset_update_rejects_rows_read_before_commit(self):
+        version = user_cache.version
+        stale = User.objects.get(pk=self.user.pk)
+        with self.captureOnCommitCallbacks(execute=True):
+            User.objects.filter(pk=self.user.pk).update(is_active=False)
+        user_cache.put(stale, version)
+        self.assertIsNone(user_cache.get(self.user.pk))
+
+    def test_row_read_before_invalidation_is_not_cached(self):
+        version = user_cache.version
+        stale = User.objects.get(pk=self.user.pk)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.save()
+        user_cache.put(stale, version)
+        self.assertIsNone(user_cache.get(self.user.pk))
+
+    def test_deactivated_user_is_logged_out(self):
+        self.client.force_login(self.user)
+        url = reverse("admin:index")
+        self.assertEqual(self.client.get(url).status_code, 200)
+        self.assertIsNotNone(user_cache.get(self.user.pk))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            User.objects.filter(pk=self.user.pk).update(is_active=False)
+        self.assertEqual(self.client.get(url).status_code, 302)
+
+
+@override_settings(AUTH_UNKNOWN_EMAIL_TTL=30)
+class EmailLoginTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
+            email="Rider@Example.com", password="secret-pass"
+        )
+
+    def setUp(self):
+        cache.clear()
+
+    def test_email_is_normalized_on_save(self):
+        self.assertEqual(self.user.email, "rider@example.com")
+
+    def test_login_ignores_email_case(self):
+        user = authenticate(email="RIDER@example.COM", password="secret-pass")
+        self.assertEqual(user, self.user)
+        self.assertEqual(
+            User.objects.get_by_natural_key(" Rider@EXAMPLE.com "), self.user
+        )
+
+    def test_wrong_password(self):
+        self.assertIsNone(authenticate(email="rider@example.com", password="wrong"))
+
+    def test_unknown_email_is_cached(self):
+        self.assertIsNone(authenticate(email="nobody@example.com", password="x"))
+        with self.assertNumQueries(0):
+            self.assertIsNone(authenticate(email="Nobody@example.com", password="x"))
+
+    @override_settings(AUTH_UNKNOWN_EMAIL_TTL=0)
+    def test_negative_cache_disabled(self):
+        authenticate(email="nobody@example.com", password="x")
+        with self.assertNumQueries(1):
+            authenticate(email="nobody@example.com", password="x")
+
+    def test_signup_forgets_unknown_email_after_commit(self):
+        self.assertIsNone(authenticate(email="new@example.com", password="secret-pass"))
+        with self.captureOnCommitCallbacks(execute=True):
+            User.objects.create_user(email="new@example.com", password="secret-pass")
+            # до коммита запись "неизвестен" ещё на месте
+            self.assertTrue(cache.get(unknown_email_key("new@example.com")))
+        self.assertIsNotNone(
+            authenticate(email="new@example.com", password="secret-pass")
+        )
+
+    def test_provisioned_users_are_forgotten(self):
+        self.assertIsNone(authenticate(email="bulk@example.com", password="x"))
+        with self.captureOnCommitCallbacks(execute=True):
+            result = provision_users([{"email": "bulk@example.com"}])
+        self.assertEqual(result.created, 1)
+        self.assertIsNone(cache.get(unknown_email_key("bulk@example.com")))
+
+
+class ProvisionUsersTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        User.objects.create_user(email="taken@example.com")
+
+    def test_counts(self):
+        result = provision_users(
+            [
+                {"email": "New@Example.com", "first_name": "Ann"},
+                {"email": "new@example.com"},
+                {"email": "TAKEN@example.com"},
+                {"email": "not-an-email"},
+                {"email": "hash@example.com", "password": "plain-text"},
+            ],
+            batch_size=2,
+        )
+        self.assertEqual(
+            (result.created, result.existing, result.duplicates), (1, 1, 1)
+        )
+        self.assertEqual([line for line, _ in result.rejected], [4, 5])
+        user = User.objects.get(email="new@example.com")
+        self.assertFalse(user.has_usable_password())
+
+    def test_email_taken_between_lookup_and_insert(self):
+        # как будто регистрация вставила строку сразу после проверки
+        with mock.patch("users.provisioning._existing_emails", return_value=set()):
+            result = provision_users(
+                [{"email": "taken@example.com"}, {"email": "fresh@example.com"}]
+            )
+        self.assertEqual((result.created, result.existing), (1, 1))
+        self.assertTrue(User.objects.filter(email="fresh@example.com").exists())
+
+
+class LazyProfileTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(email="rider@example.com")
+
+    def test_signup_creates_no_profile(self):
+        self.assertFalse(Profile.objects.filter(user=self.user).exists())
+
+    @override_settings(LANGUAGE_CODE="ru", TIME_ZONE="Europe/Minsk")
+    def test_defaults_without_profile(self):
+        user = User.objects.get(pk=self.user.pk)
+        with self.assertNumQueries(1):
+            self.assertEqual((user.locale, user.tz), ("ru", "Europe/Minsk"))
+            self.assertIsNone(user.profile_or_none)
+
+    def test_ensure_profile_creates_once(self):
+        profile = self.user.ensure_profile()
+        profile.locale = "de"
+        profile.save()
+        self.assertEqual(self.user.ensure_profile(), profile)
+        self.assertEqual(Profile.objects.filter(user=self.user).count(), 1)
+        self.assertEqual(User.objects.get(pk=self.user.pk).locale, "de")
+
+    def test_with_profile_loads_in_one_query(self):
+        self.user.ensure_profile()
+        with self.assertNumQueries(1):
+            user = User.objects.with_profile().get(pk=self.user.pk)
+            # пустые поля профиля — значения по умолчанию
+            self.assertEqual(
+                (user.locale, user.tz), (settings.LANGUAGE_CODE, settings.TIME_ZONE)
+            )
+        without = User.objects.create_user(email="other@example.com")
+        with self.assertNumQueries(1):
+            user = User.objects.with_profile().get(pk=without.pk)
+            self.assertIsNone(user.profile_or_none)
@@ -0,0 +1,99 @@
+# users/user_cache.py
+import pickle
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+from django.db import transaction
+
+
+class UserCache:
+    """
+    LRU недавно аутентифицированных пользователей текущего процесса:
+    pk -> (истекает, pickle пользователя вместе с профилем).
+    Каждый запрос получает свою копию, общий экземпляр между потоками не ходит.
+    Записи этого процесса сбрасываются после коммита сигналами (users/signals.py)
+    и UserQuerySet.update(); изменения из других процессов и сырой SQL
+    видны не позже чем через TTL.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+        # растёт на каждом сбросе: put() со старой версией — строка прочитана
+        # до коммита изменения и в кэш не попадает
+        self.version = 0
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def maxsize(self) -> int:
+        return getattr(settings, "AUTH_USER_CACHE_SIZE", 1024)
+
+    @property
+    def ttl(self) -> float:
+        return getattr(settings, "AUTH_USER_CACHE_TTL", 30)
+
+    def get(self, pk):
+        if self.maxsize <= 0:
+            return None
+        key = str(pk)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] < time.monotonic():
+                self._entries.pop(key, None)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            data = entry[1]
+        return pickle.loads(data)
+
+    def put(self, user, version: int | None = None):
+        """version — значение self.version до чтения user из БД"""
+        if self.maxsize <= 0:
+            return
+        data = pickle.dumps(user)
+        with self._lock:
+            if version is not None and version != self.version:
+                return
+            self._entries[str(user.pk)] = (time.monotonic() + self.ttl, data)
+            self._entries.move_to_end(str(user.pk))
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, pk):
+        with self._lock:
+            self._entries.pop(str(pk), None)
+            self.version += 1
+
+    def invalidate_on_commit(self, pks, using=None):
+        """
+        Сброс после коммита: до него другие запросы всё равно читают старую
+        строку, а сброс раньше коммита они бы тут же перезаписали старой.
+        """
+        pks = list(pks)
+
+        def invalidate():
+            for pk in pks:
+                self.invalidate(pk)
+
+        transaction.on_commit(invalidate, using=using)
+
+    def invalidate_all(self):
+        """Сбросить все записи; счётчики попаданий не трогаем"""
+        with self._lock:
+            self._entries.clear()
+            self.version += 1
+
+    def invalidate_all_on_commit(self, using=None):
+        transaction.on_commit(self.invalidate_all, using=using)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+
+
+user_cache = UserCache()